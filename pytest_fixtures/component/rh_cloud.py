@@ -3,10 +3,10 @@ import pytest
 
 from robottelo.config import settings
 from robottelo.constants import CAPSULE_REGISTRATION_OPTS
-from robottelo.hosts import SatelliteHostError
+from robottelo.hosts import HostFanout, SatelliteHostError
 
 
-def enable_insights(host, satellite, org, activation_key):
+def configure_insights(host, satellite, org, activation_key):
     """Configure remote execution and insights-client on a host"""
     host.configure_rex(satellite=satellite, org=org, register=False)
     host.configure_insights_client(
@@ -15,12 +15,21 @@ def enable_insights(host, satellite, org, activation_key):
         org=org,
         rhel_distro=f"rhel{host.os_version.major}",
     )
-    # Sync inventory if using hosted Insights
+
+
+def sync_inventory(satellite, org):
+    """Sync the inventory of the hosts of ``org`` if using hosted Insights"""
     if not satellite.local_advisor_enabled:
         satellite.generate_inventory_report(org)
         satellite.sync_inventory_status(org)
 
 
+def enable_insights(host, satellite, org, activation_key):
+    """Configure remote execution and insights-client on a host, and sync the inventory"""
+    configure_insights(host, satellite, org, activation_key)
+    sync_inventory(satellite, org)
+
+
 @pytest.fixture(scope='module')
 def module_target_sat_insights(request, module_target_sat, satellite_factory):
     """A module-level fixture to provide a Satellite configured for Insights.
@@ -104,14 +113,18 @@ def rhcloud_registered_hosts(
     rhcloud_activation_key, rhcloud_manifest_org, mod_content_hosts, module_target_sat_insights
 ):
     """Fixture that registers content hosts to Satellite and Insights."""
-    for vm in mod_content_hosts:
+
+    def register(vm):
         vm.configure_insights_client(
             satellite=module_target_sat_insights,
             activation_key=rhcloud_activation_key,
             org=rhcloud_manifest_org,
             rhel_distro=f"rhel{vm.os_version.major}",
         )
-        assert vm.subscribed
+        return vm.subscribed
+
+    subscribed = HostFanout(mod_content_hosts).map(register, raise_on_error=True)
+    assert all(subscribed.values())
     return mod_content_hosts
 
 
@@ -137,10 +150,14 @@ def rhel_insights_vms(
     content_hosts,
 ):
     """A function-level fixture to create rhel content hosts registered with insights."""
-    for content_host in content_hosts:
-        enable_insights(
-            content_host, module_target_sat_insights, rhcloud_manifest_org, rhcloud_activation_key
-        )
+    HostFanout(content_hosts).map(
+        configure_insights,
+        module_target_sat_insights,
+        rhcloud_manifest_org,
+        rhcloud_activation_key,
+        raise_on_error=True,
+    )
+    sync_inventory(module_target_sat_insights, rhcloud_manifest_org)
     return content_hosts
 
 
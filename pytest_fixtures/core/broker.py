@@ -4,16 +4,16 @@ from box import Box
 from broker import Broker
 import pytest
 
-from robottelo.config import settings
+from robottelo.config import get_server_hostname, settings
 from robottelo.hosts import ContentHostError, Satellite, lru_sat_ready_rhel
 
 
 @pytest.fixture(scope='session')
 def _default_sat(align_to_satellite):
     """Returns a Satellite object for settings.server.hostname"""
-    if settings.server.hostname:
+    if hostname := get_server_hostname():
         try:
-            return Satellite.get_host_by_hostname(settings.server.hostname)
+            return Satellite.get_host_by_hostname(hostname)
         except ContentHostError:
             return Satellite()
     return None
@@ -10,7 +10,7 @@ import pytest
 
 from robottelo import constants
 from robottelo.config import settings
-from robottelo.hosts import ContentHost, Satellite
+from robottelo.hosts import ContentHost, HostFanout, Satellite
 
 
 def host_conf(request):
@@ -164,11 +164,14 @@ def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
 def rex_contenthosts(request, module_org, target_sat, module_ak_with_cv):
     request.param['no_containers'] = True
     with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
-        for host in hosts:
+
+        def register(host):
             repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
             host.register(
                 module_org, None, module_ak_with_cv.name, target_sat, repo_data=f'repo={repo}'
             )
+
+        HostFanout(hosts).map(register, raise_on_error=True)
         yield hosts
 
 
@@ -6,7 +6,7 @@ from packaging.version import Version
 import pytest
 from wait_for import wait_for
 
-from robottelo.config import configure_airgun, configure_nailgun, settings
+from robottelo.config import configure_airgun, configure_nailgun, get_server_hostname, settings
 from robottelo.hosts import (
     Capsule,
     IPAHost,
@@ -367,7 +367,7 @@ def installer_satellite(request):
         broker object of class satellite
     """
     if 'sanity' in request.config.option.markexpr:
-        sat = Satellite(settings.server.hostname)
+        sat = Satellite(get_server_hostname())
     else:
         sat = lru_sat_ready_rhel(getattr(request, 'param', None))
 
@@ -0,0 +1,16 @@
+"""Dump the hammer command timings of each xdist worker at session end"""
+
+import os
+
+from robottelo.cli.telemetry import registry
+from robottelo.config import settings
+from robottelo.logging import logger, robottelo_log_dir
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not settings.performance.time_hammer or not registry.summary():
+        return
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+    robottelo_log_dir.mkdir(exist_ok=True)
+    json_path, csv_path = registry.dump(robottelo_log_dir.joinpath(f'hammer_timings_{worker_id}'))
+    logger.info(f'Hammer command timings written to {json_path} and {csv_path}')
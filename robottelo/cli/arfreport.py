@@ -48,9 +48,7 @@ class Arfreport(Base):
              -h, --help                              Print help
 
         """
-        cls.command_sub = 'list'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command(options, command_sub='list'), output_format='csv')
 
     @classmethod
     def downloadhtml(cls, options=None):
@@ -67,6 +65,6 @@ class Arfreport(Base):
          -h, --help                       Print help
 
         """
-        cls.command_sub = 'download-html'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')[0]
+        return cls.execute(
+            cls._construct_command(options, command_sub='download-html'), output_format='csv'
+        )[0]
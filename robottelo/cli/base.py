@@ -1,15 +1,41 @@
 """Generic base class for cli hammer commands."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 import re
+import time
+from uuid import uuid4
 
-from wait_for import wait_for
+from broker.helpers import Result
 
 from robottelo import ssh
 from robottelo.cli import hammer
-from robottelo.config import settings
-from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
+from robottelo.cli.command_tree import get_command_tree
+from robottelo.cli.hammer_session import get_hammer_session, is_session_expired
+from robottelo.cli.hammer_shell import HammerShell, HammerShellError, get_hammer_shell
+from robottelo.cli.query import Query
+from robottelo.cli.response_cache import READ_SUBCOMMANDS, get_response_cache
+from robottelo.cli.telemetry import registry as timings, split_time_output
+from robottelo.config import get_server_hostname, settings
+from robottelo.exceptions import CLIBaseError, CLIDataBaseError, CLIError, CLIReturnCodeError
 from robottelo.logging import logger
-from robottelo.utils.ssh import get_client
+
+# hostnames of the Satellites whose hammer commands omit the credentials in the current thread
+# or task, see Satellite.omit_credentials
+_credentials_omitted_on = ContextVar('credentials_omitted_on', default=frozenset())
+
+
+@contextmanager
+def credentials_omitted(hostname):
+    """Omit the credentials of the hammer commands run on ``hostname`` within the block
+
+    Only the commands of the current thread or task are affected.
+    """
+    token = _credentials_omitted_on.set(_credentials_omitted_on.get() | {hostname})
+    try:
+        yield
+    finally:
+        _credentials_omitted_on.reset(token)
 
 
 class Base:
@@ -20,7 +46,7 @@ class Base:
 
     omitting_credentials = False
     command_base = None  # each inherited instance should define this
-    command_sub = None  # specific to instance, like: create, update, etc.
+    command_sub = None  # default subcommand, methods pass theirs to _construct_command
     command_end = None  # extending commands like for directory to pass
     command_requires_org = False  # True when command requires organization-id
     hostname = None  # Now used for Satellite class hammer execution
@@ -28,7 +54,7 @@ class Base:
     _db_error_regex = re.compile(r'.*INSERT INTO|.*SELECT .*FROM|.*violates foreign key')
 
     @classmethod
-    def _handle_response(cls, response, ignore_stderr=None):
+    def _handle_response(cls, response, ignore_stderr=None, command=None):
         """Verify ``status`` of the CLI command.
 
         Check for a non-zero return code or any stderr contents.
@@ -36,6 +62,8 @@ class Base:
         :param response: a result object, returned by :mod:`robottelo.utils.ssh.command`.
         :param ignore_stderr: indicates whether to throw a warning in logs if
             ``stderr`` is not empty.
+        :param command: the hammer command the response belongs to, as built by
+            ``_construct_command``. Used to name the failing command in error messages.
         :return: contents of ``stdout``.
         :raises robottelo.exceptions.CLIReturnCodeError: If return code is
             different from zero.
@@ -49,8 +77,13 @@ class Base:
         if isinstance(response.stderr, bytes):
             response.stderr = response.stderr.decode()
         if response.status != 0:
+            if command:
+                # only keep "<command_base> <command_sub>", options may contain secrets
+                command_name = command.split(' --', 1)[0].strip()
+            else:
+                command_name = f'{cls.command_base} {cls.command_sub}'
             full_msg = (
-                f'Command "{cls.command_base} {cls.command_sub}" '
+                f'Command "{command_name}" '
                 f'finished with status {response.status}\n'
                 f'stderr contains:\n{response.stderr}'
             )
@@ -68,9 +101,7 @@ class Base:
         Adds OS to record.
         """
 
-        cls.command_sub = 'add-operatingsystem'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add-operatingsystem'))
 
     @classmethod
     def ping(cls, options=None):
@@ -78,22 +109,33 @@ class Base:
         Display status of Satellite.
         """
 
-        cls.command_sub = 'ping'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='ping'))
 
     @classmethod
-    def create(cls, options=None, timeout=None):
+    def create(cls, options=None, timeout=None, requires_org=None):
         """
         Creates a new record using the arguments passed via dictionary.
-        """
 
-        cls.command_sub = 'create'
+        :param requires_org: whether reading the new record needs its organization-id,
+            ``command_requires_org`` by default
+        """
 
         if options is None:
             options = {}
-
-        result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        if requires_org is None:
+            requires_org = cls.command_requires_org
+
+        new_obj = None
+        if settings.performance.single_round_trip_create and cls._info_is_batchable(
+            options, requires_org
+        ):
+            result, new_obj = cls._create_with_info(options, requires_org, timeout=timeout)
+        else:
+            result = cls.execute(
+                cls._construct_command(options, command_sub='create'),
+                output_format='csv',
+                timeout=timeout,
+            )
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
@@ -102,35 +144,124 @@ class Base:
             # Fetch new object
             # Some Katello obj require the organization-id for subcommands
             info_options = {'id': obj_id}
-            if cls.command_requires_org:
+            if requires_org:
                 if 'organization-id' not in options:
                     tmpl = 'organization-id option is required for {0}.create'
                     raise CLIError(tmpl.format(cls.__name__))
                 info_options['organization-id'] = options['organization-id']
 
-            # organization creation can take some time
-            if cls.command_base == 'organization':
-                new_obj, _ = wait_for(
-                    lambda: cls.info(info_options),
-                    timeout=300000,
-                    delay=5,
-                    silent_failure=True,
-                    handle_exception=True,
-                )
-            else:
-                new_obj = cls.info(info_options)
+            if new_obj is None:
+                # organization creation can take some time
+                if cls.command_base == 'organization':
+                    new_obj = cls._poll_info(info_options)
+                else:
+                    new_obj = cls.info(info_options)
 
             # stdout should be a dictionary containing the object
-            if len(new_obj) > 0:
+            if new_obj is not None and len(new_obj) > 0:
                 result = new_obj
 
         return result
 
+    @classmethod
+    def _info_is_batchable(cls, options, requires_org):
+        """Whether ``create`` can fetch the new object in the same round trip
+
+        Classes overriding ``info`` need their own ``info`` call.
+        """
+        if requires_org and 'organization-id' not in options:
+            return False
+        return next(klass for klass in cls.__mro__ if 'info' in vars(klass)) is Base
+
+    @classmethod
+    def _create_with_info(cls, options, requires_org, timeout=None):
+        """Create an entity and read it back with ``info`` in a single ssh round trip
+
+        The id of the new entity is read from the ``create`` output by the remote shell. The
+        ``info`` output is parsed like :meth:`info` parses it, and must be the new entity.
+
+        :return: a tuple of the parsed ``create`` output and of the parsed ``info`` output, the
+            latter None when ``info`` did not run or failed
+        """
+        info_options = {'id': '$__rt_id'}
+        if requires_org:
+            info_options['organization-id'] = options['organization-id']
+        create = cls._construct_command(options, command_sub='create')
+        info = cls._construct_command(info_options, command_sub='info')
+        hostname = cls.hostname or get_server_hostname()
+        info_format = 'json' if settings.performance.json_info else None
+        marker = f'__robottelo_batch_{uuid4().hex}__'
+        script = f"""__rt_err=$(mktemp)
+__rt_out=$({cls._hammer_command(create, output_format='csv', hostname=hostname)} \\
+    2>"$__rt_err"); __rt_rc=$?
+echo {marker} 0 stdout; printf '%s\\n' "$__rt_out"
+echo; echo {marker} 0 stderr; cat "$__rt_err"
+echo; echo {marker} 0 status $__rt_rc
+__rt_id=$(printf '%s\\n' "$__rt_out" | \\
+    awk -F, 'NR == 1 {{for (i = 1; i <= NF; i++) if ($i == "Id") c = i}} NR == 2 && c {{print $c}}')
+if [ -n "$__rt_id" ]; then
+    echo {marker} 1 stdout
+    {cls._hammer_command(info, output_format=info_format, hostname=hostname)} \\
+        2>"$__rt_err"; __rt_rc=$?
+    echo; echo {marker} 1 stderr; cat "$__rt_err"
+    echo; echo {marker} 1 status $__rt_rc
+fi
+rm -f "$__rt_err"
+"""
+        batch = ssh.command(script, hostname=hostname, timeout=timeout)
+        cls._invalidate_response_cache(create, hostname)
+        sections = cls._split_batch_output(batch.stdout, marker)
+        section = sections.get(0) or {
+            'stdout': '',
+            'stderr': batch.stderr,
+            'status': batch.status or 1,
+        }
+        response = cls._parse_batch_section(section, create, 'csv')
+        result = cls._handle_response(response, command=create)
+        if (section := sections.get(1)) is None or section['status'] != 0:
+            return result, None
+        response = cls._parse_batch_section(section, info, info_format)
+        new_obj = cls._handle_response(response, command=info)
+        if info_format != 'json':
+            new_obj = hammer.parse_info(new_obj)
+        created_id = result[0].get('id') if result else None
+        if str((new_obj or {}).get('id')) != str(created_id):
+            raise CLIError(
+                f'{cls.__name__}.create read back the entity {(new_obj or {}).get("id")} '
+                f'instead of the created entity {created_id}'
+            )
+        return result, new_obj
+
+    @classmethod
+    def _poll_info(cls, info_options, timeout=300):
+        """Poll ``info`` until it succeeds, backing off from 0.5 up to 10 seconds between polls
+
+        Like ``wait_for(..., handle_exception=True)``, any exception is retried, not only the
+        errors of hammer.
+
+        :return: the parsed ``info`` output, or None if it did not succeed within ``timeout``
+            seconds
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.5
+        while True:
+            try:
+                return cls.info(info_options)
+            except Exception as err:
+                if time.monotonic() + delay > deadline:
+                    logger.warning(f'{cls.command_base} {info_options} not readable: {err}')
+                    return None
+            time.sleep(delay)
+            delay = min(delay * 2, 10)
+
     @classmethod
     def delete(cls, options=None, timeout=None):
         """Deletes existing record."""
-        cls.command_sub = 'delete'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='delete'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def delete_parameter(cls, options=None, timeout=None):
@@ -138,9 +269,11 @@ class Base:
         Deletes parameter from record.
         """
 
-        cls.command_sub = 'delete-parameter'
-
-        return cls.execute(cls._construct_command(options), ignore_stderr=False, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='delete-parameter'),
+            ignore_stderr=False,
+            timeout=timeout,
+        )
 
     @classmethod
     def dump(cls, options=None, timeout=None):
@@ -148,9 +281,11 @@ class Base:
         Displays the content for existing partition table.
         """
 
-        cls.command_sub = 'dump'
-
-        return cls.execute(cls._construct_command(options), ignore_stderr=False, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='dump'),
+            ignore_stderr=False,
+            timeout=timeout,
+        )
 
     @classmethod
     def _get_username_password(cls, username=None, password=None):
@@ -172,6 +307,75 @@ class Base:
 
         return (username, password)
 
+    @classmethod
+    def _hammer_credentials(cls, user=None, password=None):
+        """Return the ``(user, password)`` hammer is called with"""
+        if cls.omitting_credentials or cls.hostname in _credentials_omitted_on.get():
+            return None, None
+        return cls._get_username_password(user, password)
+
+    @classmethod
+    def _hammer_command(cls, command, user=None, password=None, output_format=None, hostname=None):
+        """Build the full remote shell command running hammer ``command``
+
+        :param hostname: the Satellite the command runs on, needed to authenticate with a
+            cached hammer session, see :mod:`robottelo.cli.hammer_session`
+        """
+        user, password = cls._hammer_credentials(user, password)
+        env = f'LANG={settings.robottelo.locale}'
+        if hostname and (session := get_hammer_session(hostname, user, password)):
+            env = f'{env} HOME={session.ensure()}'
+            user, password = None, None
+        # time -p reports how long hammer ran on the server, see robottelo.cli.telemetry
+        return '{} {} hammer -v {} {} {} {}'.format(
+            env,
+            'time -p' if settings.performance.time_hammer else '',
+            f'-u {user}' if user else "--interactive no",
+            f'-p {password}' if password else "",
+            f'--output={output_format}' if output_format else "",
+            command,
+        )
+
+    @classmethod
+    def _expire_hammer_session(cls, response, hostname, user=None, password=None):
+        """Expire the cached hammer session a failed ``response`` was refused with
+
+        :return: whether a session was expired, so the command can be run again
+        """
+        session = get_hammer_session(hostname, *cls._hammer_credentials(user, password))
+        if session is None or response.status == 0 or not is_session_expired(response.stderr):
+            return False
+        logger.debug(f'hammer session of {session.user} on {hostname} expired, logging in again')
+        session.expire()
+        return True
+
+    @classmethod
+    def _use_hammer_shell(cls, command):
+        """Whether ``command`` should run in the resident hammer process"""
+        return (
+            settings.performance.get('hammer_backend', 'ssh') == 'shell'
+            and not settings.performance.time_hammer
+            and HammerShell.supports(command)
+        )
+
+    @classmethod
+    def _execute_in_hammer_shell(cls, command, hostname, user, password, output_format, timeout):
+        """Run ``command`` in the resident hammer process of ``hostname``
+
+        :return: the parsed response, or None when the classic ssh backend has to be used instead
+        """
+        user, password = cls._hammer_credentials(user, password)
+        shell = get_hammer_shell(hostname, user, password, locale=settings.robottelo.locale)
+        try:
+            response = shell.run(command, output_format=output_format, timeout=timeout)
+        except ValueError as err:
+            logger.debug(f'Running `{command}` with the ssh hammer backend: {err}')
+            return None
+        except HammerShellError as err:
+            logger.warning(f'{err}, falling back to the ssh hammer backend')
+            return None
+        return ssh.parse_output(response, output_format)
+
     @classmethod
     def execute(
         cls,
@@ -185,37 +389,218 @@ class Base:
         return_raw_response=None,
     ):
         """Executes the cli ``command`` on the server via ssh"""
-        if cls.omitting_credentials:
-            user, password = None, None
-        else:
-            user, password = cls._get_username_password(user, password)
-        time_hammer = settings.performance.time_hammer
+        hostname = hostname or cls.hostname or get_server_hostname()
+        response = None
+        if cls._use_hammer_shell(command):
+            response = cls._execute_in_hammer_shell(
+                command, hostname, user, password, output_format, timeout
+            )
+        if response is None:
+            time_hammer = settings.performance.time_hammer
+            start = time.perf_counter()
+            for retry in (False, True):
+                cmd = cls._hammer_command(command, user, password, output_format, hostname)
+                response = ssh.command(
+                    cmd,
+                    hostname=hostname,
+                    # timed output is parsed by _record_timing
+                    output_format=None if time_hammer else output_format,
+                    timeout=timeout,
+                )
+                if retry or not cls._expire_hammer_session(response, hostname, user, password):
+                    break
+            if time_hammer:
+                response = cls._record_timing(
+                    command, response, output_format, time.perf_counter() - start
+                )
+        cls._invalidate_response_cache(command, hostname)
+        if return_raw_response:
+            return response
+        return cls._handle_response(response, ignore_stderr=ignore_stderr, command=command)
 
-        # add time to measure hammer performance
-        cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
-            settings.robottelo.locale,
-            'time -p' if time_hammer else '',
-            f'-u {user}' if user else "--interactive no",
-            f'-p {password}' if password else "",
-            f'--output={output_format}' if output_format else "",
-            command,
+    @classmethod
+    def _invalidate_response_cache(cls, command, hostname):
+        """Drop the cached responses of ``hostname`` unless ``command`` only reads entities
+
+        A write can change entities of other command bases too, e.g. deleting an organization
+        deletes its products, so every cached response is dropped.
+        """
+        if (cache := get_response_cache(hostname)) is None:
+            return
+        if cls._split_command(command)[1] not in READ_SUBCOMMANDS:
+            cache.invalidate()
+
+    @classmethod
+    def _split_command(cls, command):
+        """Return the ``(command_base, command_sub)`` of hammer ``command``
+
+        Both are None when ``command`` was not built from the ``command_base`` of this class.
+        """
+        command_base = cls.command_base or ''
+        if not command.startswith(command_base):
+            return None, None
+        command_sub = command[len(command_base) :].split(maxsplit=1)[:1]
+        return cls.command_base, command_sub[0] if command_sub else None
+
+    @classmethod
+    def _record_timing(cls, command, response, output_format, client_time=None):
+        """Record the timings of ``command`` and parse its unparsed ``response``
+
+        The ``time -p`` report is removed from ``response.stderr``, see
+        :mod:`robottelo.cli.telemetry`.
+
+        :return: the parsed ``response``
+        """
+        response.stderr, server_time = split_time_output(response.stderr)
+        size = len((response.stdout or '').encode()) + len((response.stderr or '').encode())
+        start = time.perf_counter()
+        response = ssh.parse_output(response, output_format)
+        parse_time = time.perf_counter() - start
+        command_base, command_sub = cls._split_command(command)
+        if command_base is None:
+            command_base, command_sub = (command.split(maxsplit=2) + [None, None])[:2]
+        timings.record(
+            command_base,
+            command_sub,
+            client=client_time,
+            server=server_time,
+            bytes=size,
+            parse=parse_time,
         )
-        response = ssh.command(
-            cmd,
-            hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
+        return response
+
+    @classmethod
+    def _read_through_cache(cls, fetch, command_sub, options=None, output_format=None):
+        """Return the response of ``fetch()``, served from the Satellite response cache
+
+        The response is cached under the ``command_base``, ``command_sub``, ``options``,
+        ``output_format`` and hammer user, see :mod:`robottelo.cli.response_cache`.
+        """
+        cache = get_response_cache(cls.hostname or get_server_hostname())
+        if cache is None:
+            return fetch()
+        user = cls._hammer_credentials()[0]
+        key = cache.key(cls.command_base, command_sub, options, output_format, user)
+        try:
+            return cache.get(key)
+        except KeyError:
+            response = fetch()
+            cache.set(key, response)
+            return response
+
+    @classmethod
+    def execute_many(
+        cls,
+        commands,
+        hostname=None,
+        user=None,
+        password=None,
+        timeout=None,
+        ignore_stderr=None,
+        raise_on_error=True,
+    ):
+        """Executes several cli ``commands`` on the server in a single ssh round trip
+
+        The commands are sent as one remote shell script which runs them one after the other,
+        capturing stdout, stderr and the exit code of each of them between delimiter lines.
+
+        :param commands: list of hammer commands as built by ``_construct_command``, or of
+            ``(command, output_format)`` tuples. ``output_format`` is ``csv``, ``json``,
+            ``info`` (plain output parsed by :func:`hammer.parse_info`) or ``None``.
+        :param timeout: Time to wait for the whole batch to finish.
+        :param raise_on_error: when ``False``, the ``CLIBaseError`` of a failed command is
+            returned in its place instead of being raised.
+        :return: a list with one result per command, in the order of ``commands``
+        """
+        commands = [(cmd, None) if isinstance(cmd, str) else tuple(cmd) for cmd in commands]
+        hostname = hostname or cls.hostname or get_server_hostname()
+        marker = f'__robottelo_batch_{uuid4().hex}__'
+        script = ['__rt_err=$(mktemp)']
+        for index, (command, output_format) in enumerate(commands):
+            hammer_format = None if output_format == 'info' else output_format
+            script.extend(
+                [
+                    f'echo {marker} {index} stdout',
+                    f'{cls._hammer_command(command, user, password, hammer_format, hostname)} '
+                    '2>"$__rt_err"; __rt_rc=$?',
+                    f'echo; echo {marker} {index} stderr; cat "$__rt_err"',
+                    f'echo; echo {marker} {index} status $__rt_rc',
+                ]
+            )
+        script.append('rm -f "$__rt_err"')
+        batch = ssh.command(
+            '\n'.join(script),
+            hostname=hostname,
             timeout=timeout,
         )
-        if return_raw_response:
-            return response
-        return cls._handle_response(response, ignore_stderr=ignore_stderr)
+        for command, _ in commands:
+            cls._invalidate_response_cache(command, hostname)
+        sections = cls._split_batch_output(batch.stdout, marker)
+
+        results = []
+        for index, (command, output_format) in enumerate(commands):
+            section = sections.get(index)
+            if section is None:
+                # the script did not get this far, e.g. the batch timed out
+                section = {'stdout': '', 'stderr': batch.stderr, 'status': batch.status or 1}
+            response = cls._parse_batch_section(section, command, output_format)
+            try:
+                result = cls._handle_response(
+                    response, ignore_stderr=ignore_stderr, command=command
+                )
+            except CLIBaseError as err:
+                if raise_on_error:
+                    raise
+                result = err
+            else:
+                if output_format == 'info':
+                    result = hammer.parse_info(result)
+            results.append(result)
+        return results
+
+    @classmethod
+    def _parse_batch_section(cls, section, command, output_format):
+        """Build the parsed response of a batched ``command`` from its output ``section``"""
+        response = Result(**section)
+        if settings.performance.time_hammer:
+            # the batch is timed as a whole, only the hammer run time is per command
+            return cls._record_timing(command, response, output_format)
+        return ssh.parse_output(response, output_format)
+
+    @staticmethod
+    def _split_batch_output(stdout, marker):
+        """Split the stdout of an ``execute_many`` script into per command sections
+
+        :return: a dict mapping each command index to its ``stdout``, ``stderr`` and ``status``
+        """
+        sections = {}
+        lines = None
+        for line in stdout.split('\n'):
+            if not line.startswith(marker):
+                if lines is not None:
+                    lines.append(line)
+                continue
+            index, name, *status = line[len(marker) :].split()
+            section = sections.setdefault(int(index), {})
+            if name == 'status':
+                section['status'] = int(status[0])
+                lines = None
+            else:
+                section[name] = lines = []
+        for section in sections.values():
+            for name in ('stdout', 'stderr'):
+                # the extra echo before each delimiter only terminates the last output line
+                section[name] = '\n'.join(section.get(name, []))
+        return {index: section for index, section in sections.items() if 'status' in section}
 
     @classmethod
     def sm_execute(cls, command, hostname=None, timeout=None, **kwargs):
         """Executes the satellite-maintain cli commands on the server via ssh"""
         env_var = kwargs.get('env_var') or ''
-        client = get_client(hostname=hostname or cls.hostname)
-        return client.execute(f'{env_var} satellite-maintain {command}', timeout=timeout)
+        with ssh.connection_pool.connection(
+            **ssh.connection_kwargs(hostname=hostname or cls.hostname)
+        ) as client:
+            return client.execute(f'{env_var} satellite-maintain {command}', timeout=timeout)
 
     @classmethod
     def exists(cls, options=None, search=None):
@@ -227,6 +612,9 @@ class Base:
         If ``options`` argument already have a search key, then the ``search``
         argument will not be evaluated. Which allows different search query.
 
+        Only a page of a single entity is fetched, with ``iter_list``, or with
+        ``cls.list`` when it is overridden, so the list options and output
+        format of subclasses apply.
         """
 
         if options is None:
@@ -235,43 +623,64 @@ class Base:
         if search is not None and 'search' not in options:
             options.update({'search': f'{search[0]}=\\"{search[1]}\\"'})
 
-        result = cls.list(options)
+        if next(klass for klass in cls.__mro__ if 'list' in vars(klass)) is Base:
+            return next(cls.iter_list(options, per_page=1), [])
+        result = cls.list({**options, 'per-page': 1})
         if result:
             result = result[0]
 
         return result
 
     @classmethod
-    def info(cls, options=None, output_format=None, return_raw_response=None):
-        """Reads the entity information."""
-        cls.command_sub = 'info'
+    def info(
+        cls,
+        options=None,
+        output_format=None,
+        return_raw_response=None,
+        fields=None,
+        requires_org=None,
+    ):
+        """Reads the entity information.
 
-        if options is None:
-            options = {}
+        Unless ``output_format`` is given, the hammer info output is parsed, or hammer json output
+        with ``settings.performance.json_info`` enabled.
 
-        if cls.command_requires_org and 'organization-id' not in options:
+        :param fields: only fetch these fields, see :meth:`_project`
+        :param requires_org: whether the organization-id option is required,
+            ``command_requires_org`` by default
+        """
+        options = cls._project(options, fields)
+        if output_format is None and settings.performance.json_info:
+            output_format = 'json'
+        if requires_org is None:
+            requires_org = cls.command_requires_org
+
+        if requires_org and 'organization-id' not in options:
             raise CLIError(f'organization-id option is required for {cls.__name__}.info')
 
-        result = cls.execute(
-            command=cls._construct_command(options),
-            output_format=output_format,
-            return_raw_response=return_raw_response,
-        )
-        if not return_raw_response and output_format != 'json':
-            result = hammer.parse_info(result)
-        return result
+        def fetch():
+            result = cls.execute(
+                command=cls._construct_command(options, command_sub='info'),
+                output_format=output_format,
+                return_raw_response=return_raw_response,
+            )
+            if not return_raw_response and output_format != 'json':
+                result = hammer.parse_info(result)
+            return result
+
+        if return_raw_response:
+            return fetch()
+        return cls._read_through_cache(fetch, 'info', options, output_format)
 
     @classmethod
-    def list(cls, options=None, per_page=True, output_format='csv'):
+    def list(cls, options=None, per_page=True, output_format='csv', fields=None):
         """
         List information.
         @param options: ID (sometimes name works as well) to retrieve info.
+        @param fields: only fetch these columns, see ``_project``.
         """
 
-        cls.command_sub = 'list'
-
-        if options is None:
-            options = {}
+        options = cls._project(options, fields)
 
         if 'per-page' not in options and per_page:
             options['per-page'] = 10000
@@ -282,7 +691,46 @@ class Base:
         # if cls.command_requires_org and 'organization-id' not in options:
         #     raise CLIError(f'organization-id option is required for {cls.__name__}.list')
 
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls._read_through_cache(
+            lambda: cls.execute(
+                cls._construct_command(options, command_sub='list'), output_format=output_format
+            ),
+            'list',
+            options,
+            output_format,
+        )
+
+    @classmethod
+    def iter_list(cls, options=None, per_page=1000, fields=None):
+        """Lazily list entities, fetching one page of ``per_page`` entities at a time
+
+        Pages are only requested while the caller keeps iterating, so stopping early
+        does not fetch the remaining entities.
+
+        :param options: options of the list command, a ``per-page`` option overrides
+            ``per_page`` and a ``page`` option sets the first page to fetch.
+        :param fields: only fetch these columns, see :meth:`_project`
+        :return: a generator of entity dicts, as parsed by ``hammer.parse_csv``
+        """
+        options = dict(cls._project(options, fields))
+        per_page = int(options.pop('per-page', per_page))
+        page = int(options.pop('page', 1))
+        while True:
+            entities = cls.execute(
+                cls._construct_command(
+                    {**options, 'per-page': per_page, 'page': page}, command_sub='list'
+                ),
+                output_format='csv',
+            )
+            yield from entities
+            if len(entities) < per_page:
+                return
+            page += 1
+
+    @classmethod
+    def query(cls, options=None):
+        """Start a :class:`robottelo.cli.query.Query` of the entities of this class"""
+        return Query(cls, options)
 
     @classmethod
     def puppetclasses(cls, options=None):
@@ -290,9 +738,9 @@ class Base:
         Lists all puppet classes.
         """
 
-        cls.command_sub = 'puppet-classes'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='puppet-classes'), output_format='csv'
+        )
 
     @classmethod
     def remove_operating_system(cls, options=None):
@@ -300,9 +748,7 @@ class Base:
         Removes OS from record.
         """
 
-        cls.command_sub = 'remove-operatingsystem'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='remove-operatingsystem'))
 
     @classmethod
     def sc_params(cls, options=None):
@@ -310,9 +756,9 @@ class Base:
         Lists all smart class parameters.
         """
 
-        cls.command_sub = 'sc-params'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='sc-params'), output_format='csv'
+        )
 
     @classmethod
     def set_parameter(cls, options=None):
@@ -320,9 +766,7 @@ class Base:
         Creates or updates parameter for a record.
         """
 
-        cls.command_sub = 'set-parameter'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='set-parameter'))
 
     @classmethod
     def update(cls, options=None, return_raw_response=None):
@@ -330,10 +774,8 @@ class Base:
         Updates existing record.
         """
 
-        cls.command_sub = 'update'
-
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command(options, command_sub='update'),
             output_format='csv',
             return_raw_response=return_raw_response,
         )
@@ -353,14 +795,48 @@ class Base:
 
         return Wrapper
 
+    @staticmethod
+    def _project(options, fields):
+        """Return ``options`` restricted to ``fields`` with the hammer ``--fields`` option
+
+        Hammer then only fetches, renders and sends these fields, so there is less to parse.
+
+        :param fields: a field label, e.g. ``Content view``, or a list of them, labels of nested
+            fields are paths like ``Additional info/owner``
+        :return: ``options``, or a copy with the ``fields`` option when ``fields`` is given
+        """
+        if options is None:
+            options = {}
+        if not fields:
+            return options
+        return {**options, 'fields': [fields] if isinstance(fields, str) else list(fields)}
+
     @classmethod
-    def _construct_command(cls, options=None):
-        """Build a hammer cli command based on the options passed"""
+    def _construct_command(
+        cls, options=None, command_sub=None, command_end=None, command_base=None
+    ):
+        """Build a hammer cli command based on the options passed
+
+        ``command_base``, ``command_sub`` and ``command_end`` fall back to the class attributes
+        of the same name when not passed. Passing them explicitly keeps no state on the class,
+        so the same CLI class can safely build commands from several threads at once.
+        """
+        command_base = command_base or cls.command_base
+        command_sub = command_sub or cls.command_sub
+        command_end = command_end or cls.command_end
         tail = ''
 
         if options is None:
             options = {}
 
+        if settings.performance.hammer_command_tree.validate_options and (
+            tree := get_command_tree(cls.hostname)
+        ):
+            tree.validate_options(
+                f'{command_base} {command_sub}',
+                [key for key, val in options.items() if val is not None and val is not False],
+            )
+
         for key, val in options.items():
             if val is None:
                 continue
@@ -370,4 +846,4 @@ class Base:
                 if isinstance(val, list):
                     val = ','.join(str(el) for el in val)
                 tail += f' --{key}="{val}"'
-        return f"{cls.command_base or ''} {cls.command_sub or ''} {tail.strip()} {cls.command_end or ''}"
+        return f"{command_base or ''} {command_sub or ''} {tail.strip()} {command_end or ''}"
@@ -0,0 +1,182 @@
+"""Hammer command tree, built by inspecting the help of every hammer command.
+
+The tree of a Satellite is cached on disk per Satellite version, so it is generated once and then
+loaded in milliseconds. With ``settings.performance.hammer_command_tree.validate_options`` enabled,
+``Base._construct_command`` checks option names against it before running anything remotely.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import difflib
+import json
+from pathlib import Path
+import re
+import threading
+import time
+
+from robottelo import ssh
+from robottelo.cli import hammer
+from robottelo.config import get_server_hostname, robottelo_tmp_dir, settings
+from robottelo.exceptions import CLIError
+from robottelo.logging import logger
+
+VERSION_COMMAND = (
+    "rpm -q --qf '%{VERSION}-%{RELEASE}' satellite || "
+    "rpm -q --qf '%{VERSION}-%{RELEASE}' rubygem-hammer_cli"
+)
+# bumped when the tree structure changes, so trees cached by older versions are generated again
+TREE_FORMAT = 2
+# e.g. " -v, --[no-]verbose" or " --name, --deprecation-name"
+_option_aliases_regex = re.compile(
+    r'^ (?:-\w, )?--(?P<negatable>\[no-\])?(?P<name>[\w-]+)(?:, --(?P<alias>[\w-]+))?',
+    re.MULTILINE,
+)
+
+
+def parse_option_aliases(output):
+    """Map the option names of a hammer help ``output`` to their other accepted names
+
+    These are the deprecation names, e.g. ``--deprecation-name`` of ``--name``, and the negated
+    forms of ``--[no-]`` options, e.g. ``--no-verbose`` of ``--verbose``.
+    """
+    aliases = {}
+    for match in _option_aliases_regex.finditer(output.split('Options:', 1)[-1]):
+        names = [match['name']] + ([match['alias']] if match['alias'] else [])
+        if match['negatable']:
+            names += [f'no-{name}' for name in names]
+        if len(names) > 1:
+            aliases[match['name']] = names[1:]
+    return aliases
+
+
+def _help(command, hostname):
+    output = ssh.command(f'{command} --help', hostname=hostname).stdout
+    contents = hammer.parse_help(output)
+    aliases = parse_option_aliases(output)
+    for option in contents['options']:
+        option['aliases'] = aliases.get(option['name'], [])
+    return contents
+
+
+def _option_names(options):
+    """Return every accepted name of ``options``, their aliases included"""
+    return {name for option in options for name in (option['name'], *option.get('aliases', []))}
+
+
+def generate_command_tree(hostname=None, workers=None):
+    """Walk through the hammer commands and subcommands and fetch their help
+
+    Every level of the tree is fetched concurrently over ``workers`` pooled ssh connections.
+
+    :param hostname: Satellite to inspect, the Satellite targeted in the current context by default
+    :param workers: concurrent help requests, the ssh connection pool size by default
+    :return: the help of ``hammer`` as parsed by ``hammer.parse_help``, each subcommand
+        updated with its own help
+    """
+    hostname = hostname or get_server_hostname()
+    tree = _help('hammer', hostname)
+    level = [('hammer', tree)]
+    with ThreadPoolExecutor(max_workers=workers or ssh.connection_pool.size) as executor:
+        while level:
+            children = [
+                (f'{command} {subcommand["name"]}', subcommand)
+                for command, contents in level
+                for subcommand in contents['subcommands']
+            ]
+            helps = executor.map(lambda child: _help(child[0], hostname), children)
+            for (_, subcommand), contents in zip(children, helps, strict=True):
+                subcommand.update(contents)
+            level = children
+    return tree
+
+
+class CommandTree:
+    """Index of the options accepted by every hammer command
+
+    :param tree: the hammer command tree, as returned by :func:`generate_command_tree`
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        # options of the hammer command itself are accepted by every subcommand
+        self.global_options = _option_names(tree['options'])
+        self.commands = {}
+        self._index(tree, [])
+
+    def _index(self, node, path):
+        for subcommand in node['subcommands']:
+            subpath = [*path, subcommand['name']]
+            self.commands[' '.join(subpath)] = _option_names(subcommand.get('options', []))
+            self._index(subcommand, subpath)
+
+    def validate_options(self, command, options):
+        """Check hammer ``command`` accepts every option in ``options``
+
+        Commands missing from the tree are not validated.
+
+        :param command: the command path, e.g. ``content-view filter create``
+        :param options: the option names, without the leading ``--``
+        :raises robottelo.exceptions.CLIError: if an option is unknown to ``command``
+        """
+        if (known := self.commands.get(command)) is None:
+            return
+        known = known | self.global_options
+        unknown = [option for option in options if option not in known]
+        if unknown:
+            hints = [
+                f'--{option} (did you mean {", ".join(f"--{m}" for m in matches)}?)'
+                if (matches := difflib.get_close_matches(option, known, n=3))
+                else f'--{option}'
+                for option in unknown
+            ]
+            raise CLIError(f'hammer {command} does not accept {", ".join(hints)}')
+
+
+# seconds to wait before trying again to get the tree of a host after a failure
+FAILURE_RETRY_DELAY = 60
+_trees = {}
+# hostname -> monotonic time after which getting its tree is tried again
+_failures = {}
+_trees_lock = threading.Lock()
+
+
+def cache_path(version):
+    """Return the path of the cached command tree of Satellite ``version``"""
+    cache_dir = settings.performance.hammer_command_tree.get('cache_dir') or robottelo_tmp_dir
+    return Path(cache_dir).joinpath(f'hammer_commands_{version}_v{TREE_FORMAT}.json')
+
+
+def get_command_tree(hostname=None):
+    """Return the :class:`CommandTree` of ``hostname``
+
+    The tree is loaded from the disk cache of the Satellite version, or generated and cached.
+
+    A failure is not cached, it is tried again after ``FAILURE_RETRY_DELAY`` seconds.
+
+    :return: the command tree, or None when it could not be generated
+    """
+    hostname = hostname or get_server_hostname()
+    with _trees_lock:
+        if hostname in _trees:
+            return _trees[hostname]
+        if time.monotonic() < _failures.get(hostname, 0):
+            return None
+        try:
+            result = ssh.command(VERSION_COMMAND, hostname=hostname)
+            if result.status != 0:
+                raise CLIError(f'Unable to read the Satellite version: {result.stdout}')
+            path = cache_path(result.stdout.strip())
+            if path.exists():
+                tree = json.loads(path.read_text())
+            else:
+                logger.info(f'Generating hammer command tree of {hostname} into {path}')
+                tree = generate_command_tree(hostname)
+                path.write_text(json.dumps(tree, indent=2, sort_keys=True))
+            _trees[hostname] = CommandTree(tree)
+        except Exception as err:
+            logger.warning(
+                f'Hammer options are not validated, no command tree for {hostname}: {err}'
+            )
+            _failures[hostname] = time.monotonic() + FAILURE_RETRY_DELAY
+            return None
+        _failures.pop(hostname, None)
+        return _trees[hostname]
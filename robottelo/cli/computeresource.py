@@ -31,41 +31,48 @@ class ComputeResource(Base):
     @classmethod
     def image_create(cls, options):
         """Create an image"""
-        cls.command_sub = 'image create'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='image create'), output_format='csv'
+        )
 
     @classmethod
     def image_info(cls, options):
         """Show an image"""
-        cls.command_sub = 'image info'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='image info'), output_format='csv'
+        )
 
     @classmethod
     def image_available(cls, options):
         """Show images available for addition"""
-        cls.command_sub = 'image available'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='image available'), output_format='csv'
+        )
 
     @classmethod
     def image_delete(cls, options):
         """delete an image"""
-        cls.command_sub = 'image delete'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='image delete'), output_format='csv'
+        )
 
     @classmethod
     def image_list(cls, options):
         """Show the list of images"""
-        cls.command_sub = 'image list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='image list'), output_format='csv'
+        )
 
     @classmethod
     def image_update(cls, options):
         """update an image"""
-        cls.command_sub = 'image update'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='image update'), output_format='csv'
+        )
 
     @classmethod
     def networks(cls, options):
         """List available networks for a compute resource"""
-        cls.command_sub = 'networks'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='networks'), output_format='csv'
+        )
@@ -34,6 +34,6 @@ class ContentCredential(Base):
         Gets information for a content credential
         """
 
-        cls.command_sub = 'info'
-
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(
+            cls._construct_command(options, command_sub='info'), output_format='json'
+        )
@@ -36,17 +36,19 @@ class ContentExport(Base):
         """
         List previous exports
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='list'), output_format=output_format
+        )
 
     @classmethod
     def completeLibrary(cls, options, output_format='json', timeout=None):
         """
         Make full library export
         """
-        cls.command_sub = 'complete library'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='complete library'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -54,9 +56,10 @@ class ContentExport(Base):
         """
         Make full repository export
         """
-        cls.command_sub = 'complete repository'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='complete repository'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -64,9 +67,10 @@ class ContentExport(Base):
         """
         Make full CV version export
         """
-        cls.command_sub = 'complete version'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='complete version'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -74,9 +78,10 @@ class ContentExport(Base):
         """
         Make incremental library export
         """
-        cls.command_sub = 'incremental library'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='incremental library'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -84,9 +89,10 @@ class ContentExport(Base):
         """
         Make incremental repository export
         """
-        cls.command_sub = 'incremental repository'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='incremental repository'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -94,9 +100,10 @@ class ContentExport(Base):
         """
         Make incremental CV version export
         """
-        cls.command_sub = 'incremental version'
         return cls.execute(
-            cls._construct_command(options), output_format=output_format, timeout=timeout
+            cls._construct_command(options, command_sub='incremental version'),
+            output_format=output_format,
+            timeout=timeout,
         )
 
     @classmethod
@@ -104,5 +111,7 @@ class ContentExport(Base):
         """
         Generates export metadata
         """
-        cls.command_sub = 'generate-metadata'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='generate-metadata'),
+            output_format=output_format,
+        )
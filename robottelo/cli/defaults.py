@@ -41,8 +41,7 @@ class Defaults(Base):
                                           providers see `hammer defaults
                                           providers`.
         """
-        cls.command_sub = 'add'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add'))
 
     @classmethod
     def delete(cls, options=None):
@@ -55,5 +54,4 @@ class Defaults(Base):
 
             --param-name OPTION_NAME      The name of the default option
         """
-        cls.command_sub = 'delete'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='delete'))
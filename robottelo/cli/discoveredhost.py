@@ -31,29 +31,34 @@ class DiscoveredHost(Base):
     @classmethod
     def provision(cls, options=None):
         """Manually provision discovered host"""
-        cls.command_sub = 'provision'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='provision'), output_format='csv'
+        )
 
     @classmethod
     def facts(cls, options=None):
         """Get all the facts associated with discovered host"""
-        cls.command_sub = 'facts'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='facts'), output_format='csv'
+        )
 
     @classmethod
     def auto_provision(cls, options=None):
         """Auto provision discovered host"""
-        cls.command_sub = 'auto-provision'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='auto-provision'), output_format='csv'
+        )
 
     @classmethod
     def reboot(cls, options=None):
         """Reboot discovered host"""
-        cls.command_sub = 'reboot'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='reboot'), output_format='csv'
+        )
 
     @classmethod
     def refresh_facts(cls, options=None):
         """Refresh facts associated with discovered host"""
-        cls.command_sub = 'refresh-facts'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='refresh-facts'), output_format='csv'
+        )
@@ -29,5 +29,6 @@ class Environment(Base):
     @classmethod
     def sc_params(cls, options=None):
         """List all smart class parameters."""
-        cls.command_sub = 'sc-params'
-        return cls.execute(cls._construct_command(options), output_format='json')
+        return cls.execute(
+            cls._construct_command(options, command_sub='sc-params'), output_format='json'
+        )
@@ -33,23 +33,30 @@ class FlatpakRemote(Base):
     @classmethod
     def scan(cls, options=None, output_format=None):
         """Scan a flatpak remote"""
-        cls.command_sub = 'scan'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='scan'), output_format=output_format
+        )
 
     @classmethod
     def repository_info(cls, options=None, output_format='csv'):
         """Show a flatpak remote repository"""
-        cls.command_sub = 'remote-repository info'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='remote-repository info'),
+            output_format=output_format,
+        )
 
     @classmethod
     def repository_list(cls, options=None, output_format='csv'):
         """List flatpak remote repositories"""
-        cls.command_sub = 'remote-repository list'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='remote-repository list'),
+            output_format=output_format,
+        )
 
     @classmethod
     def repository_mirror(cls, options=None, output_format=None):
         """Mirror a flatpak remote repository"""
-        cls.command_sub = 'remote-repository mirror'
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        return cls.execute(
+            cls._construct_command(options, command_sub='remote-repository mirror'),
+            output_format=output_format,
+        )
@@ -1,6 +1,7 @@
 """Helpers to interact with hammer command line utility."""
 
 import csv
+import functools
 import json
 import re
 
@@ -12,29 +13,42 @@ def _normalize(header):
     return header.replace(' ', '-').lower()
 
 
+# hammer prints the same few keys over and over, normalize each of them once
+_normalize_key = functools.lru_cache(maxsize=4096)(_normalize)
+# top level documents are pretty printed, only their brackets start a line
+_document_boundary = re.compile(r'(?<=\n[}\]])\s*\n(?=[{\[])')
+
+
+def _normalize_pairs(pairs):
+    return {_normalize_key(key): value for key, value in pairs}
+
+
+def _loads(document):
+    """Decode a JSON ``document`` with normalized keys and integers as strings
+
+    Objects and integers are converted by the decoder as it builds them, no second walk over the
+    decoded document is needed.
+    """
+    return json.loads(document, object_pairs_hook=_normalize_pairs, parse_int=str)
+
+
+def iter_json(stdout):
+    """Parse the JSON documents concatenated in the output of Hammer CLI one at a time
+
+    :return: a generator of the documents, with keys normalized as in :func:`parse_json`
+    """
+    for document in _document_boundary.split(stdout):
+        yield _loads(document)
+
+
 def parse_json(stdout):
     """Parse JSON output from Hammer CLI and convert it to python dictionary
     while normalizing keys.
-    """
-    new_object_index = stdout.find('\n}\n{')
-    if new_object_index > -1:
-        stdout = stdout[new_object_index + 3 :]  # noqa: E203
-    parsed = json.loads(stdout)
-    return _normalize_obj(parsed)
-
 
-def _normalize_obj(obj):
-    """Normalize all dict's keys replacing empty spaces with "-" and lowering
-    chars
+    When hammer prints several documents, e.g. a message before the entity, the last one is
+    returned.
     """
-    if isinstance(obj, dict):
-        return {_normalize(k): _normalize_obj(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_normalize_obj(v) for v in obj]
-    # doing this to conform to csv parser
-    if isinstance(obj, int) and not isinstance(obj, bool):
-        return str(obj)
-    return obj
+    return _loads(_document_boundary.split(stdout)[-1])
 
 
 def parse_csv(output):
@@ -169,8 +183,26 @@ def get_line_indentation_level(line, tab_spaces=4, indentation_spaces=4):
     return spaces // indentation_spaces + (1 if spaces % indentation_spaces > 0 else 0)
 
 
+_numbered_value = re.compile(r'\d+\)\s+(.+)$')
+_numbered_key = re.compile(r'(\d+)\)')
+_numbers = re.compile(r'\d+\)')
+
+
+def _indentation_level(line):
+    """Inlined equivalent of ``get_line_indentation_level`` with its default arguments"""
+    if len(line) < 4:
+        return 0
+    indentation = line[: len(line) - len(line.lstrip(' \t'))]
+    # a tab counts as 4 spaces, a partial indentation level counts as a whole one
+    return -(-(len(indentation) + 3 * indentation.count('\t')) // 4)
+
+
 def parse_info(output):
-    """Parse the info output and returns a dict mapping the values."""
+    """Parse the info output and returns a dict mapping the values.
+
+    Lines are parsed in a single pass, the entries of the current group of sub-properties and
+    its last key are tracked as they are added.
+    """
     # info dictionary
     contents = {}
     sub_prop = None  # stores name of the last group of sub-properties
@@ -181,111 +213,109 @@ def parse_info(output):
         # skip empty lines and dividers
         if line == '' or line == '---':
             continue
-        current_indent_level = get_line_indentation_level(line)
+        current_indent_level = _indentation_level(line)
         if current_indent_level <= 1:
             # we are entering or leaving a second level from lower/upper levels
             # clear the second level key
             second_level_key = None
-        if line.startswith(' '):  # sub-properties are indented
-            # values are separated by ':' or '=>', but not by '::' which can be
-            # entity name like 'test::params::keys'
-            if line.find(':') != -1 and line.find('::') == -1:
-                key, value = line.lstrip().split(":", 1)
-            elif line.find('=>') != -1 and len(line.lstrip().split(" =>", 1)) == 2:
-                key, value = line.lstrip().split(" =>", 1)
-            else:
-                key = value = None
-
-            if key is None and value is None:
-                # Parse single attribute collection properties
-                # Template
-                #  1) template1
-                #  2) template2
-                #
-                # or
-                # Template
-                #  template1
-                #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
-
-                if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
-
-                value = match.group(1)
+        if line[0] != ' ':
+            sub_num = None  # new property implies no sub property
+            key, value = line.lstrip().split(':', 1)
+            key = key.lstrip().replace(' ', '-').lower()
+            value = value.lstrip()
+            if value == '':  # 'key:' no value, new sub-property
+                sub_prop = key
+                contents[sub_prop] = {}
+            else:  # 'key: value' line
+                contents[key] = value
+            continue
 
+        # sub-properties are indented
+        stripped = line.lstrip()
+        # values are separated by ':' or '=>', but not by '::' which can be
+        # entity name like 'test::params::keys'
+        if ':' in line and '::' not in line:
+            key, value = stripped.split(':', 1)
+        elif '=>' in line and ' =>' in stripped:
+            key, value = stripped.split(' =>', 1)
+        else:
+            # Parse single attribute collection properties
+            # Template
+            #  1) template1
+            #  2) template2
+            #
+            # or
+            # Template
+            #  template1
+            #  template2
+            match = _numbered_value.match(stripped)
+            value = stripped if match is None else match.group(1)
+            group = contents[sub_prop]
+            if isinstance(group, dict) and not group:
                 # adding list to 1 level, for example:
                 # {'template': ['template1', 'template2']}
-                if isinstance(contents[sub_prop], dict) and not contents[sub_prop]:
-                    contents[sub_prop] = []
-                    contents[sub_prop].append(value)
-                elif isinstance(contents[sub_prop], list):
-                    contents[sub_prop].append(value)
-                else:
-                    # adding list to 2 level, for example:
-                    # {'subscription-information':
-                    #      {'registered-by-activation-keys': ['ak1', 'ak2']}
-                    #  }
-                    last_key = list(contents[sub_prop].keys())[-1]
-                    if not contents[sub_prop][last_key]:
-                        contents[sub_prop][last_key] = [value]
-                    else:
-                        contents[sub_prop][last_key].append(value)
+                contents[sub_prop] = [value]
+            elif isinstance(group, list):
+                group.append(value)
             else:
-                # some properties have many numbered values
-                # Example:
-                # Content:
-                #  1) Repo Name: repo1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                #  2) Repo Name: puppet1
-                #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
-                if starts_with_number:
-                    # if this is a numbered list on level 2, do nothing - this script doesn't support it
-                    if current_indent_level >= 2:
-                        continue
-                    sub_num = int(starts_with_number.group(1))
-                    # no. 1) we need to change dict() to list()
-                    if sub_num == 1:
-                        contents[sub_prop] = []
-                    # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
-                    # append empty dict to array
-                    contents[sub_prop].append({})
-
-                key = key.lstrip().replace(' ', '-').lower()
-                value = value.lstrip()
-                # add value to dictionary
-                if sub_num is not None:
-                    contents[sub_prop][-1][key] = value
+                # adding list to 2 level, for example:
+                # {'subscription-information':
+                #      {'registered-by-activation-keys': ['ak1', 'ak2']}
+                #  }
+                last_key = next(reversed(group.keys()))
+                if not group[last_key]:
+                    group[last_key] = [value]
                 else:
-                    # a third level is always represented as a dictionary and
-                    # we need to detect if we are at third level
-                    # example:
-                    # Content Information:
-                    #     Content View:
-                    #         ID:   10
-                    #         Name: Default Organization View
-                    # the "ID" and "Name" are located at third indent level
-                    # "content view" is located at second indent level
-                    if current_indent_level == 2 and second_level_key:
-                        # we are at third level indentation
-                        if not contents[sub_prop][second_level_key]:
-                            contents[sub_prop][second_level_key] = {}
-                        contents[sub_prop][second_level_key][key] = value
-                    else:
-                        contents[sub_prop][key] = value
-                    if current_indent_level == 1 and not value:
-                        # always set the last possible second level key
-                        # that can form a third level
-                        second_level_key = key
+                    group[last_key].append(value)
+            continue
+
+        # some properties have many numbered values
+        # Example:
+        # Content:
+        #  1) Repo Name: repo1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        #  2) Repo Name: puppet1
+        #     URL:       /custom/4f84fc90-9ffa-...
+        starts_with_number = _numbered_key.match(key)
+        if starts_with_number:
+            # if this is a numbered list on level 2, do nothing - this script doesn't support it
+            if current_indent_level >= 2:
+                continue
+            sub_num = int(starts_with_number.group(1))
+            # no. 1) we need to change dict() to list()
+            if sub_num == 1:
+                contents[sub_prop] = []
+            # remove number from key
+            key = _numbers.sub('', key)
+            # append empty dict to array
+            contents[sub_prop].append({})
+
+        key = key.lstrip().replace(' ', '-').lower()
+        value = value.lstrip()
+        # add value to dictionary
+        if sub_num is not None:
+            contents[sub_prop][-1][key] = value
+            continue
+        # a third level is always represented as a dictionary and
+        # we need to detect if we are at third level
+        # example:
+        # Content Information:
+        #     Content View:
+        #         ID:   10
+        #         Name: Default Organization View
+        # the "ID" and "Name" are located at third indent level
+        # "content view" is located at second indent level
+        group = contents[sub_prop]
+        if current_indent_level == 2 and second_level_key:
+            # we are at third level indentation
+            if not group[second_level_key]:
+                group[second_level_key] = {}
+            group[second_level_key][key] = value
         else:
-            sub_num = None  # new property implies no sub property
-            key, value = line.lstrip().split(":", 1)
-            key = key.lstrip().replace(' ', '-').lower()
-            if value.lstrip() == '':  # 'key:' no value, new sub-property
-                sub_prop = key
-                contents[sub_prop] = {}
-            else:  # 'key: value' line
-                contents[key] = value.lstrip()
+            group[key] = value
+        if current_indent_level == 1 and not value:
+            # always set the last possible second level key
+            # that can form a third level
+            second_level_key = key
 
     return contents
@@ -0,0 +1,121 @@
+"""Cached hammer authentication sessions.
+
+With ``settings.performance.hammer_sessions.enabled``, hammer logs in once per (Satellite, user)
+with ``hammer auth login`` and later commands reuse that session instead of authenticating with
+``-u``/``-p`` on every call. Each session lives in its own hammer config home, private to the
+pytest-xdist worker, and is logged in again when it expired. The files of the ``~/.hammer`` of
+the ssh user, e.g. ``defaults.yml`` and the ``cli.modules.d`` overrides, are linked into it, so
+hammer behaves the same with and without sessions.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from uuid import uuid4
+
+from robottelo import ssh
+from robottelo.config import settings
+from robottelo.exceptions import CLIReturnCodeError
+from robottelo.logging import logger
+
+SESSIONS_DIR = '/var/tmp/robottelo_hammer_sessions'
+# hammer errors telling the session is not usable anymore, bad credentials are not retried
+SESSION_EXPIRED = re.compile(r'session has expired|missing credentials', re.IGNORECASE)
+# tells apart the sessions of robottelo processes sharing a worker id, e.g. on other runners
+_process_token = uuid4().hex[:8]
+
+
+class HammerSession:
+    """A hammer session of ``user`` on the Satellite ``hostname``
+
+    :param idle_timeout: seconds after which an unused session is logged in again
+    """
+
+    def __init__(self, hostname, user, password, idle_timeout=1800):
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.idle_timeout = idle_timeout
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        user_id = hashlib.sha256(f'{user}:{password}'.encode()).hexdigest()[:16]
+        self.home = f'{SESSIONS_DIR}/{worker}-{_process_token}/{user_id}'
+        self.last_used = None
+        self._lock = threading.Lock()
+
+    def setup_script(self):
+        """Return the shell script setting up the hammer config home of the session
+
+        The files of ``$HOME/.hammer`` are linked into it, except the sessions, and
+        ``defaults.yml`` is linked even before it exists, so ``hammer defaults`` writes to it.
+        """
+        hammer_dir = f'{self.home}/.hammer'
+        return (
+            f'mkdir -p -m 700 {hammer_dir}/cli.modules.d "$HOME/.hammer" && '
+            f'for f in "$HOME"/.hammer/* "$HOME"/.hammer/cli.modules.d/*; do '
+            f'case "${{f#"$HOME"/.hammer/}}" in cli.modules.d|sessions) continue;; esac; '
+            f'[ -e "$f" ] && ln -sfn "$f" "{hammer_dir}/${{f#"$HOME"/.hammer/}}"; done; '
+            f'ln -sfn "$HOME/.hammer/defaults.yml" {hammer_dir}/defaults.yml && '
+            f"printf ':foreman:\\n  :use_sessions: true\\n' > "
+            f'{hammer_dir}/cli.modules.d/foreman_sessions.yml'
+        )
+
+    def login(self):
+        """Set up the hammer config home of the session and log in"""
+        result = ssh.command(
+            f'{self.setup_script()} && '
+            f'LANG={settings.robottelo.locale} HOME={self.home} '
+            f'hammer auth login basic -u {self.user} -p {self.password}',
+            hostname=self.hostname,
+        )
+        if result.status != 0:
+            raise CLIReturnCodeError(
+                result.status,
+                result.stderr,
+                f'hammer auth login of {self.user} on {self.hostname} failed',
+            )
+        logger.debug(f'Logged {self.user} in to hammer on {self.hostname}')
+
+    def ensure(self):
+        """Log in unless the session is fresh
+
+        :return: the hammer config home of the session, to run hammer with as ``HOME``
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.last_used is None or now - self.last_used > self.idle_timeout:
+                self.login()
+            self.last_used = now
+        return self.home
+
+    def expire(self):
+        """Mark the session expired, the next ``ensure`` logs in again"""
+        with self._lock:
+            self.last_used = None
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_hammer_session(hostname, user, password):
+    """Return the hammer session of ``user`` on ``hostname``
+
+    :return: the session, or None when sessions are disabled or there is no user
+    """
+    session_settings = settings.performance.get('hammer_sessions', {})
+    if not user or not session_settings.get('enabled', False):
+        return None
+    key = (hostname, user, password)
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = HammerSession(
+                hostname, user, password, idle_timeout=session_settings.get('idle_timeout', 1800)
+            )
+        return _sessions[key]
+
+
+def is_session_expired(stderr):
+    """Whether hammer ``stderr`` tells its session is not usable anymore"""
+    return bool(SESSION_EXPIRED.search(stderr or ''))
@@ -0,0 +1,173 @@
+"""Resident hammer process backend for :class:`robottelo.cli.base.Base`.
+
+Every classic hammer call boots Ruby and loads all hammer plugins before the API request is even
+made. With ``settings.performance.hammer_backend`` set to ``shell``, hammer is instead bootstrapped
+once per (Satellite, user) by a small Ruby driver that stays resident behind a persistent ssh
+channel. Each hammer command is sent to it as one JSON line and answered with one JSON line
+holding the command's exit status, stdout and stderr.
+
+The persistent channel relies on the ssh2-python broker backend, which is broker's default.
+"""
+
+import json
+import shlex
+import threading
+
+from broker.helpers import Result, translate_timeout
+
+from robottelo import ssh
+from robottelo.logging import logger
+
+DRIVER_PATH = '/var/tmp/robottelo_hammer_shell.rb'
+DRIVER_LOG = '/var/tmp/robottelo_hammer_shell.log'
+RESPONSE_MARKER = '__robottelo_hammer_shell__'
+# commands relying on the remote shell (pipes, redirections, substitutions...) run classically
+SHELL_CHARS = frozenset('|;&<>`$')
+
+DRIVER = f"""\
+# Resident hammer process used by robottelo's "shell" hammer backend.
+require 'json'
+require 'stringio'
+
+# bootstrap hammer once, the same way its executable does, then keep the loaded modules
+ARGV.replace(['--version'])
+begin
+  $stdout = StringIO.new
+  load Gem.bin_path('hammer_cli', 'hammer')
+rescue SystemExit
+ensure
+  $stdout = STDOUT
+end
+
+STDOUT.sync = true
+base_context = HammerCLI.context
+STDIN.each_line do |line|
+  request = JSON.parse(line)
+  out, err = StringIO.new, StringIO.new
+  $stdout, $stderr = out, err
+  begin
+    status = HammerCLI::MainCommand.run('hammer', request['args'], base_context.dup) || 0
+  rescue SystemExit => e
+    status = e.status
+  rescue Exception => e
+    err.puts(e.message)
+    status = 70
+  ensure
+    $stdout, $stderr = STDOUT, STDERR
+  end
+  response = {{status: status, stdout: out.string, stderr: err.string}}
+  STDOUT.puts("{RESPONSE_MARKER} #{{JSON.generate(response)}}")
+end
+"""
+
+
+class HammerShellError(Exception):
+    """Indicates that the resident hammer process is not usable anymore"""
+
+
+class HammerShell:
+    """A resident hammer process on a Satellite, fed over a persistent ssh channel
+
+    :param hostname: the Satellite running hammer
+    :param user: hammer username, every command of this process runs as that user
+    :param password: hammer password
+    :param locale: ``LANG`` the resident process is started with
+    """
+
+    def __init__(self, hostname, user=None, password=None, locale=None):
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.locale = locale
+        self._client = None
+        self._channel = None
+        self._buffer = b''
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def supports(command):
+        """Whether ``command`` can run without being interpreted by a remote shell"""
+        return not SHELL_CHARS.intersection(command)
+
+    def args(self, command, output_format=None):
+        """Build the hammer arguments for ``command``, mirroring ``Base._hammer_command``"""
+        args = ['-v']
+        args += ['-u', self.user] if self.user else ['--interactive', 'no']
+        if self.password:
+            args += ['-p', self.password]
+        if output_format:
+            args.append(f'--output={output_format}')
+        return args + shlex.split(command)
+
+    def start(self):
+        """Upload the driver and start the resident hammer process"""
+        self._client = ssh.connection_pool.factory(**ssh.connection_kwargs(self.hostname))
+        result = self._client.execute(f"cat > {DRIVER_PATH} <<'EOF'\n{DRIVER}EOF")
+        if result.status != 0:
+            raise HammerShellError(f'Unable to upload hammer shell driver: {result.stderr}')
+        self._channel = self._client.session.shell()
+        locale = f'LANG={self.locale} ' if self.locale else ''
+        self._channel.send(f'{locale}exec ruby {DRIVER_PATH} 2>>{DRIVER_LOG}')
+        logger.debug(f'Started resident hammer process on {self.hostname} for {self.user}')
+
+    def close(self):
+        """Stop the resident hammer process and close its ssh connection"""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception as err:
+                logger.debug(f'Error while closing hammer shell on {self.hostname}: {err}')
+        self._client = self._channel = None
+        self._buffer = b''
+
+    def _readline(self):
+        while b'\n' not in self._buffer:
+            size, data = self._channel.read()
+            if size <= 0:
+                raise HammerShellError(f'Resident hammer process on {self.hostname} exited')
+            self._buffer += data
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line.decode('utf-8', errors='replace')
+
+    def run(self, command, output_format=None, timeout=None):
+        """Run hammer ``command`` in the resident process
+
+        :return: a result object with ``stdout``, ``stderr`` and ``status`` like
+            ``ContentHost.execute`` returns
+        :raises HammerShellError: if the process or its channel died, the process is stopped
+        """
+        request = json.dumps({'args': self.args(command, output_format)})
+        with self._lock:
+            try:
+                if self._channel is None:
+                    self.start()
+                self._client.session.session.set_timeout(translate_timeout(timeout or 0))
+                self._channel.send(request)
+                while not (line := self._readline()).startswith(RESPONSE_MARKER):
+                    logger.debug(f'hammer shell on {self.hostname}: {line}')
+                response = json.loads(line[len(RESPONSE_MARKER) :])
+            except Exception as err:
+                self.close()
+                raise HammerShellError(f'hammer shell on {self.hostname} failed: {err}') from err
+        return Result(**response)
+
+
+_shells = {}
+_shells_lock = threading.Lock()
+
+
+def get_hammer_shell(hostname, user=None, password=None, locale=None):
+    """Return the resident hammer process for ``(hostname, user, password)``, creating it lazily"""
+    key = (hostname, user, password, locale)
+    with _shells_lock:
+        if key not in _shells:
+            _shells[key] = HammerShell(hostname, user=user, password=password, locale=locale)
+        return _shells[key]
+
+
+def close_hammer_shells():
+    """Stop every resident hammer process"""
+    with _shells_lock:
+        for shell in _shells.values():
+            shell.close()
+        _shells.clear()
@@ -29,11 +29,13 @@ class JobInvocation(Base):
     @classmethod
     def get_output(cls, options):
         """Get output of the job invocation"""
-        cls.command_sub = 'output'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='output'))
 
     @classmethod
     def create(cls, options, timeout=None):
         """Create a job"""
-        cls.command_sub = 'create'
-        return cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='create'),
+            output_format='csv',
+            timeout=timeout,
+        )
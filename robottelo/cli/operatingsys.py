@@ -44,9 +44,7 @@ class OperatingSys(Base):
         Adds existing architecture to OS.
         """
 
-        cls.command_sub = 'add-architecture'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add-architecture'))
 
     @classmethod
     def add_provisioning_template(cls, options=None):
@@ -54,9 +52,7 @@ class OperatingSys(Base):
         Adds existing template to OS.
         """
 
-        cls.command_sub = 'add-provisioning-template'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add-provisioning-template'))
 
     @classmethod
     def add_ptable(cls, options=None):
@@ -64,9 +60,7 @@ class OperatingSys(Base):
         Adds existing partitioning table to OS.
         """
 
-        cls.command_sub = 'add-ptable'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='add-ptable'))
 
     @classmethod
     def remove_architecture(cls, options=None):
@@ -74,9 +68,7 @@ class OperatingSys(Base):
         Removes architecture from OS.
         """
 
-        cls.command_sub = 'remove-architecture'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='remove-architecture'))
 
     @classmethod
     def remove_provisioning_template(cls, options=None):
@@ -84,9 +76,9 @@ class OperatingSys(Base):
         Removes template from OS.
         """
 
-        cls.command_sub = 'remove-provisioning-template'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, command_sub='remove-provisioning-template')
+        )
 
     @classmethod
     def remove_ptable(cls, options=None):
@@ -94,6 +86,4 @@ class OperatingSys(Base):
         Removes partitioning table from OS.
         """
 
-        cls.command_sub = 'remove-ptable '
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='remove-ptable '))
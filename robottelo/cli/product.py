@@ -36,29 +36,28 @@ class Product(Base):
     @classmethod
     def remove_sync_plan(cls, options=None):
         """Delete assignment sync plan and product."""
-        cls.command_sub = 'remove-sync-plan'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='remove-sync-plan'))
 
     @classmethod
     def set_sync_plan(cls, options=None):
         """Assign sync plan to product."""
-        cls.command_sub = 'set-sync-plan'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='set-sync-plan'))
 
     @classmethod
     def synchronize(cls, options=None):
         """Synchronize a product."""
-        cls.command_sub = 'synchronize'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='synchronize'), ignore_stderr=True
+        )
 
     @classmethod
     def update_proxy(cls, options=None):
         """Assign Http Proxy to products."""
-        cls.command_sub = 'update-proxy'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='update-proxy'))
 
     @classmethod
     def verify_checksum(cls, options=None):
         """Verify checksum for one or more products."""
-        cls.command_sub = 'verify-checksum'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='verify-checksum'), ignore_stderr=True
+        )
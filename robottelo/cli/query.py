@@ -0,0 +1,74 @@
+"""Thin query builder over the list and info methods of the cli classes.
+
+Example::
+
+    hosts = (
+        sat.cli.Host.query()
+        .where(organization_id=org.id)
+        .search('os = RedHat')
+        .fields('Id', 'Name')
+        .list()
+    )
+
+Every method returns a new query, so a partial query can be reused.
+"""
+
+
+class Query:
+    """Options and fields of a list or info command of ``cli_class``
+
+    :param cli_class: a :class:`robottelo.cli.base.Base` subclass
+    :param options: initial options of the command
+    :param fields: field labels to fetch, all of them when empty
+    """
+
+    def __init__(self, cli_class, options=None, fields=()):
+        self.cli_class = cli_class
+        self.options = dict(options or {})
+        self.field_labels = tuple(fields)
+
+    def __repr__(self):
+        return f'<Query {self.cli_class.__name__} {self.options} fields={list(self.field_labels)}>'
+
+    def _derive(self, options=None, fields=()):
+        return Query(
+            self.cli_class, {**self.options, **(options or {})}, (*self.field_labels, *fields)
+        )
+
+    def where(self, **options):
+        """Add command options, underscores in their names stand for dashes"""
+        return self._derive({key.replace('_', '-'): value for key, value in options.items()})
+
+    def search(self, expression):
+        """Add a scoped search ``expression``, combined with the previous ones with ``and``"""
+        if previous := self.options.get('search'):
+            expression = f'({previous}) and ({expression})'
+        return self._derive({'search': expression})
+
+    def fields(self, *labels):
+        """Only fetch the fields with these labels, e.g. ``Id`` or ``Content view``"""
+        return self._derive(fields=labels)
+
+    def command_options(self):
+        """Return the options of the command, with the ``fields`` option when fields are set
+
+        Fields are passed as an option rather than with the ``fields`` argument, so queries also
+        work with the cli classes overriding ``list`` or ``info``.
+        """
+        return dict(self.cli_class._project(self.options, self.field_labels))
+
+    def list(self, **kwargs):
+        """Run the list command, ``kwargs`` are passed to ``cli_class.list``"""
+        return self.cli_class.list(self.command_options(), **kwargs)
+
+    def iter(self, per_page=1000):
+        """Lazily list the entities, see ``cli_class.iter_list``"""
+        return self.cli_class.iter_list(self.command_options(), per_page=per_page)
+
+    def first(self):
+        """Return the first listed entity, or None when there is none"""
+        return next(self.iter(per_page=1), None)
+
+    def info(self, **kwargs):
+        """Run the info command, ``kwargs`` are passed to ``cli_class.info``"""
+        return self.cli_class.info(self.command_options(), **kwargs)
@@ -0,0 +1,109 @@
+"""Lazily populated index of the robottelo cli classes.
+
+The modules of ``robottelo.cli`` are scanned once for their class definitions, without importing
+them. A module is imported the first time one of its classes is requested, and the host bound
+copy of a class, as exposed by ``Satellite.cli`` and ``Capsule.cli``, is made on first access and
+memoized per hostname.
+"""
+
+from functools import cache
+import importlib
+from pathlib import Path
+import re
+import threading
+
+from robottelo.cli.base import Base
+
+CLI_DIR = Path(__file__).parent
+_class_definition = re.compile(r'^class (\w+)\b', re.MULTILINE)
+
+
+@cache
+def class_modules():
+    """Map the name of every class defined in a ``robottelo.cli`` module to the module name"""
+    modules = {}
+    for file in sorted(CLI_DIR.glob('*.py')):
+        if not file.name.startswith('_'):
+            for name in _class_definition.findall(file.read_text()):
+                modules.setdefault(name, file.stem)
+    return modules
+
+
+def get_cli_class(name):
+    """Return the cli class ``name``, importing its module if needed
+
+    :raise KeyError: if no ``robottelo.cli`` module defines a ``Base`` subclass ``name``
+    """
+    obj = getattr(importlib.import_module(f'robottelo.cli.{class_modules()[name]}'), name)
+    if not (isinstance(obj, type) and issubclass(obj, Base)):
+        raise KeyError(name)
+    return obj
+
+
+class CLIRegistry:
+    """Namespace of the cli classes bound to the host ``hostname``
+
+    ``registry.Org`` is a subclass of ``robottelo.cli.org.Org`` with ``hostname`` as class
+    attribute, made on first access.
+
+    :param prefix: only expose the classes of the modules starting with ``prefix``, ``Base``
+        itself is always exposed
+    """
+
+    def __init__(self, hostname, prefix=''):
+        self._prefix = prefix
+        self._attributes = {'hostname': hostname}
+        self._classes = {}
+        self._lock = threading.Lock()
+        self._names = {
+            name
+            for name, module in class_modules().items()
+            if name == 'Base' or module.startswith(prefix)
+        }
+        # entity names as looked up by the cli factory, e.g. content_view for ContentView
+        self._lowercase_names = {name.lower(): name for name in self._names}
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._names:
+            raise AttributeError(f'{type(self).__name__} has no cli class {name}')
+        try:
+            cli_class = get_cli_class(name)
+        except KeyError:
+            raise AttributeError(f'{name} is not a cli class') from None
+        with self._lock:
+            if name not in self._classes:
+                self._classes[name] = type(name, (cli_class,), dict(self._attributes))
+                # later lookups find the class as a plain instance attribute
+                setattr(self, name, self._classes[name])
+        return self._classes[name]
+
+    def __dir__(self):
+        return sorted({*super().__dir__(), *self._names})
+
+    def find(self, entity_name):
+        """Return the cli class of ``entity_name``, e.g. ``content_view``, or None"""
+        name = self._lowercase_names.get(entity_name.replace('_', '').lower())
+        return None if name is None else getattr(self, name, None)
+
+    def set_class_attribute(self, name, value):
+        """Set the class attribute ``name`` of the cli classes, made ones and future ones"""
+        with self._lock:
+            self._attributes[name] = value
+            for cli_class in self._classes.values():
+                setattr(cli_class, name, value)
+
+    def execute_many(self, *args, **kwargs):
+        """Run several hammer commands in one ssh round trip, see ``Base.execute_many``"""
+        return self.Base.execute_many(*args, **kwargs)
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_cli_registry(hostname, prefix=''):
+    """Return the :class:`CLIRegistry` of ``hostname``, shared by all its host objects"""
+    with _registries_lock:
+        if (hostname, prefix) not in _registries:
+            _registries[(hostname, prefix)] = CLIRegistry(hostname, prefix)
+        return _registries[(hostname, prefix)]
@@ -35,33 +35,18 @@ class Repository(Base):
     @classmethod
     def create(cls, options=None, timeout=None):
         """Create a custom repository"""
-        cls.command_requires_org = False
-
-        try:
-            result = super().create(options, timeout)
-        finally:
-            cls.command_requires_org = True
-
-        return result
+        return super().create(options, timeout, requires_org=False)
 
     @classmethod
     def info(cls, options=None):
         """Show a custom repository"""
-        cls.command_requires_org = False
-
-        try:
-            result = super().info(options)
-        finally:
-            cls.command_requires_org = True
-
-        return result
+        return super().info(options, requires_org=False)
 
     @classmethod
     def synchronize(cls, options, return_raw_response=None, timeout=3600000):
         """Synchronizes a repository."""
-        cls.command_sub = 'synchronize'
         return cls.execute(
-            cls._construct_command(options),
+            cls._construct_command(options, command_sub='synchronize'),
             output_format='csv',
             ignore_stderr=True,
             return_raw_response=return_raw_response,
@@ -71,23 +56,33 @@ class Repository(Base):
     @classmethod
     def remove_content(cls, options):
         """Remove content from a repository"""
-        cls.command_sub = 'remove-content'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='remove-content'),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def upload_content(cls, options):
         """Upload content to repository."""
-        cls.command_sub = 'upload-content'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='upload-content'),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def reclaim_space(cls, options):
         """Remove disk space from a synced repository"""
-        cls.command_sub = 'reclaim-space'
-        return cls.execute(cls._construct_command(options), output_format='csv', ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='reclaim-space'),
+            output_format='csv',
+            ignore_stderr=True,
+        )
 
     @classmethod
     def verify_checksum(cls, options):
         """Verify checksum of repository contents."""
-        cls.command_sub = 'verify-checksum'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True)
+        return cls.execute(
+            cls._construct_command(options, command_sub='verify-checksum'), ignore_stderr=True
+        )
@@ -0,0 +1,107 @@
+"""Read-through cache of hammer ``info`` and ``list`` responses.
+
+Enabled with ``settings.performance.cli_cache.enabled``. Each Satellite gets its own cache of at
+most ``size`` responses, every response expiring ``ttl`` seconds after it was fetched. Any other
+hammer command (``create``, ``update``, ``delete``...) and any write of nailgun to the Satellite
+drop all its cached responses, as a write may change entities of other command bases too.
+"""
+
+from collections import OrderedDict
+import copy
+import threading
+import time
+
+from robottelo.config import settings
+
+READ_SUBCOMMANDS = frozenset(('info', 'list'))
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of parsed hammer responses with a time to live
+
+    :param ttl: seconds a response is served from the cache
+    :param size: maximum number of cached responses, the least recently used are evicted first
+    """
+
+    def __init__(self, ttl=60, size=1024):
+        self.ttl = ttl
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    @staticmethod
+    def key(command_base, command_sub, options=None, output_format=None, user=None):
+        """Build the cache key of a command, independent of the options order"""
+        options = tuple(sorted((name, str(value)) for name, value in (options or {}).items()))
+        return (command_base, command_sub, options, output_format, user)
+
+    def get(self, key):
+        """Return a copy of the cached response of ``key``
+
+        :raises KeyError: if ``key`` is not cached or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(self, key, response):
+        """Cache a copy of ``response`` under ``key``"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self):
+        """Drop every cached response"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self):
+        """Return the cache counters"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+            }
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(hostname):
+    """Return the response cache of ``hostname``, or None when caching is disabled"""
+    cache_settings = settings.performance.get('cli_cache', {})
+    if not cache_settings.get('enabled', False):
+        return None
+    with _caches_lock:
+        if hostname not in _caches:
+            from robottelo.host_helpers.api_registry import route_nailgun_requests
+
+            # nailgun writes to the Satellite drop its cached responses
+            route_nailgun_requests()
+            _caches[hostname] = ResponseCache(
+                ttl=cache_settings.get('ttl', 60), size=cache_settings.get('size', 1024)
+            )
+        return _caches[hostname]
+
+
+def invalidate_response_cache(hostname):
+    """Drop the cached responses of ``hostname``, if it has a response cache"""
+    with _caches_lock:
+        cache = _caches.get(hostname)
+    if cache is not None:
+        cache.invalidate()
@@ -28,5 +28,4 @@ class Scapcontent(Base):
     @classmethod
     def bulk_upload(cls, options=None):
         """Delete assignment sync plan and product."""
-        cls.command_sub = 'bulk-upload'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='bulk-upload'))
@@ -30,17 +30,26 @@ class SimpleContentAccess(Base):
     @classmethod
     def disable(cls, options=None, timeout=None):
         """Disable simple content access for a manifest"""
-        cls.command_sub = 'disable'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='disable'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def enable(cls, options=None, timeout=None):
         """Enable simple content access for a manifest"""
-        cls.command_sub = 'enable'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='enable'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def status(cls, options=None, timeout=None):
         """Check if the specified organization has Simple Content Access enabled"""
-        cls.command_sub = 'status'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='status'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
@@ -93,104 +93,100 @@ class Advanced(Base):
     @classmethod
     def run_service_restart(cls, options=None):
         """Build satellite-maintain advanced procedure run service-restart"""
-        cls.command_sub = 'service-restart'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='service-restart'))
 
     @classmethod
     def run_service_stop(cls, options=None):
         """Build satellite-maintain advanced procedure run service-stop"""
-        cls.command_sub = 'service-stop'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='service-stop'))
 
     @classmethod
     def run_service_start(cls, options=None):
         """Build satellite-maintain advanced procedure run service-start"""
-        cls.command_sub = 'service-start'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='service-start'))
 
     @classmethod
     def run_packages_install(cls, options=None):
         """Build satellite-maintain advanced procedure run packages-install"""
-        cls.command_sub = 'packages-install'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='packages-install'))
 
     @classmethod
     def run_packages_update(cls, options=None):
         """Build satellite-maintain advanced procedure run packages-update"""
-        cls.command_sub = 'packages-update'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='packages-update'))
 
     @classmethod
     def run_packages_check_update(cls, options=None):
         """Build satellite-maintain advanced procedure run packages-check-update"""
-        cls.command_sub = 'packages-check-update'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='packages-check-update'))
 
     @classmethod
     def run_disable_maintenance_mode(cls, options=None):
         """Build satellite-maintain advanced procedure run disable-maintenance-mode"""
-        cls.command_sub = 'disable-maintenance-mode'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='disable-maintenance-mode')
+        )
 
     @classmethod
     def run_enable_maintenance_mode(cls, options=None):
         """Build satellite-maintain advanced procedure run enable-maintenance-mode"""
-        cls.command_sub = 'enable-maintenance-mode'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='enable-maintenance-mode')
+        )
 
     @classmethod
     def run_foreman_tasks_delete(cls, options=None):
         """Build satellite-maintain advanced procedure run foreman-tasks-delete"""
-        cls.command_sub = 'foreman-tasks-delete'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='foreman-tasks-delete'))
 
     @classmethod
     def run_foreman_tasks_resume(cls, options=None):
         """Build satellite-maintain advanced procedure run foreman-tasks-resume"""
-        cls.command_sub = 'foreman-tasks-resume'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='foreman-tasks-resume'))
 
     @classmethod
     def run_sync_plans_enable(cls, options=None):
         """Build satellite-maintain advanced procedure run sync-plans-enable"""
-        cls.command_sub = 'sync-plans-enable'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='sync-plans-enable'))
 
     @classmethod
     def run_sync_plans_disable(cls, options=None):
         """Build satellite-maintain advanced procedure run sync-plans-disable"""
-        cls.command_sub = 'sync-plans-disable'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='sync-plans-disable'))
 
     @classmethod
     def run_foreman_tasks_ui_investigate(cls, options=None, env_var=''):
         """Build satellite-maintain advanced procedure run foreman-tasks-ui-investigate"""
-        cls.command_sub = 'foreman-tasks-ui-investigate'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='foreman-tasks-ui-investigate'),
+            env_var=env_var,
+        )
 
     @classmethod
     def run_hammer_setup(cls, options=None, env_var=''):
         """Build satellite-maintain advanced procedure run hammer-setup"""
-        cls.command_sub = 'hammer-setup'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='hammer-setup'), env_var=env_var
+        )
 
     @classmethod
     def run_repositories_setup(cls, options=None, env_var=''):
         """Build satellite-maintain advanced procedure run repositories-setup"""
-        cls.command_sub = 'repositories-setup'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(
+            cls._construct_command(options, command_sub='repositories-setup'), env_var=env_var
+        )
@@ -24,27 +24,23 @@ class MaintenanceMode(Base):
     @classmethod
     def start(cls, options=None):
         """satellite-maintain maintenance-mode start [OPTIONS]"""
-        cls.command_sub = 'start'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='start'))
 
     @classmethod
     def stop(cls, options=None):
         """satellite-maintain maintenance-mode stop [OPTIONS]"""
-        cls.command_sub = 'stop'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='stop'))
 
     @classmethod
     def status(cls, options=None):
         """satellite-maintain maintenance-mode status [OPTIONS]"""
-        cls.command_sub = 'status'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='status'))
 
     @classmethod
     def is_enabled(cls, options=None):
         """satellite-maintain maintenance-mode is-enabled [OPTIONS]"""
-        cls.command_sub = 'is-enabled'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options))
+        return cls.sm_execute(cls._construct_command(options, command_sub='is-enabled'))
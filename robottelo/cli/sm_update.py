@@ -25,13 +25,11 @@ class Update(Base):
     @classmethod
     def check(cls, options=None, env_var=None):
         """Build satellite-maintain update check"""
-        cls.command_sub = 'check'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='check'), env_var=env_var)
 
     @classmethod
     def run(cls, options=None, env_var=None):
         """Build satellite-maintain update run"""
-        cls.command_sub = 'run'
         options = options or {}
-        return cls.sm_execute(cls._construct_command(options), env_var=env_var)
+        return cls.sm_execute(cls._construct_command(options, command_sub='run'), env_var=env_var)
@@ -24,13 +24,9 @@ class Srpm(Base):
     @classmethod
     def info(cls, options=None):
         """Show a SRPM Info"""
-        cls.command_sub = 'info'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command(options, command_sub='info'), output_format='csv')
 
     @classmethod
     def list(cls, options=None):
         """List SRPMs"""
-        cls.command_sub = 'list'
-
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command(options, command_sub='list'), output_format='csv')
@@ -32,23 +32,35 @@ class Subscription(Base):
     @classmethod
     def upload(cls, options=None, timeout=None):
         """Upload a subscription manifest."""
-        cls.command_sub = 'upload'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='upload'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def delete_manifest(cls, options=None, timeout=None):
         """Deletes a subscription manifest."""
-        cls.command_sub = 'delete-manifest'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='delete-manifest'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def refresh_manifest(cls, options=None, timeout=None):
         """Refreshes a subscription manifest."""
-        cls.command_sub = 'refresh-manifest'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='refresh-manifest'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
 
     @classmethod
     def manifest_history(cls, options=None, timeout=None):
         """Provided history for subscription manifest"""
-        cls.command_sub = 'manifest-history'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        return cls.execute(
+            cls._construct_command(options, command_sub='manifest-history'),
+            ignore_stderr=True,
+            timeout=timeout,
+        )
@@ -29,8 +29,6 @@ class SyncPlan(Base):
     @classmethod
     def create(cls, options=None, timeout=None):
         """Create a SyncPlan"""
-        cls.command_sub = 'create'
-
         if options.get('interval') == 'custom cron' and options.get('cron-expression') is None:
             raise CLIError('Missing "cron-expression" option for "custom cron" interval.')
 
@@ -36,8 +36,10 @@ class Task(Base):
             --id ID                       UUID of the task
             --name NAME                   Name to search by
         """
-        cls.command_sub = 'progress'
-        return cls.execute(cls._construct_command(options), return_raw_response=return_raw_response)
+        return cls.execute(
+            cls._construct_command(options, command_sub='progress'),
+            return_raw_response=return_raw_response,
+        )
 
     @classmethod
     def resume(cls, options=None):
@@ -51,8 +53,7 @@ class Task(Base):
             --task-ids TASK_IDS           Comma separated list of values.
             --tasks TASK_NAMES            Comma separated list of values.
         """
-        cls.command_sub = 'resume'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_sub='resume'))
 
     @classmethod
     def list_tasks(cls, options=None):
@@ -64,5 +65,4 @@ class Task(Base):
         Options:
             --search SEARCH               List tasks matching search string
         """
-        cls.command_sub = 'list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(cls._construct_command(options, command_sub='list'), output_format='csv')
@@ -0,0 +1,109 @@
+"""Timing telemetry of hammer commands.
+
+With ``settings.performance.time_hammer`` enabled, ``Base.execute`` records one sample per hammer
+command into :data:`registry`, grouped by ``(command_base, command_sub)``:
+
+* ``client``: seconds from sending the command until its output was received
+* ``server``: seconds hammer itself ran on the Satellite, as measured by ``time -p``
+* ``bytes``: size of the command stdout and stderr
+* ``parse``: seconds spent parsing the command output
+
+The ``hammer_timings`` pytest plugin dumps the registry of each xdist worker at session end.
+"""
+
+from collections import defaultdict
+import csv
+import json
+import math
+import re
+import threading
+
+METRICS = ('client', 'server', 'bytes', 'parse')
+PERCENTILES = (50, 95, 99)
+_time_output = re.compile(r'(?:^|\n)real ([\d.]+)\nuser [\d.]+\nsys [\d.]+\n?$')
+
+
+def split_time_output(stderr):
+    """Split the ``time -p`` report from the end of a command ``stderr``
+
+    :return: a tuple of ``stderr`` without the report and the real time in seconds, or None
+        when ``stderr`` does not end with a report
+    """
+    if match := _time_output.search(stderr or ''):
+        return stderr[: match.start()], float(match.group(1))
+    return stderr, None
+
+
+def percentile(samples, percent):
+    """Return the nearest-rank ``percent`` percentile of sorted ``samples``"""
+    rank = max(math.ceil(percent / 100 * len(samples)), 1)
+    return samples[rank - 1]
+
+
+class TimingRegistry:
+    """Thread-safe registry of hammer command timing samples"""
+
+    def __init__(self):
+        self._samples = defaultdict(lambda: {metric: [] for metric in METRICS})
+        self._lock = threading.Lock()
+
+    def record(self, command_base, command_sub, **values):
+        """Record one sample of ``command_base command_sub``
+
+        :param values: the measured :data:`METRICS`, unmeasured ones are None or left out
+        """
+        with self._lock:
+            samples = self._samples[(command_base or '', command_sub or '')]
+            for metric in METRICS:
+                if values.get(metric) is not None:
+                    samples[metric].append(values[metric])
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        """Aggregate the samples of every command
+
+        :return: a dict mapping each command to the count, mean, max and percentiles of each
+            of its measured metrics
+        """
+        with self._lock:
+            samples = {
+                command: {m: sorted(v) for m, v in s.items()}
+                for command, s in self._samples.items()
+            }
+        summary = {}
+        for (command_base, command_sub), metrics in sorted(samples.items()):
+            summary[f'{command_base} {command_sub}'.strip()] = {
+                metric: {
+                    'count': len(values),
+                    'mean': sum(values) / len(values),
+                    'max': values[-1],
+                    **{f'p{p}': percentile(values, p) for p in PERCENTILES},
+                }
+                for metric, values in metrics.items()
+                if values
+            }
+        return summary
+
+    def dump(self, path):
+        """Write the summary to ``path`` with a ``.json`` and a ``.csv`` suffix
+
+        :param path: a :class:`pathlib.Path` without suffix
+        :return: the paths of the written json and csv files
+        """
+        summary = self.summary()
+        json_path, csv_path = path.with_suffix('.json'), path.with_suffix('.csv')
+        json_path.write_text(json.dumps(summary, indent=2))
+        fields = ['command', 'metric', 'count', 'mean', 'max', *(f'p{p}' for p in PERCENTILES)]
+        with csv_path.open('w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=fields)
+            writer.writeheader()
+            for command, metrics in summary.items():
+                for metric, stats in metrics.items():
+                    writer.writerow({'command': command, 'metric': metric, **stats})
+        return json_path, csv_path
+
+
+registry = TimingRegistry()
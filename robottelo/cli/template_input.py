@@ -32,12 +32,14 @@ class TemplateInput(Base):
         Creates a new record using the arguments passed via dictionary.
         """
 
-        cls.command_sub = 'create'
-
         if options is None:
             options = {}
 
-        result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
+        result = cls.execute(
+            cls._construct_command(options, command_sub='create'),
+            output_format='csv',
+            timeout=timeout,
+        )
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
@@ -49,13 +49,9 @@ class TemplateSync(Base):
     @classmethod
     def exports(cls, options=None):
         """Export Satellite Templates to Git/Local Directory."""
-        cls.command_base = 'export-templates'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_base='export-templates'))
 
     @classmethod
     def imports(cls, options=None):
         """Import Satellite Templates to Git/Local Directory."""
-        cls.command_base = 'import-templates'
-
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(cls._construct_command(options, command_base='import-templates'))
@@ -34,14 +34,16 @@ class User(Base):
     @classmethod
     def add_role(cls, options=None):
         """Add a role to a user."""
-        cls.command_sub = 'add-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='add-role'), output_format='csv'
+        )
 
     @classmethod
     def remove_role(cls, options=None):
         """Remove a role from user."""
-        cls.command_sub = 'remove-role'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='remove-role'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_add(cls, options=None):
@@ -63,8 +65,9 @@ class User(Base):
         --user-id USER_ID
 
         """
-        cls.command_sub = 'ssh-keys add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys add'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_delete(cls, options=None):
@@ -73,8 +76,9 @@ class User(Base):
         hammer user ssh-keys delete [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys delete'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys delete'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_list(cls, options=None):
@@ -83,8 +87,9 @@ class User(Base):
         hammer user ssh-keys list [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys list'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys list'), output_format='csv'
+        )
 
     @classmethod
     def ssh_keys_info(cls, options=None):
@@ -93,8 +98,9 @@ class User(Base):
         hammer user ssh-keys info [OPTIONS]
 
         """
-        cls.command_sub = 'ssh-keys info'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='ssh-keys info'), output_format='csv'
+        )
 
     @classmethod
     def access_token(cls, action=None, options=None):
@@ -104,8 +110,10 @@ class User(Base):
 
         action: create | revoke
         """
-        cls.command_sub = f'access-token {action}'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub=f'access-token {action}'),
+            output_format='csv',
+        )
 
     @classmethod
     def mail_notification_add(cls, options=None):
@@ -130,17 +138,21 @@ class User(Base):
             --user[-id] VALUE
 
         """
-        cls.command_sub = 'mail-notification add'
-        return cls.execute(cls._construct_command(options), output_format='csv')
+        return cls.execute(
+            cls._construct_command(options, command_sub='mail-notification add'),
+            output_format='csv',
+        )
 
     @classmethod
     def invalidate(cls, options=None):
         """Invalidate JWTs for a single user"""
-        cls.command_sub = 'registration-tokens invalidate'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, command_sub='registration-tokens invalidate')
+        )
 
     @classmethod
     def invalidate_multiple(cls, options=None):
         """Invalidate JWTs for multiple users"""
-        cls.command_sub = 'registration-tokens invalidate-multiple'
-        return cls.execute(cls._construct_command(options))
+        return cls.execute(
+            cls._construct_command(options, command_sub='registration-tokens invalidate-multiple')
+        )
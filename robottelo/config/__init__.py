@@ -1,4 +1,5 @@
 import builtins
+import contextvars
 import logging
 import os
 from pathlib import Path
@@ -50,6 +51,32 @@ robottelo_tmp_dir = Path(settings.robottelo.tmp_dir)
 robottelo_tmp_dir.mkdir(parents=True, exist_ok=True)
 
 
+# Satellites targeted by the current thread or asyncio task, innermost last
+_targeted_hostnames = contextvars.ContextVar('targeted_hostnames', default=())
+
+
+def get_server_hostname():
+    """Return the hostname of the Satellite targeted in the current context
+
+    This is the Satellite of the innermost ``with satellite:`` block of the current thread or
+    asyncio task, and the configured ``settings.server.hostname`` outside of these blocks. The
+    settings are never changed by these blocks, read the hostname with this function instead.
+    """
+    targeted = _targeted_hostnames.get()
+    return targeted[-1] if targeted else settings.server.get('hostname')
+
+
+def push_server_hostname(hostname):
+    """Target the Satellite ``hostname`` in the current context, until the matching pop"""
+    _targeted_hostnames.set((*_targeted_hostnames.get(), hostname))
+
+
+def pop_server_hostname():
+    """Stop targeting the Satellite of the last :func:`push_server_hostname` of this context"""
+    *targeted, _ = _targeted_hostnames.get()
+    _targeted_hostnames.set(tuple(targeted))
+
+
 def get_credentials():
     """Return credentials for interacting with a Foreman deployment API.
 
@@ -68,7 +95,7 @@ def get_url():
     The following values from the config file are used to build the URL:
 
     * ``[server] scheme`` (default: https)
-    * ``[server] hostname`` (required)
+    * ``[server] hostname`` (required), or the Satellite targeted in the current context
     * ``[server] port`` (default: none)
 
     Setting ``port`` to 80 does *not* imply that ``scheme`` is 'https'. If
@@ -79,7 +106,7 @@ def get_url():
     :rtype: str
 
     """
-    hostname = settings.server.get('hostname')
+    hostname = get_server_hostname()
     scheme = settings.server.scheme
     port = settings.server.port
     if port is not None:
@@ -146,6 +173,8 @@ def configure_nailgun():
         ``robottelo.entity_mixins.Entity`` for more information on the effects
         of this.
     * Set a default value for ``nailgun.entities.GPGKey.content``.
+    * Let entities created without a server config inside a ``with satellite:`` block use the
+        config of that Satellite, see :func:`get_server_hostname`.
     """
     from nailgun import entities, entity_mixins
     from nailgun.config import ServerConfig
@@ -154,6 +183,17 @@ def configure_nailgun():
     entity_mixins.DEFAULT_SERVER_CONFIG = ServerConfig(
         get_url(), get_credentials(), verify=settings.server.verify_ca
     )
+    entity_init = entity_mixins.Entity.__init__
+
+    def patched_entity_init(self, server_config=None, **kwargs):
+        """Default to the config of the Satellite targeted in the current context."""
+        if server_config is None and _targeted_hostnames.get():
+            server_config = admin_nailgun_config()
+        entity_init(self, server_config, **kwargs)
+
+    if not getattr(entity_init, 'targets_current_server', False):
+        patched_entity_init.targets_current_server = True
+        entity_mixins.Entity.__init__ = patched_entity_init
     gpgkey_init = entities.GPGKey.__init__
 
     def patched_gpgkey_init(self, server_config=None, **kwargs):
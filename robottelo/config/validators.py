@@ -36,6 +36,10 @@ VALIDATORS = dict(
         Validator('server.ssh_password', default=None),
         Validator('server.verify_ca', default=False),
         Validator('server.is_ipv6', is_type_of=bool, default=False),
+        Validator('server.ssh_client.pool_size', is_type_of=int, default=4),
+        Validator('server.ssh_client.pool_idle_timeout', is_type_of=int, default=300),
+        Validator('server.ssh_client.pool_keepalive', is_type_of=int, default=60),
+        Validator('server.ssh_client.channels', is_type_of=int, default=8),
     ],
     content_host=[
         Validator('content_host.default_rhel_version', must_exist=True),
@@ -289,7 +293,29 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
-    performance=[Validator('performance.time_hammer', default=False)],
+    performance=[
+        Validator('performance.time_hammer', default=False),
+        Validator('performance.hammer_backend', default='ssh', is_in=['ssh', 'shell']),
+        Validator('performance.cli_cache.enabled', is_type_of=bool, default=False),
+        Validator('performance.cli_cache.ttl', is_type_of=int, default=60),
+        Validator('performance.cli_cache.size', is_type_of=int, default=1024),
+        Validator('performance.async_workers', is_type_of=int, default=32),
+        Validator('performance.single_round_trip_create', is_type_of=bool, default=False),
+        Validator('performance.hammer_sessions.enabled', is_type_of=bool, default=False),
+        Validator('performance.hammer_sessions.idle_timeout', is_type_of=int, default=1800),
+        Validator(
+            'performance.hammer_command_tree.validate_options', is_type_of=bool, default=False
+        ),
+        Validator('performance.hammer_command_tree.cache_dir', default=None),
+        Validator('performance.json_info', is_type_of=bool, default=False),
+        Validator('performance.http_pool.enabled', is_type_of=bool, default=False),
+        Validator('performance.http_pool.size', is_type_of=int, default=10),
+        Validator('performance.http_pool.retries', is_type_of=int, default=3),
+        Validator('performance.http_pool.backoff_factor', is_type_of=(int, float), default=0.5),
+        Validator('performance.host_fingerprint.enabled', is_type_of=bool, default=False),
+        Validator('performance.host_fingerprint.max_age', is_type_of=(int, float), default=30),
+        Validator('performance.host_agent.enabled', is_type_of=bool, default=False),
+    ],
     report_portal=[
         Validator(
             'report_portal.portal_url',
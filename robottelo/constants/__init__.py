@@ -1019,6 +1019,7 @@ CUSTOM_PUPPET_MODULE_REPOS_VERSION = '-0.2.0.tar.gz'
 PULP_ARTIFACT_DIR = '/var/lib/pulp/media/artifact/'
 PULP_EXPORT_DIR = '/var/lib/pulp/exports/'
 PULP_IMPORT_DIR = '/var/lib/pulp/imports/'
+RHSM_FACTS_DIR = '/etc/rhsm/facts/'
 EXPORT_LIBRARY_NAME = 'Export-Library'
 SUPPORTED_REPO_CHECKSUMS = ['sha256', 'sha384', 'sha512']
 
@@ -0,0 +1,253 @@
+"""Resident helper agent on a host, as exposed by ``ContentHost.agent``.
+
+Helpers probing a host often run several commands back to back, each paying an ssh round trip.
+The agent is a small Python script uploaded once per host session, which stays resident behind
+a persistent ssh channel. Each request is sent to it as one JSON line and answered with one
+JSON line, and a ``batch`` request answers several requests in a single round trip::
+
+    size, digest, info = host.agent.batch(
+        [('stat', {'path': path}), ('hash', {'path': path}), ('run', {'command': f'file {path}'})]
+    )
+
+The helpers of the host classes only use the agent with
+``settings.performance.host_agent.enabled``. The persistent channel relies on the ssh2-python
+broker backend, which is broker's default.
+"""
+
+import json
+import threading
+
+from broker.helpers import Result, translate_timeout
+
+from robottelo.logging import logger
+
+AGENT_PATH = '/var/tmp/robottelo_agent.py'
+AGENT_LOG = '/var/tmp/robottelo_agent.log'
+RESPONSE_MARKER = '__robottelo_agent__'
+# seconds the ssh session waits for a response on top of the timeout of the request
+TIMEOUT_MARGIN = 10
+# python3 of the host, or the platform python of RHEL 8 hosts without python3
+PYTHON = '$(command -v python3 || echo /usr/libexec/platform-python)'
+
+# kept compatible with python 3.6, the platform python of RHEL 8
+AGENT = f"""\
+# Resident helper agent used by robottelo's ContentHost.agent.
+import base64
+import fnmatch
+import hashlib
+import json
+import os
+import stat
+import subprocess
+import sys
+
+
+def op_stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    kind = 'dir' if stat.S_ISDIR(st.st_mode) else 'file' if stat.S_ISREG(st.st_mode) else 'other'
+    return {{
+        'type': kind,
+        'size': st.st_size,
+        'mode': stat.S_IMODE(st.st_mode),
+        'uid': st.st_uid,
+        'gid': st.st_gid,
+        'mtime': st.st_mtime,
+    }}
+
+
+def op_hash(path, algorithm='sha256'):
+    digest = hashlib.new(algorithm)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def op_read(path, binary=False):
+    with open(path, 'rb') as file:
+        data = file.read()
+    return base64.b64encode(data).decode() if binary else data.decode('utf-8', 'replace')
+
+
+def op_list(path, pattern='*'):
+    return sorted(name for name in os.listdir(path) if fnmatch.fnmatch(name, pattern))
+
+
+def op_run(command, timeout=None):
+    done = subprocess.run(
+        command,
+        shell=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        timeout=timeout,
+    )
+    return {{
+        'status': done.returncode,
+        'stdout': done.stdout.decode('utf-8', 'replace'),
+        'stderr': done.stderr.decode('utf-8', 'replace'),
+    }}
+
+
+def op_batch(requests):
+    return [handle(request) for request in requests]
+
+
+OPS = {{
+    'stat': op_stat,
+    'hash': op_hash,
+    'read': op_read,
+    'list': op_list,
+    'run': op_run,
+    'batch': op_batch,
+}}
+
+
+def handle(request):
+    try:
+        return {{'ok': True, 'result': OPS[request['op']](**request.get('args', {{}}))}}
+    except Exception as err:
+        return {{'ok': False, 'error': '%s: %s' % (type(err).__name__, err)}}
+
+
+for line in sys.stdin:
+    response = json.dumps(handle(json.loads(line)))
+    sys.stdout.write('{RESPONSE_MARKER} ' + response + '\\n')
+    sys.stdout.flush()
+"""
+
+
+class AgentError(Exception):
+    """Indicates that an agent request failed, or that the agent is not usable anymore"""
+
+
+def _seconds(timeout):
+    """Return ``timeout`` in seconds, given in seconds or as a broker string like ``'10m'``"""
+    if isinstance(timeout, str):
+        return translate_timeout(timeout) / 1000
+    return timeout
+
+
+class HostAgent:
+    """Client of the resident helper agent of ``host``
+
+    The agent is started on first use, and started again when the host reconnected.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self._session = None
+        self._channel = None
+        self._buffer = b''
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Upload the agent and start it behind a persistent channel of the host session"""
+        result = self.host.execute(f"cat > {AGENT_PATH} <<'EOF'\n{AGENT}EOF")
+        if result.status != 0:
+            raise AgentError(f'Unable to upload the agent to {self.host.hostname}: {result.stderr}')
+        self._session = self.host.session
+        self._channel = self._session.shell()
+        self._channel.send(f'exec {PYTHON} -u {AGENT_PATH} 2>>{AGENT_LOG}')
+        logger.debug(f'Started resident helper agent on {self.host.hostname}')
+
+    def close(self):
+        """Stop the agent, closing its channel"""
+        if self._channel is not None:
+            try:
+                self._channel.close()
+            except Exception as err:
+                logger.debug(f'Error while closing the agent of {self.host.hostname}: {err}')
+        self._session = self._channel = None
+        self._buffer = b''
+
+    def _readline(self):
+        while b'\n' not in self._buffer:
+            size, data = self._channel.read()
+            if size <= 0:
+                raise AgentError(f'Resident helper agent on {self.host.hostname} exited')
+            self._buffer += data
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line.decode('utf-8', errors='replace')
+
+    def _send(self, request, timeout=None):
+        # the host session is shared with the commands of other threads, see ContentHost.execute
+        with self._lock, self.host._execute_lock:
+            try:
+                if self._channel is None or self._session is not self.host.session:
+                    self.close()
+                    self.start()
+                if hasattr(self._session, 'session'):
+                    # in milliseconds, 0 waits forever
+                    self._session.session.set_timeout(
+                        0 if timeout is None else round((timeout + TIMEOUT_MARGIN) * 1000)
+                    )
+                self._channel.send(json.dumps(request))
+                while not (line := self._readline()).startswith(RESPONSE_MARKER):
+                    logger.debug(f'agent on {self.host.hostname}: {line}')
+                return json.loads(line[len(RESPONSE_MARKER) :])
+            except Exception as err:
+                self.close()
+                raise AgentError(f'agent on {self.host.hostname} failed: {err}') from err
+
+    def _unwrap(self, op, response):
+        if not response['ok']:
+            raise AgentError(f'{op} failed on {self.host.hostname}: {response["error"]}')
+        return Result(**response['result']) if op == 'run' else response['result']
+
+    def request(self, op, timeout=None, **args):
+        """Send the request ``op`` with ``args`` and return its result
+
+        :param op: one of ``stat``, ``hash``, ``read``, ``list`` and ``run``
+        :param timeout: seconds to wait for the response, or a broker string like ``'10m'``
+        :raises AgentError: if the request failed
+        """
+        return self._unwrap(op, self._send({'op': op, 'args': args}, timeout=_seconds(timeout)))
+
+    def batch(self, requests, timeout=None, raise_on_error=True):
+        """Send several requests in a single round trip
+
+        :param requests: ``(op, args)`` tuples, the ``timeout`` of a ``run`` is in seconds
+        :param raise_on_error: raise the :class:`AgentError` of the first failed request, instead
+            of returning it in place of its result
+        :return: the results of the requests, in the same order
+        """
+        requests = [{'op': op, 'args': args} for op, args in requests]
+        responses = self.request('batch', timeout=timeout, requests=requests)
+        results = []
+        for request, response in zip(requests, responses, strict=True):
+            try:
+                results.append(self._unwrap(request['op'], response))
+            except AgentError as err:
+                if raise_on_error:
+                    raise
+                results.append(err)
+        return results
+
+    def stat(self, path):
+        """Return the type, size, mode, uid, gid and mtime of ``path``, None if it is missing"""
+        return self.request('stat', path=path)
+
+    def hash(self, path, algorithm='sha256'):
+        """Return the hex digest of the file ``path``"""
+        return self.request('hash', path=path, algorithm=algorithm)
+
+    def read(self, path):
+        """Return the text content of the file ``path``"""
+        return self.request('read', path=path)
+
+    def list(self, path, pattern='*'):
+        """Return the sorted names of the entries of the directory ``path`` matching ``pattern``"""
+        return self.request('list', path=path, pattern=pattern)
+
+    def run(self, command, timeout=None):
+        """Run the shell ``command`` and return its result, like ``ContentHost.execute``
+
+        :param timeout: seconds the command may run, or a broker string like ``'10m'``
+        """
+        timeout = _seconds(timeout)
+        request = {'op': 'run', 'args': {'command': command, 'timeout': timeout}}
+        return self._unwrap('run', self._send(request, timeout=timeout))
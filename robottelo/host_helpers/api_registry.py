@@ -0,0 +1,216 @@
+"""Lazily populated namespace of the nailgun entities, as exposed by ``Satellite.api``.
+
+An entity class with the nailgun server config of a Satellite injected is only made the first
+time the entity is accessed, and it is shared by every host object using the same config.
+
+With ``settings.performance.http_pool.enabled``, the requests nailgun sends to these Satellites go
+through a pooled keep-alive ``requests.Session`` per Satellite and credentials, instead of a new
+connection and TLS handshake per request.
+
+With ``settings.performance.cli_cache.enabled``, any request of nailgun that may write to a
+Satellite drops the hammer responses cached for it, see :mod:`robottelo.cli.response_cache`.
+"""
+
+import functools
+from http.cookiejar import DefaultCookiePolicy
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from robottelo.cli.response_cache import invalidate_response_cache
+from robottelo.config import settings
+
+# methods of the requests that do not change anything on the Satellite
+READ_METHODS = frozenset(('get', 'head', 'options'))
+
+
+class APIRegistry:
+    """Namespace of the nailgun entity classes bound to ``server_config``
+
+    ``registry.Organization`` is a subclass of ``nailgun.entities.Organization`` whose instances
+    use ``server_config`` unless they are given another one.
+
+    :param server_config: a ``nailgun.config.ServerConfig``
+    """
+
+    def __init__(self, server_config):
+        self.server_config = server_config
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # nailgun is imported here, so a nailgun swapped by Satellite._swap_nailgun is used
+        from nailgun import entities
+        from nailgun.entity_mixins import Entity
+
+        entity_cls = None if name.startswith('_') else getattr(entities, name, None)
+        if not (isinstance(entity_cls, type) and issubclass(entity_cls, Entity)):
+            raise AttributeError(f'{type(self).__name__} has no nailgun entity {name}')
+        with self._lock:
+            if name not in self.__dict__:
+                injected = type(
+                    name,
+                    (entity_cls,),
+                    {
+                        '__init__': functools.partialmethod(
+                            entity_cls.__init__, server_config=self.server_config
+                        )
+                    },
+                )
+                # later lookups find the class as a plain instance attribute
+                setattr(self, name, injected)
+        return self.__dict__[name]
+
+
+def make_http_session(pool_size=10, retries=3, backoff_factor=0.5):
+    """Return a keep-alive ``requests.Session``
+
+    :param pool_size: connections kept open, for concurrent requests
+    :param retries: retries of failed connections, and of idempotent requests answered with
+        a 502, 503 or 504 status
+    :param backoff_factor: seconds of the first retry backoff, doubled for each next one
+    """
+    session = requests.Session()
+    # like separate requests, do not carry the cookies of a response to the next request
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class SessionRouter:
+    """Stand-in of the ``requests`` module for ``nailgun.client``
+
+    Requests to the registered origins are sent over a pooled session per origin and
+    credentials, any other request is sent by the ``requests`` module as usual. Requests other
+    than reads drop the cached hammer responses of their host.
+    """
+
+    def __init__(self):
+        self._origins = set()
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # anything else nailgun uses from requests, e.g. its exceptions
+        return getattr(requests, name)
+
+    @staticmethod
+    def _origin(url):
+        parts = urlsplit(url)
+        return f'{parts.scheme}://{parts.netloc}'
+
+    def register(self, url):
+        """Send the requests to the origin of ``url`` over pooled sessions"""
+        with self._lock:
+            self._origins.add(self._origin(url))
+
+    def session(self, url, auth=None):
+        """Return the session of ``url`` and ``auth``, or None when its origin is not registered"""
+        origin = self._origin(url)
+        if origin not in self._origins:
+            return None
+        key = (origin, tuple(auth) if isinstance(auth, list | tuple) else auth)
+        with self._lock:
+            if key not in self._sessions:
+                pool = settings.performance.http_pool
+                self._sessions[key] = make_http_session(
+                    pool_size=pool.size, retries=pool.retries, backoff_factor=pool.backoff_factor
+                )
+            return self._sessions[key]
+
+    def close(self):
+        """Close the pooled connections and forget the registered origins"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._origins.clear()
+
+    def request(self, method, url, **kwargs):
+        try:
+            return (self.session(url, kwargs.get('auth')) or requests).request(
+                method, url, **kwargs
+            )
+        finally:
+            if method.lower() not in READ_METHODS:
+                invalidate_response_cache(urlsplit(url).hostname)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('head', url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('get', url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('post', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('put', url, data=data, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('patch', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('delete', url, **kwargs)
+
+
+session_router = SessionRouter()
+
+
+def route_nailgun_requests():
+    """Send the requests of nailgun through :data:`session_router`"""
+    from nailgun import client
+
+    # nailgun calls the functions of the requests module it imported
+    client.requests = session_router
+
+
+def pool_http_sessions(url):
+    """Send the nailgun requests to the Satellite at ``url`` over pooled sessions"""
+    session_router.register(url)
+    route_nailgun_requests()
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_api_registry(url, auth, verify):
+    """Return the :class:`APIRegistry` of the Satellite at ``url``, shared by its host objects
+
+    :param auth: the ``(username, password)`` of the nailgun server config
+    :param verify: the ``verify`` of the nailgun server config
+    """
+    key = (url, tuple(auth), verify)
+    if settings.performance.http_pool.enabled:
+        pool_http_sessions(url)
+    elif settings.performance.cli_cache.enabled:
+        # e.g. nailgun was reinstalled, see Satellite._swap_nailgun
+        route_nailgun_requests()
+    with _registries_lock:
+        if key not in _registries:
+            from nailgun.config import ServerConfig
+
+            _registries[key] = APIRegistry(ServerConfig(auth=auth, url=url, verify=verify))
+        return _registries[key]
+
+
+def clear_api_registries():
+    """Forget the registries and pooled sessions, e.g. after nailgun was reinstalled"""
+    with _registries_lock:
+        _registries.clear()
+    session_router.close()
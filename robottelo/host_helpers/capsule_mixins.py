@@ -166,7 +166,7 @@ class CapsuleInfo:
         query = f'find {PULP_ARTIFACT_DIR} -type f'
         if since:
             query = f'{query} -newermt "{since}"'
-        return self.execute(query).stdout.splitlines()
+        return list(self.stream(query).stdout_lines())
 
     def get_artifact_info(self, checksum=None, path=None):
         """Returns information about pulp artifact if found on FS,
@@ -182,12 +182,32 @@ class CapsuleInfo:
         if not path:
             path = f'{PULP_ARTIFACT_DIR}{checksum[0:2]}/{checksum[2:]}'
 
-        res = self.execute(f'stat --format %s {path}')
-        if res.status:
-            raise FileNotFoundError(f'Artifact not found: {path}')
-        size = int(res.stdout)
-        real_sum = self.execute(f'sha256sum {path}').stdout.split()[0]
-        info = self.execute(f'file {path}').stdout.strip().split(': ')[1]
+        if settings.performance.host_agent.enabled:
+            # the probes are answered by the agent in a single round trip
+            stat, real_sum, info_res = self.agent.batch(
+                [
+                    ('stat', {'path': path}),
+                    ('hash', {'path': path}),
+                    ('run', {'command': f'file {path}'}),
+                ],
+                raise_on_error=False,
+            )
+            if stat is None or isinstance(stat, Exception):
+                raise FileNotFoundError(f'Artifact not found: {path}')
+            for result in (real_sum, info_res):
+                if isinstance(result, Exception):
+                    raise result
+            size = stat['size']
+        else:
+            # the probes run concurrently over the channels of one ssh connection
+            res, sum_res, info_res = self.channels.execute_many(
+                [f'stat --format %s {path}', f'sha256sum {path}', f'file {path}']
+            )
+            if res.status:
+                raise FileNotFoundError(f'Artifact not found: {path}')
+            size = int(res.stdout)
+            real_sum = sum_res.stdout.split()[0]
+        info = info_res.stdout.strip().split(': ')[1]
 
         return Box(path=path, size=size, sum=real_sum, info=info)
 
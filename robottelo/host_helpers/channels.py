@@ -0,0 +1,162 @@
+"""Concurrent commands over one ssh connection to a host, as exposed by ``ContentHost.channels``.
+
+A :class:`ChannelPool` opens a single authenticated ssh connection to its host, and runs every
+command on its own channel of that connection. Threads can run commands concurrently without
+opening a connection each, up to ``settings.server.ssh_client.channels`` channels at once::
+
+    size, digest, info = host.channels.execute_many(
+        [f'stat --format %s {path}', f'sha256sum {path}', f'file {path}']
+    )
+
+libssh2 sessions are not thread safe, so the connection is used in non-blocking mode and every
+libssh2 call is made under a lock, which is released while a thread waits for its channel.
+The pool relies on the ssh2-python broker backend, which is broker's default. With another
+backend, the commands run one after the other with ``host.execute``.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import select
+import threading
+import time
+
+from broker.helpers import Result
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+from ssh2.session import LIBSSH2_SESSION_BLOCK_INBOUND, LIBSSH2_SESSION_BLOCK_OUTBOUND
+
+from robottelo.config import settings
+from robottelo.logging import logger
+
+_CHUNK_SIZE = 65536
+# seconds a waiting thread sleeps at most, the data of its channel may have been received
+# by a libssh2 call of another thread
+_POLL_INTERVAL = 0.05
+
+
+class ChannelPool:
+    """Bounded pool of concurrent channels over one ssh connection to ``host``
+
+    :param host: a ``ContentHost``, whose credentials are used to connect
+    :param size: concurrent channels, ``settings.server.ssh_client.channels`` by default. Keep
+        it below the ``MaxSessions`` of the sshd of the host, 10 by default.
+    """
+
+    def __init__(self, host, size=None):
+        self.host = host
+        self.size = size or settings.server.ssh_client.get('channels', 8)
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def _connect(self):
+        """Return the broker session of the pool, connecting it on first use"""
+        with self._lock:
+            if self._connection is None:
+                from broker.session import Session
+
+                host = self.host
+                self._connection = Session(
+                    hostname=host.hostname,
+                    username=host.username,
+                    password=host.password,
+                    port=host.port or 22,
+                    key_filename=host.key_filename,
+                    timeout=host.timeout,
+                    ipv6=host.ipv6,
+                    ipv4_fallback=getattr(host, 'ipv4_fallback', True),
+                )
+                self._connection.session.set_blocking(False)
+                logger.debug(f'Opened multiplexed ssh connection to {host.hostname}')
+            return self._connection
+
+    def _multiplexed(self):
+        """Whether the host uses the ssh2-python backend, whose connections are multiplexed"""
+        session = self.host.session
+        return hasattr(session, 'sock') and hasattr(session, 'session')
+
+    def close(self):
+        """Close the connection of the pool, the next command connects again"""
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._connection.session.set_blocking(True)
+                    self._connection.disconnect()
+                except Exception as err:
+                    logger.debug(f'Error while closing ssh channels of {self.host.hostname}: {err}')
+                self._connection = None
+
+    def _wait(self, connection, deadline, command):
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f'{command!r} did not end in time on {self.host.hostname}')
+        with self._lock:
+            directions = connection.session.block_directions()
+        readable = [connection.sock] if directions & LIBSSH2_SESSION_BLOCK_INBOUND else []
+        writable = [connection.sock] if directions & LIBSSH2_SESSION_BLOCK_OUTBOUND else []
+        select.select(readable, writable, [], _POLL_INTERVAL)
+
+    def _call(self, connection, deadline, command, func, *args):
+        """Call the libssh2 ``func`` under the lock until it does not return EAGAIN"""
+        while True:
+            with self._lock:
+                value = func(*args)
+            if value != LIBSSH2_ERROR_EAGAIN:
+                return value
+            self._wait(connection, deadline, command)
+
+    def _read(self, connection, deadline, command, channel):
+        """Read the stdout and stderr of ``channel`` until its end"""
+        output = {channel.read: b'', channel.read_stderr: b''}
+        while True:
+            with self._lock:
+                received = False
+                for read in output:
+                    size, data = read(_CHUNK_SIZE)
+                    while size > 0:
+                        output[read] += data
+                        received = True
+                        size, data = read(_CHUNK_SIZE)
+                ended = channel.eof() and not received
+            if ended:
+                return (data.decode('utf-8', errors='replace') for data in output.values())
+            if not received:
+                self._wait(connection, deadline, command)
+
+    def execute(self, command, timeout=None):
+        """Run ``command`` on its own channel, blocking while all the channels are busy
+
+        :param timeout: seconds the command may run
+        :return: a result with ``stdout``, ``stderr`` and ``status``, like
+            ``ContentHost.execute``
+        """
+        if not self._multiplexed():
+            # broker reads a bare number as milliseconds
+            return self.host.execute(
+                command, timeout=None if timeout is None else round(timeout * 1000)
+            )
+        with self._slots:
+            connection = self._connect()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            channel = self._call(connection, deadline, command, connection.session.open_session)
+            try:
+                self._call(connection, deadline, command, channel.execute, command)
+                stdout, stderr = self._read(connection, deadline, command, channel)
+            finally:
+                self._call(connection, None, command, channel.close)
+            self._call(connection, deadline, command, channel.wait_closed)
+            with self._lock:
+                status = channel.get_exit_status()
+        return Result(stdout=stdout, stderr=stderr, status=status)
+
+    def execute_many(self, commands, timeout=None):
+        """Run ``commands`` concurrently, each on its own channel
+
+        :return: the results of the commands, in the same order
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+        if not self._multiplexed():
+            return [self.execute(command, timeout) for command in commands]
+        with ThreadPoolExecutor(
+            max_workers=min(self.size, len(commands)), thread_name_prefix='robottelo-channels'
+        ) as executor:
+            return list(executor.map(lambda command: self.execute(command, timeout), commands))
@@ -4,8 +4,10 @@ It is not meant to be used directly, but as part of a robottelo.hosts.Satellite
 example: my_satellite.cli_factory.make_org()
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import datetime
-from functools import lru_cache, partial
+from functools import partial
 import inspect
 import os
 from os import chmod
@@ -26,10 +28,10 @@ from fauxfactory import (
     gen_url,
 )
 
-from robottelo import constants
+from robottelo import constants, ssh
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
-from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
+from robottelo.exceptions import CLIBaseError, CLIFactoryError, CLIReturnCodeError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
 
 
@@ -296,13 +298,66 @@ class CLIFactory:
             }
         return None
 
-    @lru_cache
     def _find_entity_class(self, entity_name):
-        entity_name = entity_name.replace('_', '').lower()
-        for name, class_obj in self._satellite.cli.__dict__.items():
-            if entity_name == name.lower():
-                return class_obj
-        return None
+        return self._satellite.cli.find(entity_name)
+
+    def make_batch(self, items, workers=None, raise_on_error=True):
+        """Create several entities concurrently
+
+        The make method of every item is looked up first, which generates the default values of
+        its ``ENTITY_FIELDS``. The entities are then created by at most ``workers`` concurrent
+        hammer commands.
+
+        :param items: a list of ``(entity, options)`` tuples, ``entity`` naming a make method,
+            e.g. ``('user', {'admin': 'true'})`` runs ``make_user({'admin': 'true'})``
+        :param workers: maximum number of concurrent creations, the ssh connection pool size
+            by default
+        :param raise_on_error: when ``False``, the exception of a failed creation is returned in
+            its place instead of raising a ``CLIFactoryError`` listing every failure once all the
+            items were processed.
+        :return: a list with the created entity of each item, in the order of ``items``
+        """
+        makers = [
+            (getattr(self, f'make_{entity}'), dict(options or {})) for entity, options in items
+        ]
+        if not makers:
+            return []
+
+        def make(maker):
+            method, options = maker
+            try:
+                return method(options)
+            except (CLIFactoryError, CLIBaseError) as err:
+                return err
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers or ssh.connection_pool.size, len(makers))
+        ) as executor:
+            # the creations target the Satellite, with the credentials, of the caller context
+            futures = [
+                executor.submit(contextvars.copy_context().run, make, maker) for maker in makers
+            ]
+            results = [future.result() for future in futures]
+        errors = [
+            f'{index} {items[index][0]}: {result}'
+            for index, result in enumerate(results)
+            if isinstance(result, Exception)
+        ]
+        if errors and raise_on_error:
+            raise CLIFactoryError(
+                f'{len(errors)} of {len(items)} entities could not be created:\n'
+                + '\n'.join(errors)
+            )
+        return results
+
+    def make_many(self, entity, count, options=None, workers=None, raise_on_error=True):
+        """Create ``count`` entities with the same ``options``, see :meth:`make_batch`
+
+        Example: ``sat.cli_factory.make_many('user', 100, {'organization-ids': org.id})``
+        """
+        return self.make_batch(
+            [(entity, options)] * count, workers=workers, raise_on_error=raise_on_error
+        )
 
     def make_content_credential(self, options=None):
         """Creates a content credential.
@@ -2,7 +2,8 @@
 
 from functools import cached_property
 import json
-from tempfile import NamedTemporaryFile
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from robottelo import constants
 from robottelo.config import robottelo_tmp_dir, settings
@@ -175,22 +176,47 @@ class SystemFacts:
 
     def _get_custom_facts(self, filename=None):
         """get a dictionary of custom facts on the system"""
+        if settings.performance.host_agent.enabled:
+            return self._get_custom_facts_from_agent(filename)
         if isinstance(filename, list):
             all_facts = {}
             for fname in filename:
                 all_facts.update(self._get_custom_facts(fname))
         if filename is None:
-            filenames = self._get_dir_list('/etc/rhsm/facts/', '*.facts')
-            filename = [fname.replace('/etc/rhsm/facts/', '') for fname in filenames]
+            filenames = self._get_dir_list(constants.RHSM_FACTS_DIR, '*.facts')
+            filename = [fname.replace(constants.RHSM_FACTS_DIR, '') for fname in filenames]
         if isinstance(filename, str):
-            result = self.execute(f'cat /etc/rhsm/facts/{filename}')
+            result = self.execute(f'cat {constants.RHSM_FACTS_DIR}{filename}')
             if result.status == 0:
                 return {filename: json.loads(result.stdout)}
         return {}
 
+    def _get_custom_facts_from_agent(self, filename=None):
+        """get a dictionary of custom facts on the system, listed and read by the agent
+
+        All the facts files are read in a single round trip.
+        """
+        facts_dir = constants.RHSM_FACTS_DIR
+        if filename is None:
+            (filename,) = self.agent.batch(
+                [('list', {'path': facts_dir, 'pattern': '*.facts'})], raise_on_error=False
+            )
+            if isinstance(filename, Exception):
+                return {}
+        filenames = [filename] if isinstance(filename, str) else filename
+        contents = self.agent.batch(
+            [('read', {'path': f'{facts_dir}{fname}'}) for fname in filenames],
+            raise_on_error=False,
+        )
+        return {
+            fname: json.loads(content)
+            for fname, content in zip(filenames, contents, strict=True)
+            if not isinstance(content, Exception)
+        }
+
     def get_facts(self):
         """Get a dictionary representation of all subscription-manager facts"""
-        result = self.execute('subscription-manager facts')
+        result = self._probe('facts')
         fact_dict, last_key = {}, None
         if result.status == 0:
             for line in result.stdout.splitlines():
@@ -214,8 +240,9 @@ class SystemFacts:
         if '.facts' not in k:
             # if not, then wrap it all under a custom.facts key
             facts_dict = {'custom.facts': facts_dict}
-        for filename, facts in facts_dict.items():
-            with NamedTemporaryFile('w+', dir=robottelo_tmp_dir) as tf:
-                json.dump(facts, tf)
-                tf.flush()
-                self.put(tf.name, f'/etc/rhsm/facts/{filename}')
+        # all the files are sent in a single round trip
+        with TemporaryDirectory(dir=robottelo_tmp_dir) as facts_dir:
+            for filename, facts in facts_dict.items():
+                Path(facts_dir, filename).write_text(json.dumps(facts))
+            self.bulk_put(facts_dir, constants.RHSM_FACTS_DIR, skip_unchanged=False)
+        self.invalidate_fingerprint('facts')
@@ -58,14 +58,15 @@ class ContentInfo:
         """
         if not repo_path.endswith('/'):
             repo_path += '/'
-        result = self.execute(
-            f"find {repo_path} -name '*.{extension}' | awk -F/ '{{print $NF}}'",
-        )
-        if result.status != 0:
-            raise CLIReturnCodeError(result.status, result.stderr, f'No .{extension} found')
+        stream = self.stream(f"find {repo_path} -name '*.{extension}' | awk -F/ '{{print $NF}}'")
         # strip empty lines and sort alphabetically (as order may be wrong because
         # of different paths)
-        return sorted(repo_file for repo_file in result.stdout.splitlines() if repo_file)
+        repo_files = sorted(repo_file for repo_file in stream.stdout_lines() if repo_file)
+        if stream.result.status != 0:
+            raise CLIReturnCodeError(
+                stream.result.status, stream.result.stderr, f'No .{extension} found'
+            )
+        return repo_files
 
     def get_repo_files_by_url(self, url, extension='rpm'):
         """Returns a list of repo files (for example rpms) in a specific repository
@@ -248,7 +249,8 @@ class SystemInfo:
                 f'got {type(port_pool_range)} instead'
             )
         # returns a list of strings
-        ss_cmd = self.execute(
+        run = self.agent.run if settings.performance.host_agent.enabled else self.execute
+        ss_cmd = run(
             f"ss -tnaH sport ge {port_pool[0]} sport le {port_pool[-1]}"
             " | awk '{n=split($4, p, \":\"); print p[n]}' | sort -u"
         )
@@ -0,0 +1,194 @@
+"""Streaming execution of commands on a host, as exposed by ``ContentHost.stream``.
+
+``ContentHost.execute`` returns once the command ended, with its whole output buffered. A
+:class:`CommandStream` yields the stdout and stderr lines of the command as they arrive instead,
+calls optional callbacks for each line, and only keeps the last lines of each stream in memory::
+
+    with host.stream('satellite-maintain backup offline /backup', on_stdout=logger.info) as stream:
+        for source, line in stream:
+            ...
+    assert stream.result.status == 0
+
+Lines are read from the ssh2-python channel of the host session, which is broker's default
+backend. With another backend, the command runs through ``execute`` and its lines are only
+yielded once it ended.
+"""
+
+from collections import deque
+import select
+import time
+
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+from ssh2.session import LIBSSH2_SESSION_BLOCK_INBOUND, LIBSSH2_SESSION_BLOCK_OUTBOUND
+
+from robottelo.logging import logger
+
+# lines of each stream kept by default for the result of a stream
+MAX_LINES = 1000
+_CHUNK_SIZE = 65536
+
+
+class StreamResult:
+    """Result of a streamed command, like the result of ``ContentHost.execute``
+
+    ``stdout`` and ``stderr`` only hold the last lines of each stream, see ``dropped``.
+    """
+
+    def __init__(self, status, stdout_lines, stderr_lines, dropped):
+        self.status = status
+        self.stdout = ''.join(f'{line}\n' for line in stdout_lines)
+        self.stderr = ''.join(f'{line}\n' for line in stderr_lines)
+        # number of lines of each stream not kept in stdout and stderr
+        self.dropped = dropped
+
+    def __repr__(self):
+        return f'<StreamResult status={self.status} dropped={self.dropped}>'
+
+
+class CommandStream:
+    """Iterator over the ``(source, line)`` of a command run on ``host``
+
+    ``source`` is ``'stdout'`` or ``'stderr'`` and ``line`` has no line ending. Once the
+    iteration ended, :attr:`result` holds the exit status and the last lines of each stream.
+
+    :param timeout: seconds the command may run, a ``TimeoutError`` is raised by the iteration
+        when it runs longer
+    :param on_stdout: callable called with every stdout line, as it arrives
+    :param on_stderr: callable called with every stderr line, as it arrives
+    :param max_lines: lines of each stream kept for :attr:`result`
+    """
+
+    def __init__(
+        self, host, command, timeout=None, on_stdout=None, on_stderr=None, max_lines=MAX_LINES
+    ):
+        self.host = host
+        self.command = command
+        self.timeout = timeout
+        self.result = None
+        self._callbacks = {'stdout': on_stdout, 'stderr': on_stderr}
+        self._tails = {'stdout': deque(maxlen=max_lines), 'stderr': deque(maxlen=max_lines)}
+        self._counts = {'stdout': 0, 'stderr': 0}
+        self._lines = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_args):
+        self.close()
+
+    def __iter__(self):
+        if self._lines is None:
+            self._lines = self._run()
+        return self._lines
+
+    def stdout_lines(self):
+        """Iterate over the stdout lines only"""
+        return (line for source, line in self if source == 'stdout')
+
+    def wait(self):
+        """Consume the remaining lines, return :attr:`result`"""
+        for _ in self:
+            pass
+        return self.result
+
+    def close(self):
+        """Stop the iteration, closing the channel of a command still running"""
+        if self._lines is not None:
+            self._lines.close()
+
+    def _line(self, source, line):
+        self._counts[source] += 1
+        self._tails[source].append(line)
+        if self._callbacks[source]:
+            self._callbacks[source](line)
+        return source, line
+
+    def _finish(self, status):
+        dropped = {name: self._counts[name] - len(tail) for name, tail in self._tails.items()}
+        self.result = StreamResult(status, self._tails['stdout'], self._tails['stderr'], dropped)
+
+    def _run(self):
+        logger.debug(f'{self.host.hostname} streaming command: {self.command}')
+        session = self.host.session
+        if not (hasattr(session, 'sock') and hasattr(session, 'session')):
+            yield from self._run_buffered()
+            return
+        ssh_session, sock = session.session, session.sock
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        # the host session is shared with the commands of other threads, which ContentHost.execute
+        # runs under the host lock, the stream only uses it under that lock, released between lines
+        lock = self.host._execute_lock
+        with lock:
+            channel = ssh_session.open_session()
+            channel.execute(self.command)
+        pending = {'stdout': b'', 'stderr': b''}
+        readers = {'stdout': channel.read, 'stderr': channel.read_stderr}
+        ended = False
+        try:
+            while True:
+                self._check_deadline(deadline)
+                # only read in non-blocking mode, the host session stays usable between lines
+                with lock:
+                    ssh_session.set_blocking(False)
+                    try:
+                        received = False
+                        for source, read in readers.items():
+                            size, data = read(_CHUNK_SIZE)
+                            # the size is LIBSSH2_ERROR_EAGAIN when no data is available yet
+                            while size > 0:
+                                pending[source] += data
+                                received = True
+                                size, data = read(_CHUNK_SIZE)
+                            if size < 0 and size != LIBSSH2_ERROR_EAGAIN:
+                                raise ConnectionError(
+                                    f'Reading the {source} of {self.command!r} on '
+                                    f'{self.host.hostname} failed with libssh2 error {size}'
+                                )
+                        eof = channel.eof() and not received
+                    finally:
+                        ssh_session.set_blocking(True)
+                for source in readers:
+                    *lines, pending[source] = pending[source].split(b'\n')
+                    for line in lines:
+                        yield self._line(source, line.decode('utf-8', errors='replace'))
+                if eof:
+                    break
+                if not received:
+                    self._wait_socket(ssh_session, sock, deadline)
+            ended = True
+            for source, rest in pending.items():
+                if rest:
+                    yield self._line(source, rest.decode('utf-8', errors='replace'))
+        finally:
+            with lock:
+                channel.close()
+                # the channel of a command stopped early is not waited for, it may not end
+                if ended:
+                    channel.wait_closed()
+        with lock:
+            status = channel.get_exit_status()
+        self._finish(status)
+
+    def _check_deadline(self, deadline):
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(
+                f'{self.command!r} did not end in {self.timeout} seconds on {self.host.hostname}'
+            )
+
+    @staticmethod
+    def _wait_socket(ssh_session, sock, deadline):
+        """Wait for the session socket to be ready in the directions libssh2 blocked on"""
+        timeout = 1 if deadline is None else min(max(deadline - time.monotonic(), 0), 1)
+        directions = ssh_session.block_directions()
+        readable = [sock] if directions & LIBSSH2_SESSION_BLOCK_INBOUND or not directions else []
+        writable = [sock] if directions & LIBSSH2_SESSION_BLOCK_OUTBOUND else []
+        select.select(readable, writable, [], timeout)
+
+    def _run_buffered(self):
+        """Run the command through ``execute``, for the sessions of other ssh backends"""
+        kwargs = {} if self.timeout is None else {'timeout': int(self.timeout * 1000)}
+        result = self.host.execute(self.command, **kwargs)
+        for source in ('stdout', 'stderr'):
+            for line in (getattr(result, source) or '').splitlines():
+                yield self._line(source, line)
+        self._finish(result.status)
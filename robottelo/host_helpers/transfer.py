@@ -0,0 +1,266 @@
+"""Bulk file transfers to and from a host, as exposed by ``ContentHost.bulk_put`` and ``bulk_get``.
+
+Instead of one sftp round trip per file, the files are packed into a gzip compressed tar stream,
+piped over a single ssh channel and unpacked on the other end. The sha256 digests of the files
+on the receiving end are compared beforehand, so files already there with the same content are
+skipped, and checked afterwards, so a corrupted transfer raises.
+
+The tar stream goes over a channel of the ssh2-python host session, which is broker's default
+backend. With another backend, the archive is written to a temporary file and sent with sftp.
+"""
+
+import hashlib
+import io
+import os
+from pathlib import Path, PurePosixPath
+import shlex
+import tarfile
+import tempfile
+import uuid
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import logger
+
+_CHUNK_SIZE = 65536
+
+
+class TransferError(Exception):
+    """Indicates that a bulk transfer failed or that the transferred files are corrupted"""
+
+
+def file_digest(path):
+    """Return the sha256 hex digest of the local file ``path``"""
+    with open(path, 'rb') as file:
+        return hashlib.file_digest(file, 'sha256').hexdigest()
+
+
+def parse_digests(output):
+    """Parse the output of ``sha256sum`` into a dict of the digests keyed by relative path"""
+    digests = {}
+    for line in output.splitlines():
+        digest, _, name = line.partition('  ')
+        if name:
+            digests[str(PurePosixPath(name))] = digest
+    return digests
+
+
+def local_files(local_paths):
+    """Map the archive name of every file of ``local_paths`` to its local path
+
+    :param local_paths: a directory, whose content is mapped relative to it, or a list of files
+        and directories, mapped under their own name
+    """
+    if isinstance(local_paths, str | os.PathLike) and Path(local_paths).is_dir():
+        roots = [(Path(local_paths), None)]
+    elif isinstance(local_paths, str | os.PathLike):
+        roots = [(Path(local_paths), Path(local_paths).name)]
+    else:
+        roots = [(Path(path), Path(path).name) for path in local_paths]
+    files = {}
+    for path, name in roots:
+        if path.is_dir():
+            for file in sorted(p for p in path.rglob('*') if p.is_file()):
+                relative = file.relative_to(path).as_posix()
+                files[f'{name}/{relative}' if name else relative] = file
+        elif path.is_file():
+            files[name] = path
+        else:
+            raise FileNotFoundError(f'No such file or directory: {path}')
+    return files
+
+
+def remote_digests(host, remote_dir, names=None):
+    """Return the digests of the files of ``remote_dir``, or of ``names`` in it, that exist"""
+    quoted_dir = shlex.quote(str(remote_dir))
+    if names is None:
+        command = f'cd {quoted_dir} && find . -type f -exec sha256sum {{}} +'
+    elif names:
+        command = f'cd {quoted_dir} && sha256sum -- {" ".join(map(shlex.quote, names))}'
+    else:
+        return {}
+    return parse_digests(host.execute(f'{command} 2>/dev/null').stdout)
+
+
+def _ssh2_session(host):
+    """Return the ssh2-python session of ``host``, None with another ssh backend"""
+    session = host.session
+    return session.session if hasattr(session, 'sock') and hasattr(session, 'session') else None
+
+
+def _read_stderr(channel):
+    data = b''
+    size, chunk = channel.read_stderr()
+    while size > 0:
+        data += chunk
+        size, chunk = channel.read_stderr()
+    return data.decode('utf-8', errors='replace')
+
+
+class _ChannelWriter(io.RawIOBase):
+    """Write only file object sending what is written to the stdin of an ssh2 channel"""
+
+    def __init__(self, channel):
+        self.channel = channel
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            _, written = self.channel.write(bytes(view[:_CHUNK_SIZE]))
+            view = view[written:]
+        return len(data)
+
+
+class _ChannelReader(io.RawIOBase):
+    """Read only file object reading the stdout of an ssh2 channel"""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.buffer = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        if not self.buffer:
+            size, self.buffer = self.channel.read(_CHUNK_SIZE)
+            if size <= 0:
+                self.buffer = b''
+                return 0
+        count = min(len(target), len(self.buffer))
+        target[:count] = self.buffer[:count]
+        self.buffer = self.buffer[count:]
+        return count
+
+
+def _pack(fileobj, files):
+    with tarfile.open(fileobj=fileobj, mode='w|gz') as archive:
+        for name, path in files.items():
+            archive.add(path, arcname=name, recursive=False)
+
+
+def bulk_put(host, local_paths, remote_dir, skip_unchanged=True):
+    """Upload files into ``remote_dir`` of ``host`` as one compressed tar stream
+
+    :param local_paths: a directory, whose content is uploaded into ``remote_dir``, or a list of
+        files and directories, uploaded into ``remote_dir`` under their own name
+    :param skip_unchanged: do not upload the files already in ``remote_dir`` with the same
+        sha256 digest
+    :return: the relative paths of the uploaded files
+    :raises TransferError: if unpacking failed, or if a digest differs once uploaded
+    """
+    files = local_files(local_paths)
+    digests = {name: file_digest(path) for name, path in files.items()}
+    if skip_unchanged:
+        existing = remote_digests(host, remote_dir, list(files))
+        files = {name: path for name, path in files.items() if existing.get(name) != digests[name]}
+    if not files:
+        logger.debug(f'{host.hostname}:{remote_dir} is up to date, nothing to upload')
+        return []
+    quoted_dir = shlex.quote(str(remote_dir))
+    names = ' '.join(map(shlex.quote, files))
+    checksum = f'cd {quoted_dir} && sha256sum -- {names}'
+    session = _ssh2_session(host)
+    if session is None:
+        with tempfile.NamedTemporaryFile(dir=robottelo_tmp_dir, suffix='.tar.gz') as archive:
+            _pack(archive, files)
+            archive.flush()
+            remote_archive = f'/var/tmp/robottelo-transfer-{uuid.uuid4().hex}.tar.gz'
+            host.put(archive.name, remote_archive)
+        result = host.execute(
+            f'mkdir -p {quoted_dir} && tar --no-same-owner --no-same-permissions -xzf {remote_archive} -C {quoted_dir}; '
+            f'status=$?; rm -f {remote_archive}; [ $status -eq 0 ] && {checksum}'
+        )
+        status, stdout, stderr = result.status, result.stdout, result.stderr
+    else:
+        channel = session.open_session()
+        channel.execute(
+            f'mkdir -p {quoted_dir} && tar --no-same-owner --no-same-permissions -xzf - -C {quoted_dir} && {checksum}'
+        )
+        with _ChannelWriter(channel) as writer:
+            _pack(writer, files)
+        channel.send_eof()
+        with _ChannelReader(channel) as reader:
+            stdout = reader.read().decode('utf-8', errors='replace')
+        stderr = _read_stderr(channel)
+        channel.close()
+        channel.wait_closed()
+        status = channel.get_exit_status()
+    if status != 0:
+        raise TransferError(f'Unable to unpack files into {host.hostname}:{remote_dir}: {stderr}')
+    received = parse_digests(stdout)
+    if corrupted := [name for name in files if received.get(name) != digests[name]]:
+        raise TransferError(f'Corrupted upload to {host.hostname}:{remote_dir}: {corrupted}')
+    logger.debug(f'Uploaded {len(files)} files to {host.hostname}:{remote_dir}')
+    return list(files)
+
+
+def bulk_get(host, remote_dir, local_dir, names=None, skip_unchanged=True):
+    """Download files of ``remote_dir`` of ``host`` into ``local_dir`` as one compressed tar stream
+
+    :param names: paths of the files to download, relative to ``remote_dir``, all of its files
+        by default
+    :param skip_unchanged: do not download the files already in ``local_dir`` with the same
+        sha256 digest
+    :return: the relative paths of the downloaded files
+    :raises TransferError: if packing failed, or if a digest differs once downloaded
+    """
+    local_dir = Path(local_dir)
+    digests = remote_digests(host, remote_dir, names)
+    if names is not None and (missing := set(map(str, map(PurePosixPath, names))) - set(digests)):
+        raise FileNotFoundError(f'No such files in {host.hostname}:{remote_dir}: {missing}')
+    wanted = [
+        name
+        for name, digest in digests.items()
+        if not (
+            skip_unchanged
+            and (local_dir / name).is_file()
+            and file_digest(local_dir / name) == digest
+        )
+    ]
+    if not wanted:
+        logger.debug(f'{local_dir} is up to date, nothing to download')
+        return []
+    local_dir.mkdir(parents=True, exist_ok=True)
+    quoted_dir = shlex.quote(str(remote_dir))
+    pack = f'tar -czf - -C {quoted_dir} -- {" ".join(map(shlex.quote, wanted))}'
+    session = _ssh2_session(host)
+    if session is None:
+        remote_archive = f'/var/tmp/robottelo-transfer-{uuid.uuid4().hex}.tar.gz'
+        result = host.execute(f'{pack} > {remote_archive}')
+        if result.status != 0:
+            host.execute(f'rm -f {remote_archive}')
+            raise TransferError(f'Unable to pack {host.hostname}:{remote_dir}: {result.stderr}')
+        with tempfile.NamedTemporaryFile(dir=robottelo_tmp_dir, suffix='.tar.gz') as archive:
+            host.get(remote_archive, archive.name)
+            host.execute(f'rm -f {remote_archive}')
+            with tarfile.open(archive.name, mode='r:gz') as tar:
+                tar.extractall(local_dir, filter='data')
+    else:
+        channel = session.open_session()
+        # tar warnings are dropped, the stderr of the channel is not read while unpacking
+        channel.execute(f'{pack} 2>/dev/null')
+        with _ChannelReader(channel) as reader:
+            try:
+                with tarfile.open(fileobj=reader, mode='r|gz') as tar:
+                    tar.extractall(local_dir, filter='data')
+            except tarfile.TarError as err:
+                raise TransferError(
+                    f'Unable to unpack {host.hostname}:{remote_dir}: {err}'
+                ) from err
+            finally:
+                channel.close()
+        channel.wait_closed()
+        if channel.get_exit_status() != 0:
+            raise TransferError(f'Unable to pack {host.hostname}:{remote_dir}')
+    corrupted = [
+        name
+        for name in wanted
+        if not (local_dir / name).is_file() or file_digest(local_dir / name) != digests[name]
+    ]
+    if corrupted:
+        raise TransferError(f'Corrupted download from {host.hostname}:{remote_dir}: {corrupted}')
+    logger.debug(f'Downloaded {len(wanted)} files from {host.hostname}:{remote_dir}')
+    return wanted
@@ -1,21 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor, wait
 from configparser import ConfigParser
 import contextlib
 from contextlib import contextmanager
+import contextvars
 from datetime import UTC, datetime
 from functools import cached_property, lru_cache
-import importlib
 import io
 import json
 from pathlib import Path, PurePath
 import random
 import re
 from tempfile import NamedTemporaryFile
+import threading
 import time
 from urllib.parse import urljoin, urlparse, urlunsplit
 
 import apypie
 from box import Box
 from broker import Broker
+from broker.helpers import Result
 from broker.hosts import Host
 from dynaconf.vendor.box.exceptions import BoxKeyError
 from fauxfactory import gen_alpha, gen_string
@@ -29,10 +32,13 @@ from wrapanapi.entities.vm import VmState
 import yaml
 
 from robottelo import constants
-from robottelo.cli.base import Base
+from robottelo.cli.base import credentials_omitted
+from robottelo.cli.registry import get_cli_registry
+from robottelo.cli.response_cache import get_response_cache
 from robottelo.config import (
-    configure_airgun,
-    configure_nailgun,
+    get_server_hostname,
+    pop_server_hostname,
+    push_server_hostname,
     robottelo_tmp_dir,
     settings,
 )
@@ -51,9 +57,14 @@ from robottelo.constants import (
     SM_OVERALL_STATUS,
 )
 from robottelo.exceptions import CLIFactoryError, DownloadFileError, HostPingFailed
-from robottelo.host_helpers import CapsuleMixins, ContentHostMixins, SatelliteMixins
+from robottelo.host_helpers import CapsuleMixins, ContentHostMixins, SatelliteMixins, transfer
+from robottelo.host_helpers.agent import HostAgent
+from robottelo.host_helpers.api_registry import clear_api_registries, get_api_registry
+from robottelo.host_helpers.channels import ChannelPool
+from robottelo.host_helpers.stream import MAX_LINES, CommandStream
 from robottelo.logging import logger
 from robottelo.utils import validate_ssh_pub_key
+from robottelo.utils.aio import AsyncCLI, run_blocking
 from robottelo.utils.datafactory import valid_emails_list
 from robottelo.utils.installer import InstallerCommand
 
@@ -106,6 +117,38 @@ def get_sat_rhel_version():
     return Version(rhel_version)
 
 
+# commands of the sections of the host fingerprint, see ContentHost.fingerprint
+FINGERPRINT_SECTIONS = {
+    'os_release': 'cat /etc/os-release',
+    'redhat_release': 'cat /etc/redhat-release',
+    'uname': 'uname -m',
+    'ip': 'hostname -I',
+    'rhsm_status': 'subscription-manager status',
+    'identity': 'subscription-manager identity',
+    'rhsm_conf': 'cat /etc/rhsm/rhsm.conf',
+    'facts': 'subscription-manager facts',
+}
+# sections that do not change during the life of a host, kept until invalidated
+STATIC_FINGERPRINT_SECTIONS = ('os_release', 'redhat_release', 'uname')
+SUBSCRIPTION_FINGERPRINT_SECTIONS = ('rhsm_status', 'identity', 'rhsm_conf', 'facts')
+# sections fetched together when one of them is needed, subscription-manager facts is slow
+_fingerprint_groups = (
+    STATIC_FINGERPRINT_SECTIONS,
+    ('ip', 'rhsm_status', 'identity', 'rhsm_conf'),
+    ('facts',),
+)
+# cached properties computed from the static sections
+_fingerprint_properties = ('_os_release', '_redhat_release', 'arch', 'is_el')
+_fingerprint_marker = re.compile(r'\n@@robottelo-fingerprint (\w+) (\d+)\n')
+
+
+def _config_parser(config):
+    """Return the ini formatted ``config`` text as a ConfigParser object"""
+    cp = ConfigParser()
+    cp.read_file(io.StringIO(config))
+    return cp
+
+
 class ContentHostError(Exception):
     pass
 
@@ -148,6 +191,14 @@ class ContentHost(Host, ContentHostMixins):
         self._satellite = kwargs.get('satellite')
         self.ipv6 = kwargs.get('ipv6', settings.server.is_ipv6)
         self.blank = kwargs.get('blank', False)
+        # serializes the use of the host session, see execute
+        self._execute_lock = threading.RLock()
+        # fingerprint section name: (result, monotonic time it was fetched at)
+        self._fingerprint = {}
+        # concurrent commands over one more ssh connection, only opened on first use
+        self.channels = ChannelPool(self)
+        # resident helper agent, only uploaded and started on first use
+        self.agent = HostAgent(self)
         super().__init__(hostname=hostname, **kwargs)
 
     @classmethod
@@ -204,43 +255,138 @@ class ContentHost(Host, ContentHostMixins):
         logger.warning(f'Host {self.hostname} not registered to {self.satellite.hostname}')
         return None
 
+    def fingerprint(self, sections=None, max_age=None):
+        """Fetch sections of the host fingerprint in a single ssh round trip
+
+        The fingerprint gathers the output of the commands of ``FINGERPRINT_SECTIONS``, e.g.
+        os-release, ``hostname -I`` and the subscription identity. The host properties, like
+        ``os_version``, ``identity`` or ``subscribed``, are computed from it, see
+        :meth:`invalidate_fingerprint` and ``settings.performance.host_fingerprint``.
+
+        :param sections: names of the sections to return, all of them by default
+        :param max_age: fetch again the sections fetched more than ``max_age`` seconds ago, by
+            default only the sections never fetched are fetched
+        :return: a dict of the ``execute`` result of each section, without its stderr
+        """
+        sections = list(sections or FINGERPRINT_SECTIONS)
+        now = time.monotonic()
+        stale = [
+            name
+            for name in sections
+            if name not in self._fingerprint
+            or (max_age is not None and now - self._fingerprint[name][1] >= max_age)
+        ]
+        if stale:
+            script = ''.join(
+                f'{FINGERPRINT_SECTIONS[name]} 2>/dev/null; '
+                f'printf "\\n@@robottelo-fingerprint {name} %s\\n" $?; '
+                for name in stale
+            )
+            result = self.execute(script)
+            parts = _fingerprint_marker.split(result.stdout)
+            fetched = time.monotonic()
+            for output, name, status in zip(parts[0::3], parts[1::3], parts[2::3], strict=False):
+                self._fingerprint[name] = (
+                    Result(stdout=output, stderr='', status=int(status)),
+                    fetched,
+                )
+            if missing := [name for name in stale if name not in self._fingerprint]:
+                raise ContentHostError(
+                    f'Fingerprint of {self.hostname} misses {", ".join(missing)}: {result.stderr}'
+                )
+        return {name: self._fingerprint[name][0] for name in sections}
+
+    def fingerprint_ages(self):
+        """Seconds since each fetched section of the host fingerprint was fetched"""
+        now = time.monotonic()
+        return {name: now - fetched for name, (_, fetched) in self._fingerprint.items()}
+
+    def invalidate_fingerprint(self, *sections):
+        """Forget the given sections of the host fingerprint, all of them by default
+
+        Forgetting a static section, like os_release, also forgets the cached properties
+        computed from the static sections.
+        """
+        for name in sections or list(self._fingerprint):
+            self._fingerprint.pop(name, None)
+        if not sections or set(sections) & set(STATIC_FINGERPRINT_SECTIONS):
+            for name in _fingerprint_properties:
+                self.__dict__.pop(name, None)
+
+    def _probe(self, section):
+        """Return the ``execute`` result of a fingerprint section
+
+        Static sections are fetched once. The others are only taken from the fingerprint with
+        ``settings.performance.host_fingerprint.enabled``, until they are older than its
+        ``max_age``, and run on every call otherwise.
+        """
+        max_age = None
+        if section not in STATIC_FINGERPRINT_SECTIONS:
+            if not settings.performance.host_fingerprint.enabled:
+                return self.execute(FINGERPRINT_SECTIONS[section])
+            max_age = settings.performance.host_fingerprint.max_age
+        group = next(group for group in _fingerprint_groups if section in group)
+        return self.fingerprint(group, max_age=max_age)[section]
+
+    def _probe_many(self, *sections):
+        """Return the ``execute`` results of several fingerprint sections, like ``_probe``
+
+        With ``settings.performance.host_agent.enabled``, the sections run on every call are sent
+        to the agent of the host in a single round trip.
+        """
+        live = {}
+        if settings.performance.host_agent.enabled and not (
+            settings.performance.host_fingerprint.enabled
+        ):
+            names = [name for name in sections if name not in STATIC_FINGERPRINT_SECTIONS]
+            requests = [('run', {'command': FINGERPRINT_SECTIONS[name]}) for name in names]
+            live = dict(zip(names, self.agent.batch(requests), strict=True))
+        return [live[name] if name in live else self._probe(name) for name in sections]
+
     @property
     def subscribed(self):
         """Boolean representation of a content host's subscription status"""
-        return 'Overall Status: Unknown' not in self.execute('subscription-manager status').stdout
+        return 'Overall Status: Unknown' not in self._probe('rhsm_status').stdout
 
     @property
     def identity(self):
         """A Dictionary containing RHSM identity attributes of the host"""
-        id_output = self.execute('subscription-manager identity').stdout
+        # the config is only needed once registered, unless the agent reads it in the same round trip
+        sections = ['identity']
+        if settings.performance.host_agent.enabled:
+            sections.append('rhsm_conf')
+        identity, *rhsm_conf = self._probe_many(*sections)
+        id_output = identity.stdout
         id_dict = {}
         if id_output:
             id_dict = {
                 i.split(':')[0].replace(' ', '_'): i.split(': ')[1]
                 for i in id_output.split('\n')[:-1]
             }
-            regged_to = self.subscription_config['server']['hostname']
+            rhsm_conf = rhsm_conf[0] if rhsm_conf else self._probe('rhsm_conf')
+            regged_to = _config_parser(rhsm_conf.stdout)['server']['hostname']
             if regged_to:
                 id_dict['registered_to'] = regged_to
         return id_dict
 
     @property
     def ip_addr(self):
-        ipv4, *ipv6 = self.execute('hostname -I').stdout.split()
+        ipv4, *ipv6 = self._probe('ip').stdout.split()
         return ipv4
 
     @cached_property
     def arch(self):
-        return self.get_facts().get('lscpu.architecture') or self.execute('uname -m').stdout.strip()
+        # what subscription-manager reports as lscpu.architecture, without its slow facts
+        return self._probe('uname').stdout.strip()
 
     @cached_property
     def _redhat_release(self):
         """Process redhat-release file for distro and version information
         This is a fallback for when /etc/os-release is not available
         """
-        result = self.execute('cat /etc/redhat-release')
+        result = self._probe('redhat_release')
         if result.status != 0:
-            raise ContentHostError(f'Not able to cat /etc/redhat-release "{result.stderr}"')
+            raise ContentHostError(f'Not able to cat /etc/redhat-release on {self.hostname}')
         match = re.match(r'(?P<NAME>.+) release (?P<major>\d+)(.(?P<minor>\d+))?', result.stdout)
         if match is None:
             raise ContentHostError(f'Not able to parse release string "{result.stdout}"')
@@ -268,10 +414,10 @@ class ContentHost(Host, ContentHostMixins):
         """Process os-release file for distro and version information"""
         facts = {}
         regex = r'^(["\'])(.*)(\1)$'
-        result = self.execute('cat /etc/os-release')
+        result = self._probe('os_release')
         if result.status != 0:
             logger.info(
-                f'Not able to cat /etc/os-release "{result.stderr}", '
+                f'Not able to cat /etc/os-release on {self.hostname}, '
                 'falling back to /etc/redhat-release'
             )
             return self._redhat_release
@@ -305,7 +451,7 @@ class ContentHost(Host, ContentHostMixins):
     @cached_property
     def is_el(self):
         """Boolean representation of whether this host is an EL host"""
-        return self.execute('stat /etc/redhat-release').status == 0
+        return self._probe('redhat_release').status == 0
 
     @property
     def is_rhel(self):
@@ -332,11 +478,59 @@ class ContentHost(Host, ContentHostMixins):
         return {name: getattr(self, name) for name in self.list_cached_properties()}
 
     def clean_cached_properties(self):
-        """Delete all cached properties for this class"""
+        """Delete all cached properties for this class, and the host fingerprint"""
+        self.invalidate_fingerprint()
         for name in self.list_cached_properties():
             with contextlib.suppress(KeyError):  # ignore if property is not cached
                 del self.__dict__[name]
 
+    def execute(self, command, timeout=None):
+        """Run ``command`` on the host session, see ``broker.hosts.Host.execute``
+
+        The session is shared with :meth:`stream` and :attr:`agent`, which read from it between
+        commands, so the command runs under the host lock.
+        """
+        with self._execute_lock:
+            return super().execute(command, timeout=timeout)
+
+    async def aexecute(self, command, timeout=None):
+        """Awaitable ``execute``, running in the :mod:`robottelo.utils.aio` thread pool
+
+        Commands awaited concurrently on the same host run one at a time on its ssh session,
+        commands on different hosts overlap.
+        """
+
+        def execute():
+            with self._execute_lock:
+                return self.execute(command, timeout=timeout)
+
+        return await run_blocking(execute)
+
+    def stream(self, command, timeout=None, on_stdout=None, on_stderr=None, max_lines=MAX_LINES):
+        """Run ``command`` and iterate over its ``(source, line)`` as they arrive
+
+        Long or verbose commands, like ``satellite-installer`` or ``find /var/lib/pulp``, can
+        be followed and processed line by line, without buffering their whole output::
+
+            stream = host.stream('dnf -y update', on_stdout=logger.info)
+            assert stream.wait().status == 0
+
+        :param timeout: seconds the command may run
+        :param on_stdout: callable called with every stdout line
+        :param on_stderr: callable called with every stderr line
+        :param max_lines: last lines of each stream kept in the result
+        :return: a :class:`robottelo.host_helpers.stream.CommandStream`, its ``result`` has the
+            exit status once the iteration ended
+        """
+        return CommandStream(
+            self,
+            command,
+            timeout=timeout,
+            on_stdout=on_stdout,
+            on_stderr=on_stderr,
+            max_lines=max_lines,
+        )
+
     def setup(self):
         logger.debug('START: setting up host %s', self)
         if not self.blank:
@@ -542,10 +736,7 @@ class ContentHost(Host, ContentHostMixins):
     @property
     def subscription_config(self):
         "Returns subscription config for the host as ConfigParser object"
-        config = self.execute('cat /etc/rhsm/rhsm.conf').stdout
-        cp = ConfigParser()
-        cp.read_file(io.StringIO(config))
-        return cp
+        return _config_parser(self._probe('rhsm_conf').stdout)
 
     def create_custom_repos(self, **kwargs):
         """Create custom repofiles.
@@ -605,6 +796,7 @@ class ContentHost(Host, ContentHostMixins):
         """
         self.execute(r'\cp -f /etc/rhsm/rhsm.conf{.bak,}')
         self.execute('subscription-manager clean')
+        self.invalidate_fingerprint(*SUBSCRIPTION_FINGERPRINT_SECTIONS)
         self._satellite = None
 
     def install_cockpit(self):
@@ -726,6 +918,7 @@ class ContentHost(Host, ContentHostMixins):
                 raise CLIFactoryError(f'User {auth_username} doesn\'t exist')
         else:
             cmd = target.satellite.cli.HostRegistration.generate_command(options)
+        self.invalidate_fingerprint(*SUBSCRIPTION_FINGERPRINT_SECTIONS)
         return self.execute(cmd.strip('\n'))
 
     def api_register(self, target, **kwargs):
@@ -738,6 +931,7 @@ class ContentHost(Host, ContentHostMixins):
         kwargs['insecure'] = kwargs.get('insecure', True)
         self._satellite = target.satellite
         command = target.satellite.api.RegistrationCommand(**kwargs).create()
+        self.invalidate_fingerprint(*SUBSCRIPTION_FINGERPRINT_SECTIONS)
         return self.execute(command.strip('\n'))
 
     def register_contenthost(
@@ -814,6 +1008,7 @@ class ContentHost(Host, ContentHostMixins):
         if baseurl:
             cmd += f' --baseurl {baseurl}'
 
+        self.invalidate_fingerprint(*SUBSCRIPTION_FINGERPRINT_SECTIONS)
         return self.execute(cmd)
 
     def unregister(self):
@@ -823,6 +1018,7 @@ class ContentHost(Host, ContentHostMixins):
             unregistration.
 
         """
+        self.invalidate_fingerprint(*SUBSCRIPTION_FINGERPRINT_SECTIONS)
         return self.execute('subscription-manager unregister')
 
     def get(self, remote_path, local_path=None):
@@ -847,6 +1043,34 @@ class ContentHost(Host, ContentHostMixins):
         else:
             self.session.sftp_write(source=str(local_path), destination=str(remote_path))
 
+    def close(self):
+        """Close the ssh connections to the host, including the one of ``channels``"""
+        self.agent.close()
+        self.channels.close()
+        super().close()
+
+    def bulk_put(self, local_paths, remote_dir, skip_unchanged=True):
+        """Upload a directory, or a list of files and directories, into ``remote_dir``
+
+        The files are sent as one compressed tar stream instead of one sftp round trip per
+        file, see :func:`robottelo.host_helpers.transfer.bulk_put`.
+
+        :return: the relative paths of the uploaded files, without the skipped unchanged ones
+        """
+        return transfer.bulk_put(self, local_paths, remote_dir, skip_unchanged=skip_unchanged)
+
+    def bulk_get(self, remote_dir, local_dir, names=None, skip_unchanged=True):
+        """Download the files of ``remote_dir``, or its files ``names``, into ``local_dir``
+
+        The files are received as one compressed tar stream instead of one sftp round trip per
+        file, see :func:`robottelo.host_helpers.transfer.bulk_get`.
+
+        :return: the relative paths of the downloaded files, without the skipped unchanged ones
+        """
+        return transfer.bulk_get(
+            self, remote_dir, local_dir, names=names, skip_unchanged=skip_unchanged
+        )
+
     def put_ssh_key(self, source_key_path, destination_key_name):
         """Copy ssh key to virtual machine ssh path and ensure proper permission is set
 
@@ -999,7 +1223,7 @@ class ContentHost(Host, ContentHostMixins):
         :raises robottelo.hosts.ContentHostError: If installation or configuration fails.
         """
         if proxy_hostname is None:
-            proxy_hostname = settings.server.hostname
+            proxy_hostname = get_server_hostname()
 
         if install_puppet_agent7:
             self.create_custom_repos(
@@ -1198,6 +1422,7 @@ class ContentHost(Host, ContentHostMixins):
 
         # Update subscription manager facts
         self.execute('subscription-manager facts --update')
+        self.invalidate_fingerprint('facts')
 
     def patch_os_release_version(self, distro='rhel7'):
         """Patch VM OS release version.
@@ -1540,6 +1765,168 @@ class ContentHost(Host, ContentHostMixins):
     def get_yggdrasil_service_name(self):
         return 'yggdrasil' if (self.os_version.major > 9) else 'yggdrasild'
 
+    @staticmethod
+    def execute_many(hosts, command, timeout=None, **kwargs):
+        """Run ``command`` on every host of ``hosts`` concurrently, see :class:`HostFanout`
+
+        :return: a :class:`HostResults` of the ``execute`` results, keyed by hostname
+        """
+        return HostFanout(hosts, timeout=timeout).execute(command, **kwargs)
+
+
+class HostResults(dict):
+    """Results of a :class:`HostFanout` call, keyed by hostname
+
+    The value of a host whose call raised is the exception, including a ``TimeoutError``
+    when the host did not answer in time.
+    """
+
+    @property
+    def errors(self):
+        """The exceptions raised by the hosts, keyed by hostname"""
+        return {name: value for name, value in self.items() if isinstance(value, Exception)}
+
+    @property
+    def failed(self):
+        """Hostnames whose call raised, or whose command exited with a non-zero status"""
+        return [
+            name
+            for name, value in self.items()
+            if isinstance(value, Exception) or getattr(value, 'status', 0) != 0
+        ]
+
+    def raise_for_errors(self):
+        """Raise a :class:`ContentHostError` listing the hosts whose call raised"""
+        if errors := self.errors:
+            details = '\n'.join(f'{name}: {error!r}' for name, error in errors.items())
+            raise ContentHostError(f'{len(errors)} of {len(self)} hosts failed:\n{details}')
+        return self
+
+
+class HostFanout:
+    """Run the same call on several hosts concurrently
+
+    Every host runs in its own thread, up to ``workers`` at once, and a failing or hanging
+    host does not affect the others::
+
+        fanout = HostFanout(content_hosts, timeout=600)
+        fanout.map(lambda host: host.register(org, None, ak.name, target_sat))
+        results = fanout.execute('subscription-manager identity')
+
+    :param hosts: ``ContentHost`` objects, with distinct hostnames
+    :param workers: concurrent hosts, all of them by default
+    :param timeout: seconds to wait for each host, counted from the start of its call. Python
+        threads cannot be stopped, so the call of a host that timed out keeps running in the
+        background.
+
+    The commands of :meth:`execute` run one at a time per host with the ones of
+    ``ContentHost.aexecute``. The functions of :meth:`map` are not serialized, they may run
+    several commands and wait for other hosts.
+    """
+
+    def __init__(self, hosts, workers=None, timeout=None):
+        self.hosts = list(hosts)
+        self.workers = workers
+        self.timeout = timeout
+
+    def __iter__(self):
+        return iter(self.hosts)
+
+    def __len__(self):
+        return len(self.hosts)
+
+    def map(self, func, *args, raise_on_error=False, **kwargs):
+        """Call ``func(host, *args, **kwargs)`` for every host concurrently
+
+        :param raise_on_error: raise a :class:`ContentHostError` once every host is done, if any
+            call raised
+        :return: a :class:`HostResults` of the return values, in the order of the hosts
+        """
+        results = HostResults.fromkeys(host.hostname for host in self.hosts)
+        if not self.hosts:
+            return results
+        started = {}
+
+        def call(host):
+            started[host.hostname] = time.monotonic()
+            return func(host, *args, **kwargs)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.workers or len(self.hosts), len(self.hosts)),
+            thread_name_prefix='robottelo-hosts',
+        )
+        # the calls target the same Satellite as the caller, see robottelo.config
+        futures = {
+            executor.submit(contextvars.copy_context().run, call, host): host.hostname
+            for host in self.hosts
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(
+                    pending, timeout=self._next_deadline(pending, futures, started)
+                )
+                for future in done:
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as err:  # isolate the failing host
+                        logger.warning('Call failed on host %s: %r', futures[future], err)
+                        results[futures[future]] = err
+                for future in self._expired(pending, futures, started):
+                    pending.discard(future)
+                    logger.warning('Call timed out on host %s', futures[future])
+                    results[futures[future]] = TimeoutError(
+                        f'{futures[future]} did not answer in {self.timeout} seconds'
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results.raise_for_errors() if raise_on_error else results
+
+    def _next_deadline(self, pending, futures, started):
+        """Seconds until the first pending host times out, None without a timeout"""
+        if self.timeout is None:
+            return None
+        starts = [started[futures[f]] for f in pending if futures[f] in started]
+        # hosts queued behind busy workers have not started yet, check again later
+        first = min(starts, default=time.monotonic())
+        return max(first + self.timeout - time.monotonic(), 0)
+
+    def _expired(self, pending, futures, started):
+        if self.timeout is None:
+            return []
+        now = time.monotonic()
+        return [
+            f
+            for f in pending
+            if futures[f] in started and now - started[futures[f]] >= self.timeout
+        ]
+
+    def execute(self, command, **kwargs):
+        """Run a command on every host concurrently
+
+        :param command: the command of every host, a ``{hostname: command}`` dict, or a
+            callable returning the command of the host it is given
+        :param kwargs: passed to ``ContentHost.execute``, e.g. its ssh ``timeout``
+        :return: a :class:`HostResults` of the ``execute`` results
+        """
+
+        def execute(host):
+            if callable(command):
+                host_command = command(host)
+            elif isinstance(command, dict):
+                host_command = command[host.hostname]
+            else:
+                host_command = command
+            # the command of a host that timed out may still hold the lock, do not wait forever
+            if not host._execute_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+                raise TimeoutError(f'{host.hostname} is still busy with a previous command')
+            try:
+                return host.execute(host_command, **kwargs)
+            finally:
+                host._execute_lock.release()
+
+        return self.map(execute)
+
 
 class Capsule(ContentHost, CapsuleMixins):
     rex_key_path = '~foreman-proxy/.ssh/id_rsa_foreman_proxy.pub'
@@ -1770,29 +2157,13 @@ class Capsule(ContentHost, CapsuleMixins):
 
     @property
     def cli(self):
-        """Import only satellite-maintain robottelo cli entities and wrap them under self.cli"""
-        self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
+        """The satellite-maintain robottelo cli entities, bound to this host"""
+        return get_cli_registry(self.hostname, prefix='sm_')
 
-        for file in Path('robottelo/cli/').iterdir():
-            if (
-                file.suffix == '.py'
-                and not file.name.startswith('_')
-                and file.name.startswith('sm_')
-            ):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(name, (obj,), {'hostname': self.hostname})
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
-        return self._cli
+    @property
+    def acli(self):
+        """Awaitable counterpart of ``self.cli``, e.g. ``await sat.acli.Org.info({'id': 1})``"""
+        return AsyncCLI(lambda: self.cli)
 
     def enable_satellite_or_capsule_module_for_rhel8(self):
         """Enable Satellite/Capsule module for RHEL8.
@@ -1819,13 +2190,13 @@ class Satellite(Capsule, SatelliteMixins):
     upstream_rpm_name = 'foreman'
 
     def __init__(self, hostname=None, **kwargs):
-        hostname = hostname or settings.server.hostname  # instance attr set by broker.Host
+        hostname = hostname or get_server_hostname()  # instance attr set by broker.Host
         self.omitting_credentials = False
         self.port = kwargs.get('port', settings.server.port)
         super().__init__(hostname=hostname, **kwargs)
-        # create dummy classes for later population
-        self._api = type('api', (), {'_configured': False})
-        self._cli = type('cli', (), {'_configured': False})
+        # api and cli entities are populated on first access
+        self._api = None
+        self._cli = None
         self._apidoc = None
         self.record_property = None
 
@@ -1837,47 +2208,25 @@ class Satellite(Capsule, SatelliteMixins):
 
         pip_main(['uninstall', '-y', 'nailgun'])
         pip_main(['install', f'https://github.com/SatelliteQE/nailgun/archive/{new_version}.zip'])
-        self._api = type('api', (), {'_configured': False})
+        self._api = None
+        clear_api_registries()
         to_clear = [k for k in sys.modules if 'nailgun' in k]
         [sys.modules.pop(k) for k in to_clear]
 
     @property
     def api(self):
-        """Import all nailgun entities and wrap them under self.api"""
-        if not self._api:
-            self._api = type('api', (), {'_configured': False})
-        if self._api._configured:
-            return self._api
-        from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
-        from nailgun.entity_mixins import Entity
-
-        def inject_config(cls, server_config):
-            """inject a nailgun server config into the init of nailgun entity classes"""
-            import functools
-
-            class DecClass(cls):
-                __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
-
-            return DecClass
-
-        # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
-            auth=(settings.server.admin_username, settings.server.admin_password),
-            url=f'{self.url}',
-            verify=settings.server.verify_ca,
-        )
-        # add each nailgun entity to self.api, injecting our server config
-        for name, obj in _entities.__dict__.items():
-            try:
-                if Entity in obj.mro():
-                    #  create a copy of the class and inject our server config into the __init__
-                    new_cls = type(name, (obj,), {})
-                    setattr(self._api, name, inject_config(new_cls, self.nailgun_cfg))
-            except AttributeError:
-                # not everything has an mro method, we don't care about them
-                pass
-        self._api._configured = True
+        """All the nailgun entities, with the server config of this satellite injected
+
+        The entities are shared with the other host objects using the same server config and
+        made on first access, e.g. ``sat.api.Organization``.
+        """
+        if self._api is None:
+            self._api = get_api_registry(
+                url=f'{self.url}',
+                auth=(settings.server.admin_username, settings.server.admin_password),
+                verify=settings.server.verify_ca,
+            )
+            self.nailgun_cfg = self._api.server_config
         return self._api
 
     @property
@@ -1895,57 +2244,35 @@ class Satellite(Capsule, SatelliteMixins):
 
     @property
     def cli(self):
-        """Import all robottelo cli entities and wrap them under self.cli"""
-        if not self._cli:
-            self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(
-                                name,
-                                (obj,),
-                                {
-                                    'hostname': self.hostname,
-                                    'omitting_credentials': self.omitting_credentials,
-                                },
-                            )
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+        """All the robottelo cli entities, bound to this satellite
+
+        The entities are shared with the other host objects of this satellite and made on first
+        access, e.g. ``sat.cli.Org``.
+        """
+        if self._cli is None:
+            self._cli = get_cli_registry(self.hostname)
         return self._cli
 
+    @property
+    def cli_cache(self):
+        """The hammer response cache of this Satellite, None unless cli caching is enabled
+
+        ``sat.cli_cache.stats()`` returns its hit and miss counters.
+        """
+        return get_response_cache(self.hostname)
+
     @contextmanager
     def omit_credentials(self):
         change = not self.omitting_credentials  # if not already set to omit
-        if change:
-            self.omitting_credentials = True
-            # if CLI is already created
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = True
-        yield
-        if change:
+        if not change:
+            yield
+            return
+        self.omitting_credentials = True
+        try:
+            with credentials_omitted(self.hostname):
+                yield
+        finally:
             self.omitting_credentials = False
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = False
 
     @contextmanager
     def ui_session(self, testname=None, user=None, password=None, url=None, login=True):
@@ -2092,22 +2419,17 @@ class Satellite(Capsule, SatelliteMixins):
     def __enter__(self):
         """Satellite objects can be used as a context manager to temporarily force everything
         to use the Satellite object's hostname.
+
+        Hammer and ssh commands, and nailgun entities created without a server config, resolve
+        the Satellite targeted in the current thread or asyncio task when they run, so several
+        threads can work with different Satellites at once. The global settings, nailgun and
+        airgun configurations are left unchanged.
         """
-        self._revert = False
-        # if the hostname is the same, don't make a change
-        if self.hostname != settings.server.hostname:
-            self._revert = True
-            self._old_hostname = settings.server.hostname
-            settings.server.hostname = self.hostname
-            configure_nailgun()
-            configure_airgun()
+        push_server_hostname(self.hostname)
         return self
 
     def __exit__(self, *err_args):
-        if self._revert:
-            settings.server.hostname = self._old_hostname
-            configure_nailgun()
-            configure_airgun()
+        pop_server_hostname()
 
     def create_custom_environment(self, repo='generic_1'):
         """Download, install and import puppet module.
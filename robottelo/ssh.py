@@ -1,6 +1,180 @@
 """Utility module to handle the shared ssh connection."""
 
+from collections import defaultdict, deque
+from contextlib import contextmanager, suppress
+import threading
+import time
+
 from robottelo.cli import hammer
+from robottelo.logging import logger
+
+
+class _PooledClient:
+    """A pooled ssh client along with its bookkeeping timestamps"""
+
+    __slots__ = ('client', 'created', 'last_used')
+
+    def __init__(self, client):
+        self.client = client
+        self.created = self.last_used = time.monotonic()
+
+
+def _new_client(hostname, username, password, port, ipv6):
+    """Create a new host object that provides an ssh connection"""
+    from robottelo.hosts import ContentHost
+
+    return ContentHost(
+        hostname=hostname,
+        username=username,
+        password=password,
+        port=port,
+        ipv6=ipv6,
+    )
+
+
+class SSHConnectionPool:
+    """Thread-safe pool of reusable ssh clients.
+
+    Clients are keyed by ``(hostname, username, port, ipv6)`` and at most ``size`` clients
+    are kept per key. A client idle for longer than ``keepalive`` seconds is health checked
+    before it is handed out again, and a client idle for longer than ``idle_timeout`` seconds
+    is closed and evicted. When ``size``, ``idle_timeout`` or ``keepalive`` are not given, they
+    are read from ``settings.server.ssh_client.pool_*``.
+
+    :param factory: callable creating a new client from the connection kwargs
+    """
+
+    def __init__(self, factory=_new_client, size=None, idle_timeout=None, keepalive=None):
+        self.factory = factory
+        self._size = size
+        self._idle_timeout = idle_timeout
+        self._keepalive = keepalive
+        self._idle = defaultdict(deque)
+        self._leased = defaultdict(int)
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def _setting(name, default):
+        from robottelo.config import settings
+
+        return settings.server.ssh_client.get(name, default)
+
+    @property
+    def size(self):
+        return self._size or self._setting('pool_size', 4)
+
+    @property
+    def idle_timeout(self):
+        return self._idle_timeout or self._setting('pool_idle_timeout', 300)
+
+    @property
+    def keepalive(self):
+        return self._keepalive or self._setting('pool_keepalive', 60)
+
+    @staticmethod
+    def _close(pooled):
+        with suppress(Exception):
+            pooled.client.close()
+
+    @staticmethod
+    def _is_alive(client):
+        """Health check a client by running a no-op command on it"""
+        try:
+            # broker reads a bare number as milliseconds
+            return client.execute('true', timeout='10s').status == 0
+        except Exception as err:
+            logger.debug(f'Pooled ssh client for {client.hostname} failed health check: {err}')
+            return False
+
+    def _evict_idle(self):
+        """Close clients that have been idle for longer than ``idle_timeout``.
+
+        Must be called with the pool condition held.
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        for idle in self._idle.values():
+            # clients are appended on release, so the oldest ones are on the left
+            while idle and idle[0].last_used < cutoff:
+                self._close(idle.popleft())
+
+    def acquire(self, hostname, username, password, port, ipv6):
+        """Lease a client for exclusive use, blocking while all ``size`` clients are leased
+
+        :return: a tuple of the pool key and the leased :class:`_PooledClient`
+        """
+        key = (hostname, username, port, ipv6)
+        with self._cond:
+            self._evict_idle()
+            while not self._idle[key] and self._leased[key] >= self.size:
+                self._cond.wait()
+            pooled = self._idle[key].pop() if self._idle[key] else None
+            self._leased[key] += 1
+        try:
+            stale = pooled is not None and time.monotonic() - pooled.last_used > self.keepalive
+            if stale and not self._is_alive(pooled.client):
+                self._close(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = _PooledClient(
+                    self.factory(
+                        hostname=hostname,
+                        username=username,
+                        password=password,
+                        port=port,
+                        ipv6=ipv6,
+                    )
+                )
+        except Exception:
+            with self._cond:
+                self._leased[key] -= 1
+                self._cond.notify()
+            raise
+        return key, pooled
+
+    def release(self, key, pooled, discard=False):
+        """Return a leased client to the pool, closing it when ``discard`` is set"""
+        with self._cond:
+            self._leased[key] -= 1
+            if discard:
+                self._close(pooled)
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle[key].append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, hostname, username, password, port, ipv6):
+        """Context manager leasing a client, discarding it if the block raised"""
+        key, pooled = self.acquire(hostname, username, password, port, ipv6)
+        try:
+            yield pooled.client
+        except Exception:
+            self.release(key, pooled, discard=True)
+            raise
+        self.release(key, pooled)
+
+    def clear(self):
+        """Close and forget every idle client"""
+        with self._cond:
+            for idle in self._idle.values():
+                while idle:
+                    self._close(idle.popleft())
+
+
+connection_pool = SSHConnectionPool()
+
+
+def connection_kwargs(hostname=None, username=None, password=None, port=None, ipv6=None):
+    """Resolve ssh connection kwargs against the server settings"""
+    from robottelo.config import get_server_hostname, settings
+
+    return {
+        'hostname': hostname or get_server_hostname(),
+        'username': username or settings.server.ssh_username,
+        'password': password or settings.server.ssh_password,
+        'port': port or settings.server.ssh_client.port,
+        'ipv6': ipv6 or settings.server.is_ipv6,
+    }
 
 
 def get_client(
@@ -14,17 +188,11 @@ def get_client(
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
-    """
-    from robottelo.config import settings
-    from robottelo.hosts import ContentHost
 
-    return ContentHost(
-        hostname=hostname or settings.server.hostname,
-        username=username or settings.server.ssh_username,
-        password=password or settings.server.ssh_password,
-        port=port or settings.server.ssh_client.port,
-        ipv6=ipv6 or settings.server.is_ipv6,
-    )
+    The host object is dedicated to the caller, it is not part of :data:`connection_pool`.
+    Use ``connection_pool.connection`` to lease a pooled client for the duration of a block.
+    """
+    return connection_pool.factory(**connection_kwargs(hostname, username, password, port, ipv6))
 
 
 def command(
@@ -46,15 +214,20 @@ def command(
     :param int timeout: Time to wait for the ssh command to finish.
     :param connection_timeout: Time to wait for establishing the connection.
     """
-    client = get_client(
-        hostname=hostname,
-        username=username,
-        password=password,
-        port=port,
-        ipv6=ipv6,
-    )
-    result = client.execute(cmd, timeout=timeout)
+    with connection_pool.connection(
+        **connection_kwargs(hostname, username, password, port, ipv6)
+    ) as client:
+        result = client.execute(cmd, timeout=timeout)
+    return parse_output(result, output_format)
+
 
+def parse_output(result, output_format=None):
+    """Parse the stdout of a successful command ``result`` in place
+
+    :param result: a result object, as returned by ``ContentHost.execute``
+    :param str output_format: json, csv or None
+    :return: the same ``result``
+    """
     if output_format and result.status == 0:
         if output_format == 'csv':
             result.stdout = hammer.parse_csv(result.stdout) if result.stdout else {}
@@ -0,0 +1,89 @@
+"""asyncio interface for hammer and ssh commands.
+
+Hammer and ssh commands run in a shared, bounded thread pool of
+``settings.performance.async_workers`` threads, so independent commands can be awaited
+concurrently from an event loop::
+
+    await asyncio.gather(
+        sat.acli.Repository.synchronize({'id': repo_id}),
+        sat.acli.ContentView.publish({'id': cv_id}),
+        host.aexecute('dnf -y update'),
+    )
+
+Awaiting a command returns the same parsed result as calling it directly.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import threading
+
+from robottelo.config import settings
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the thread pool running the blocking commands, creating it lazily"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.performance.get('async_workers', 32),
+                thread_name_prefix='robottelo-aio',
+            )
+        return _executor
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run the blocking ``func(*args, **kwargs)`` in the shared thread pool and await it
+
+    ``func`` runs in a copy of the context of the awaiting task, so it targets the same
+    Satellite, see ``robottelo.config.get_server_hostname``.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def awaitable(func):
+    """Return a coroutine function running the blocking ``func`` in the shared thread pool"""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_blocking(func, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncEntity:
+    """Awaitable counterpart of a hammer cli class, every classmethod becomes a coroutine"""
+
+    def __init__(self, cli_class):
+        self._cli_class = cli_class
+
+    def __getattr__(self, name):
+        attr = getattr(self._cli_class, name)
+        return awaitable(attr) if callable(attr) else attr
+
+    def __repr__(self):
+        return f'<AsyncEntity {self._cli_class.__name__}>'
+
+
+class AsyncCLI:
+    """Awaitable counterpart of ``Satellite.cli`` and ``Capsule.cli``
+
+    :param get_cli: callable returning the cli namespace to wrap. It is called on every
+        access, so the wrapper stays in sync with changes like ``Satellite.omit_credentials``.
+    """
+
+    def __init__(self, get_cli):
+        self._get_cli = get_cli
+
+    def __getattr__(self, name):
+        attr = getattr(self._get_cli(), name)
+        if isinstance(attr, type):
+            return AsyncEntity(attr)
+        return awaitable(attr) if callable(attr) else attr
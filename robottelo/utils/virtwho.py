@@ -13,7 +13,7 @@ from robottelo import ssh
 from robottelo.cli.base import Base
 from robottelo.cli.host import Host
 from robottelo.cli.virt_who_config import VirtWhoConfig
-from robottelo.config import settings
+from robottelo.config import get_server_hostname, settings
 from robottelo.constants import DEFAULT_ORG
 
 ETC_VIRTWHO_CONFIG = "/etc/virt-who.conf"
@@ -50,7 +50,7 @@ def get_system(system_type):
         }
     if system_type == 'satellite':
         return {
-            'hostname': settings.server.hostname,
+            'hostname': get_server_hostname(),
             'username': settings.server.ssh_username,
             'password': settings.server.ssh_password,
         }
@@ -100,7 +100,7 @@ def register_system(system, activation_key=None, org='Default_Organization', env
     runcmd('subscription-manager clean', system)
     runcmd('rpm -qa | grep katello-ca-consumer | xargs rpm -e |sort', system)
     runcmd(
-        f'rpm -ihv http://{settings.server.hostname}/pub/katello-ca-consumer-latest.noarch.rpm',
+        f'rpm -ihv http://{get_server_hostname()}/pub/katello-ca-consumer-latest.noarch.rpm',
         system,
     )
     cmd = f'subscription-manager register --org={org} --environment={env} '
@@ -494,7 +494,7 @@ def create_fake_hypervisor_content(org_label, hypervisors, guests):
     :return data: the hypervisor content
     """
     data = hypervisor_json_create(hypervisors, guests)
-    url = f"https://{settings.server.hostname}/rhsm/hypervisors/{org_label}"
+    url = f"https://{get_server_hostname()}/rhsm/hypervisors/{org_label}"
     auth = (settings.server.admin_username, settings.server.admin_password)
     result = requests.post(url, auth=auth, verify=False, json=data)
     assert result.status_code == 200
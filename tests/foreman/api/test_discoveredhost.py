@@ -13,10 +13,10 @@
 import re
 
 from fauxfactory import gen_choice, gen_ipaddr, gen_mac, gen_string
-from nailgun import entity_mixins
 import pytest
 from wait_for import TimedOutError, wait_for
 
+from robottelo.config import admin_nailgun_config
 from robottelo.logging import logger
 from robottelo.utils.datafactory import valid_data_list
 
@@ -120,7 +120,7 @@ def _assert_discovered_host(host, channel=None, user_config=None):
     except TimedOutError as err:
         # raise assertion error
         raise AssertionError('Timed out waiting for "/facts" 201 response') from err
-    default_config = entity_mixins.DEFAULT_SERVER_CONFIG
+    default_config = admin_nailgun_config()
     try:
         wait_for(
             lambda: len(
@@ -2,10 +2,19 @@ import contextlib
 import glob
 import os
 from pathlib import Path
+import shutil
+import subprocess
 from tempfile import NamedTemporaryFile
+import threading
 
+from broker.helpers import Result
 from fauxfactory import gen_string
 import pytest
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
+
+from robottelo.host_helpers import agent
+from robottelo.host_helpers.capsule_mixins import CapsuleInfo
+from robottelo.hosts import ContentHost
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -48,3 +57,238 @@ def exec_test(request, dummy_test):
     with contextlib.suppress(OSError):
         # the file might not exist if the test fails prematurely
         os.remove(report_file)
+
+
+class LocalChannel:
+    """Stand-in of an ssh2-python channel, running its command in a local bash
+
+    Like libssh2, reads block until data is available when the session is blocking, and return
+    ``LIBSSH2_ERROR_EAGAIN`` instead when it is not.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.process = None
+        self.closed = False
+        self.drained = set()
+
+    def execute(self, command):
+        def start():
+            self.transport.host.commands.append(command)
+            self.process = subprocess.Popen(
+                ['bash', '-c', command],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            return 0
+
+        return self.transport.call(start)
+
+    def _read(self, pipe, size):
+        os.set_blocking(pipe.fileno(), self.transport.blocking)
+        try:
+            data = os.read(pipe.fileno(), size)
+        except BlockingIOError:
+            return LIBSSH2_ERROR_EAGAIN, b''
+        if not data:
+            self.drained.add(pipe)
+        return len(data), data
+
+    def read(self, size=1024):
+        return self.transport.call(self._read, self.process.stdout, size)
+
+    def read_stderr(self, size=1024):
+        return self.transport.call(self._read, self.process.stderr, size)
+
+    def write(self, data):
+        def write():
+            self.process.stdin.write(data)
+            self.process.stdin.flush()
+            return 0, len(data)
+
+        return self.transport.call(write)
+
+    def send_eof(self):
+        return self.transport.call(self.process.stdin.close)
+
+    def eof(self):
+        return self.process.stdout in self.drained
+
+    def close(self):
+        def close():
+            # like sshd, the command is not killed, it ends on its next write
+            self.closed = True
+            self.transport.open -= 1
+            for pipe in (self.process.stdin, self.process.stdout, self.process.stderr):
+                pipe.close()
+            return 0
+
+        return self.transport.call(close)
+
+    def wait_closed(self):
+        if self.transport.blocking:
+            self.process.wait()
+        return 0 if self.process.poll() is not None else LIBSSH2_ERROR_EAGAIN
+
+    def get_exit_status(self):
+        return self.process.wait()
+
+
+class LocalTransport:
+    """Stand-in of an ssh2-python session, checking it is never used concurrently
+
+    :param lock: lock the session must be switched to non-blocking under, if any
+    """
+
+    def __init__(self, host, blocking=True, lock=None):
+        self.host = host
+        self.blocking = blocking
+        self.lock = lock
+        self.timeout = 0
+        self.in_use = threading.Lock()
+        self.channels = []
+        # channels open at once, and the most of them seen open at once
+        self.open = 0
+        self.peak = 0
+        self._attempts = 0
+
+    def call(self, func, *args):
+        assert self.in_use.acquire(blocking=False), 'concurrent libssh2 call'
+        try:
+            return func(*args)
+        finally:
+            self.in_use.release()
+
+    def open_session(self):
+        def open_session():
+            self._attempts += 1
+            # every other attempt would block, like a non-blocking libssh2 session
+            if not self.blocking and self._attempts % 2:
+                return LIBSSH2_ERROR_EAGAIN
+            self.channels.append(LocalChannel(self))
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+            return self.channels[-1]
+
+        return self.call(open_session)
+
+    def set_blocking(self, blocking):
+        if self.lock is not None:
+            assert self.lock._is_owned(), 'the session is switched to non-blocking without its lock'
+        self.blocking = blocking
+
+    def set_timeout(self, timeout):
+        if self.lock is not None:
+            assert self.lock._is_owned(), 'the session timeout is set without its lock'
+        self.timeout = timeout
+
+    def block_directions(self):
+        return 0
+
+
+class LocalSocket:
+    """Stand-in of the socket of a session, ready when its last command wrote to stdout"""
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    def fileno(self):
+        return self.transport.channels[-1].process.stdout.fileno()
+
+
+class LocalShell:
+    """Stand-in of a broker interactive shell, running what is sent to it in a local bash
+
+    Like the login shell of a host, bash does not read ahead of the command it runs.
+    """
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ['bash'], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def send(self, cmd):
+        self.process.stdin.write(f'{cmd}\n'.encode())
+        self.process.stdin.flush()
+
+    def read(self, size=65535):
+        data = self.process.stdout.read1(size)
+        return len(data), data
+
+    def close(self):
+        self.process.kill()
+        self.process.wait()
+
+
+class LocalSession:
+    """Stand-in of a broker session of the ssh2-python backend, see ``LocalTransport``"""
+
+    def __init__(self, host, blocking=True, lock=None):
+        self.session = LocalTransport(host, blocking=blocking, lock=lock)
+        self.sock = LocalSocket(self.session)
+        self.shells = []
+
+    def shell(self):
+        self.shells.append(LocalShell())
+        return self.shells[-1]
+
+    def disconnect(self):
+        for channel in self.session.channels:
+            if channel.process.poll() is None:
+                channel.process.kill()
+                channel.process.wait()
+        for shell in self.shells:
+            shell.close()
+
+
+class LocalHost(ContentHost, CapsuleInfo):
+    """Content host running its commands on the local machine
+
+    Its session and the connection of its channel pool are :class:`LocalSession`, a new one
+    after ``close``. Set ``_session`` to another object to use the code paths of the other ssh
+    backends.
+    """
+
+    def __init__(self):
+        super().__init__('localhost')
+        self.commands = []
+        self.connect()
+        self.channels._connect = self._connect_channels
+
+    def connect(self, *args, **kwargs):
+        self._session = LocalSession(self, lock=self._execute_lock)
+
+    def _connect_channels(self):
+        with self.channels._lock:
+            if self.channels._connection is None:
+                self.channels._connection = LocalSession(self, blocking=False)
+            return self.channels._connection
+
+    def execute(self, command, timeout=None):
+        with self._execute_lock:
+            self.commands.append(command)
+            done = subprocess.run(
+                ['bash', '-c', command], capture_output=True, text=True, check=False
+            )
+        return Result(stdout=done.stdout, stderr=done.stderr, status=done.returncode)
+
+    def put(self, local_path, remote_path):
+        shutil.copy(local_path, remote_path)
+
+    def get(self, remote_path, local_path):
+        shutil.copy(remote_path, local_path)
+
+
+@pytest.fixture
+def local_host(tmp_path, monkeypatch):
+    """A :class:`LocalHost`, whose agent files are kept in ``tmp_path``"""
+    monkeypatch.setattr(agent, 'AGENT_PATH', str(tmp_path / 'agent.py'))
+    monkeypatch.setattr(agent, 'AGENT_LOG', str(tmp_path / 'agent.log'))
+    host = LocalHost()
+    yield host
+    host.agent.close()
+    host.channels.close()
+    if isinstance(host._session, LocalSession):
+        host._session.disconnect()
+    host._session = None
@@ -0,0 +1,141 @@
+"""Tests for the resident helper agent of robottelo.host_helpers.agent"""
+
+import hashlib
+import json
+from unittest import mock
+
+import pytest
+
+from robottelo import constants, hosts
+from robottelo.host_helpers.agent import AgentError
+
+
+@pytest.fixture
+def agent(local_host):
+    return local_host.agent
+
+
+def test_requests(agent, tmp_path):
+    path = tmp_path / 'file.facts'
+    path.write_text('{"a": 1}')
+    assert agent.stat(str(path))['size'] == 8
+    assert agent.stat(str(tmp_path / 'missing')) is None
+    assert agent.hash(str(path)) == hashlib.sha256(b'{"a": 1}').hexdigest()
+    assert agent.read(str(path)) == '{"a": 1}'
+    assert agent.list(str(tmp_path), '*.facts') == ['file.facts']
+    result = agent.run('echo out; echo err >&2; exit 3')
+    assert (result.stdout, result.stderr, result.status) == ('out\n', 'err\n', 3)
+    with pytest.raises(AgentError, match='FileNotFoundError'):
+        agent.read(str(tmp_path / 'missing'))
+
+
+def test_batch_is_one_round_trip(agent, local_host, tmp_path):
+    path = tmp_path / 'file'
+    path.write_bytes(b'data')
+    stat, missing, output = agent.batch(
+        [
+            ('stat', {'path': str(path)}),
+            ('hash', {'path': 'missing'}),
+            ('run', {'command': 'true'}),
+        ],
+        raise_on_error=False,
+    )
+    assert stat['type'] == 'file'
+    assert isinstance(missing, AgentError)
+    assert output.status == 0
+    with pytest.raises(AgentError, match='hash failed'):
+        agent.batch([('hash', {'path': 'missing'})])
+    # uploaded and started once
+    assert len(local_host.session.shells) == 1
+    assert len(local_host.commands) == 1
+
+
+def test_restarts_on_reconnect(agent, local_host):
+    assert agent.run('true').status == 0
+    local_host.close()
+    assert agent.run('true').status == 0
+    assert len(local_host.session.shells) == 1
+
+
+def test_timeouts(agent, local_host):
+    with pytest.raises(AgentError, match='TimeoutExpired'):
+        agent.run('sleep 5', timeout=0.5)
+    # the session waits longer than the command may run, in milliseconds
+    assert local_host.session.session.timeout == 10500
+    assert agent.run('echo done', timeout='1m').stdout == 'done\n'
+    assert local_host.session.session.timeout == 70000
+    assert agent.stat('/') is not None
+    assert local_host.session.session.timeout == 0
+
+
+def test_exited_agent_raises(agent):
+    with pytest.raises(AgentError, match='exited'):
+        agent.run('kill -9 $PPID')
+    # started again on next use
+    assert agent.run('true').status == 0
+
+
+def test_get_artifact_info(local_host, tmp_path):
+    artifact = tmp_path / 'artifact'
+    artifact.write_text('content\n')
+    with mock.patch('robottelo.host_helpers.capsule_mixins.settings') as settings:
+        settings.performance.host_agent.enabled = True
+        info = local_host.get_artifact_info(path=str(artifact))
+        with pytest.raises(FileNotFoundError, match='Artifact not found'):
+            local_host.get_artifact_info(path=str(tmp_path / 'missing'))
+        # a directory is found, but cannot be hashed
+        with pytest.raises(AgentError, match='hash failed'):
+            local_host.get_artifact_info(path=str(tmp_path))
+    assert info == {
+        'path': str(artifact),
+        'size': 8,
+        'sum': hashlib.sha256(b'content\n').hexdigest(),
+        'info': 'ASCII text',
+    }
+    # answered by the agent, uploaded once, without a channel
+    assert len(local_host.commands) == 1
+    assert local_host.channels._connection is None
+
+
+def test_custom_facts(local_host, tmp_path, monkeypatch):
+    facts_dir = tmp_path / 'facts'
+    monkeypatch.setattr(constants, 'RHSM_FACTS_DIR', f'{facts_dir}/')
+    with mock.patch('robottelo.host_helpers.contenthost_mixins.settings') as settings:
+        settings.performance.host_agent.enabled = True
+        assert local_host._get_custom_facts() == {}
+        facts_dir.mkdir()
+        (facts_dir / 'a.facts').write_text(json.dumps({'a': '1'}))
+        (facts_dir / 'b.facts').write_text(json.dumps({'b': '2'}))
+        (facts_dir / 'other.txt').write_text('not facts')
+        assert local_host._get_custom_facts() == {'a.facts': {'a': '1'}, 'b.facts': {'b': '2'}}
+        assert local_host._get_custom_facts(['b.facts', 'missing.facts']) == {'b.facts': {'b': '2'}}
+    assert len(local_host.commands) == 1
+
+
+def test_identity(local_host, monkeypatch):
+    monkeypatch.setitem(
+        hosts.FINGERPRINT_SECTIONS,
+        'identity',
+        'printf "system identity: 1234\\nname: client.example.com\\norg ID: 1\\n"',
+    )
+    monkeypatch.setitem(
+        hosts.FINGERPRINT_SECTIONS, 'rhsm_conf', 'printf "[server]\\nhostname = sat.example.com\\n"'
+    )
+    agent = local_host.agent
+    with (
+        mock.patch('robottelo.hosts.settings') as settings,
+        mock.patch.object(agent, 'batch', wraps=agent.batch) as batch,
+    ):
+        settings.performance.host_agent.enabled = True
+        settings.performance.host_fingerprint.enabled = False
+        assert local_host.identity == {
+            'system_identity': '1234',
+            'name': 'client.example.com',
+            'org_ID': '1',
+            'registered_to': 'sat.example.com',
+        }
+        monkeypatch.setitem(hosts.FINGERPRINT_SECTIONS, 'identity', 'true')
+        assert local_host.identity == {}
+    # both sections were run by the agent, in one round trip each time
+    assert batch.call_count == 2
+    assert len(local_host.commands) == 1
@@ -0,0 +1,95 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+from robottelo import config
+from robottelo.cli.base import Base
+from robottelo.config import (
+    get_server_hostname,
+    pop_server_hostname,
+    push_server_hostname,
+    settings,
+)
+from robottelo.utils.aio import AsyncCLI, run_blocking
+
+
+class SlowEntity(Base):
+    @classmethod
+    def info(cls, options=None):
+        time.sleep(0.2)
+        return {'id': options['id'], 'thread': threading.current_thread().name}
+
+
+def test_run_blocking_overlaps():
+    """Check blocking calls awaited together run concurrently"""
+
+    # the barrier breaks unless the 5 calls wait on it at the same time
+    barrier = threading.Barrier(5)
+
+    async def main():
+        return await asyncio.gather(*(run_blocking(barrier.wait, 5) for _ in range(5)))
+
+    assert sorted(asyncio.run(main())) == [0, 1, 2, 3, 4]
+
+
+def test_async_cli():
+    """Check acli methods return the results of the wrapped cli methods"""
+    cli = type('cli', (), {'SlowEntity': SlowEntity, 'execute_many': lambda commands: commands})
+    acli = AsyncCLI(lambda: cli)
+
+    async def main():
+        return await asyncio.gather(
+            acli.SlowEntity.info({'id': 1}),
+            acli.SlowEntity.info({'id': 2}),
+            acli.execute_many(['org list']),
+        )
+
+    first, second, batch = asyncio.run(main())
+    assert (first['id'], second['id']) == (1, 2)
+    assert first['thread'].startswith('robottelo-aio')
+    assert first['thread'] != second['thread']
+    assert batch == ['org list']
+    assert acli.SlowEntity.command_base is None
+
+
+def test_targeted_server_per_task():
+    """Check concurrent tasks target their own Satellite, including in the awaited commands"""
+
+    async def target(hostname):
+        push_server_hostname(hostname)
+        try:
+            await asyncio.sleep(0.05)
+            return await run_blocking(get_server_hostname)
+        finally:
+            pop_server_hostname()
+
+    async def main():
+        return await asyncio.gather(target('sat1'), target('sat2'))
+
+    default = get_server_hostname()
+    assert asyncio.run(main()) == ['sat1', 'sat2']
+    push_server_hostname('outer')
+    push_server_hostname('inner')
+    assert get_server_hostname() == 'inner'
+    pop_server_hostname()
+    assert get_server_hostname() == 'outer'
+    pop_server_hostname()
+    assert get_server_hostname() == default
+
+
+def test_targets_leave_the_settings_alone(monkeypatch):
+    """Check the targets of several contexts neither change the settings nor reconfigure"""
+    configured = []
+    monkeypatch.setattr(config, 'configure_nailgun', lambda: configured.append('nailgun'))
+    monkeypatch.setattr(config, 'configure_airgun', lambda: configured.append('airgun'))
+    default = settings.server.hostname
+    other = contextvars.Context()
+    push_server_hostname('sat1')
+    other.run(push_server_hostname, 'sat2')
+    assert (get_server_hostname(), other.run(get_server_hostname)) == ('sat1', 'sat2')
+    assert settings.server.hostname == default
+    pop_server_hostname()
+    other.run(pop_server_hostname)
+    assert get_server_hostname() == other.run(get_server_hostname) == default
+    assert configured == []
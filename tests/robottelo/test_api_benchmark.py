@@ -0,0 +1,115 @@
+"""Benchmarks of the Satellite API connection pooling
+
+Requests are sent to a local HTTPS stand-in of a Satellite, once with a new connection per
+request as nailgun does by default, and once over the pooled sessions of
+``settings.performance.http_pool``::
+
+    pytest tests/robottelo/test_api_benchmark.py --benchmark-columns=mean,ops
+"""
+
+import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import ipaddress
+import ssl
+import threading
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+import pytest
+import requests
+
+from robottelo.host_helpers.api_registry import SessionRouter
+
+pytest.importorskip('pytest_benchmark')
+
+REQUESTS = 20
+BODY = b'{"results": []}'
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """Answer every request like the Satellite status API, keeping the connection alive"""
+
+    protocol_version = 'HTTP/1.1'
+    # answer right away rather than waiting for the client to acknowledge the headers
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def self_signed_certificate(directory):
+    """Write a self-signed certificate and key of localhost into ``directory``"""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'localhost')])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.DNSName('localhost'), x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / 'cert.pem', directory / 'key.pem'
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+@pytest.fixture(scope='module')
+def satellite(tmp_path_factory):
+    """Serve the stand-in Satellite over HTTPS, return its url and certificate path"""
+    cert_path, key_path = self_signed_certificate(tmp_path_factory.mktemp('certs'))
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StatusHandler)
+    server.daemon_threads = True
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'https://localhost:{server.server_address[1]}', str(cert_path)
+    server.shutdown()
+    server.server_close()
+
+
+def send_requests(client, url, verify):
+    for _ in range(REQUESTS):
+        response = client.get(f'{url}/api/status', auth=('admin', 'changeme'), verify=verify)
+        assert response.content == BODY
+
+
+def test_new_connection_per_request(benchmark, satellite):
+    url, verify = satellite
+    benchmark(send_requests, requests, url, verify)
+
+
+def test_pooled_session(benchmark, satellite):
+    url, verify = satellite
+    router = SessionRouter()
+    router.register(url)
+    benchmark(send_requests, router, url, verify)
+    router.close()
@@ -0,0 +1,67 @@
+"""Tests for Robottelo's nailgun entity registry"""
+
+from unittest import mock
+
+from nailgun import entities
+import pytest
+import requests
+
+from robottelo.host_helpers.api_registry import (
+    SessionRouter,
+    clear_api_registries,
+    get_api_registry,
+)
+
+
+def test_entities_are_made_once_per_server_config():
+    api = get_api_registry('https://sat.example.com', ('admin', 'changeme'), False)
+    assert api is get_api_registry('https://sat.example.com', ['admin', 'changeme'], False)
+    assert api is not get_api_registry('https://other.example.com', ('admin', 'changeme'), False)
+    assert api.Organization is api.Organization
+    assert issubclass(api.Organization, entities.Organization)
+    assert api.Organization()._server_config is api.server_config
+    with pytest.raises(AttributeError):
+        api.NotAnEntity  # noqa: B018 - attribute access raising
+    clear_api_registries()
+    assert api is not get_api_registry('https://sat.example.com', ('admin', 'changeme'), False)
+
+
+def test_session_router():
+    router = SessionRouter()
+    router.register('https://sat.example.com/api')
+    session = router.session('https://sat.example.com/api/v2/hosts', ('admin', 'changeme'))
+    assert session is router.session('https://sat.example.com/katello', ['admin', 'changeme'])
+    assert session is not router.session('https://sat.example.com/api', ('viewer', 'changeme'))
+    assert router.session('https://other.example.com/api') is None
+    with mock.patch.object(session, 'request') as pooled:
+        router.head('https://sat.example.com/api/status', auth=('admin', 'changeme'))
+    pooled.assert_called_once_with(
+        'head',
+        'https://sat.example.com/api/status',
+        auth=('admin', 'changeme'),
+        allow_redirects=False,
+    )
+    with mock.patch.object(requests, 'request') as plain:
+        router.get('https://other.example.com/api', verify=False)
+    plain.assert_called_once_with('get', 'https://other.example.com/api', params=None, verify=False)
+    assert router.exceptions is requests.exceptions
+    router.close()
+    assert router.session('https://sat.example.com/api') is None
+
+
+def test_session_router_writes_drop_cached_responses():
+    router = SessionRouter()
+    with (
+        mock.patch.object(requests, 'request'),
+        mock.patch(
+            'robottelo.host_helpers.api_registry.invalidate_response_cache'
+        ) as invalidate_response_cache,
+    ):
+        router.get('https://sat.example.com/api/v2/hosts')
+        invalidate_response_cache.assert_not_called()
+        router.post('https://sat.example.com/api/v2/hosts', json={'name': 'foo'})
+        router.delete('https://sat.example.com/api/v2/hosts/1')
+    assert invalidate_response_cache.call_args_list == [
+        mock.call('sat.example.com'),
+        mock.call('sat.example.com'),
+    ]
@@ -0,0 +1,78 @@
+"""Tests for the multiplexed ssh channels of robottelo.host_helpers.channels"""
+
+import hashlib
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers.channels import ChannelPool
+
+
+@pytest.fixture
+def pool(local_host):
+    local_host.channels = ChannelPool(local_host, size=3)
+    local_host.channels._connect = local_host._connect_channels
+    return local_host.channels
+
+
+def test_commands_run_concurrently_over_one_connection(pool, tmp_path):
+    # each command waits until all of them started, they only end if they run concurrently
+    barrier = f'touch {tmp_path}/$$; until [ $(ls {tmp_path} | wc -l) -ge 3 ]; do sleep 0.05; done'
+    results = pool.execute_many(
+        [
+            f'{barrier}; echo first',
+            f'{barrier}; echo second >&2; exit 2',
+            f'{barrier}; echo third',
+        ],
+        timeout=10,
+    )
+    assert [result.stdout for result in results] == ['first\n', '', 'third\n']
+    assert (results[1].stderr, results[1].status) == ('second\n', 2)
+    assert pool.execute_many([]) == []
+
+
+def test_channels_are_bounded(pool):
+    pool.execute_many(['sleep 0.2'] * 6)
+    transport = pool._connect().session
+    assert transport.peak <= pool.size
+    assert transport.open == 0
+
+
+def test_timeout(pool):
+    with pytest.raises(TimeoutError, match='did not end in time'):
+        pool.execute('sleep 5', timeout=0.2)
+
+
+def test_other_ssh_backends_run_sequentially(pool, local_host):
+    local_host._session = object()
+    with mock.patch.object(local_host, 'execute', wraps=local_host.execute) as execute:
+        results = pool.execute_many(['echo first', 'echo second'], timeout=2)
+    assert [result.stdout for result in results] == ['first\n', 'second\n']
+    assert execute.call_args_list == [
+        mock.call('echo first', timeout=2000),
+        mock.call('echo second', timeout=2000),
+    ]
+    assert pool._connection is None
+
+
+def test_get_artifact_info(local_host, tmp_path):
+    artifact = tmp_path / 'artifact'
+    artifact.write_text('content\n')
+    with mock.patch('robottelo.host_helpers.capsule_mixins.settings') as settings:
+        settings.performance.host_agent.enabled = False
+        info = local_host.get_artifact_info(path=str(artifact))
+        with pytest.raises(FileNotFoundError, match='Artifact not found'):
+            local_host.get_artifact_info(path=str(tmp_path / 'missing'))
+    assert info == {
+        'path': str(artifact),
+        'size': 8,
+        'sum': hashlib.sha256(b'content\n').hexdigest(),
+        'info': 'ASCII text',
+    }
+    # the probes ran on channels of the pool connection
+    assert len(local_host.channels._connect().session.channels) == 6
+    assert sorted(local_host.commands[:3]) == [
+        f'file {artifact}',
+        f'sha256sum {artifact}',
+        f'stat --format %s {artifact}',
+    ]
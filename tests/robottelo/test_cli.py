@@ -1,10 +1,24 @@
 from functools import partial
+import json
+import os
+from pathlib import Path
+import subprocess
+import tempfile
 import unittest
 from unittest import mock
 
+from broker.helpers import Result
 import pytest
 
+from robottelo.cli import hammer_session, response_cache
 from robottelo.cli.base import Base
+from robottelo.cli.content_export import ContentExport
+from robottelo.cli.hammer_shell import HammerShell, HammerShellError
+from robottelo.cli.lifecycleenvironment import LifecycleEnvironment
+from robottelo.cli.repository import Repository
+from robottelo.cli.response_cache import ResponseCache
+from robottelo.cli.telemetry import TimingRegistry, registry as timings, split_time_output
+from robottelo.cli.template_sync import TemplateSync
 from robottelo.exceptions import (
     CLIBaseError,
     CLIDataBaseError,
@@ -20,15 +34,22 @@ class CLIClass(Base):
     foreman_admin_password = 'adminpassword'
 
 
+class Organization(Base):
+    """Class used for the tests building complete commands"""
+
+    command_base = 'organization'
+    command_requires_org = False
+
+
 class BaseCliTestCase(unittest.TestCase):
     """Tests for the Base cli class"""
 
     def test_construct_command(self):
         """_construct_command builds a command using flags and arguments"""
         Base.command_base = 'basecommand'
-        Base.command_sub = 'subcommand'
         command_parts = Base._construct_command(
-            {'flag-one': True, 'flag-two': False, 'argument': 'value', 'ommited-arg': None}
+            {'flag-one': True, 'flag-two': False, 'argument': 'value', 'ommited-arg': None},
+            command_sub='subcommand',
         ).split()
 
         assert 'basecommand' in command_parts
@@ -128,6 +149,18 @@ class BaseCliTestCase(unittest.TestCase):
         for msg in msgs:
             self.assert_response_error(CLIDataBaseError, msg)
 
+    def test_handle_response_error_names_command(self):
+        """Check handle_response names the failing command without its options"""
+        response = mock.Mock()
+        response.status = 1
+        response.stderr = 'some error'
+        with pytest.raises(CLIReturnCodeError) as err:
+            Base._handle_response(
+                response, command='user create --login="foo" --password="secret" '
+            )
+        assert 'Command "user create" finished with status 1' in err.value.msg
+        assert 'secret' not in err.value.msg
+
     def assert_response_error(self, expected_error, stderr='some error'):
         """Check error is raised when handling cli response
         :param expected_error: expected error (class)
@@ -144,12 +177,11 @@ class BaseCliTestCase(unittest.TestCase):
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_add_operating_system(self, construct, execute):
-        """Check command_sub edited when executing add_operating_system"""
+        """Check command_sub passed when executing add_operating_system"""
         options = {'foo': 'bar'}
-        assert Base.command_sub != 'add-operatingsystem'
         assert execute.return_value == Base.add_operating_system(options)
-        assert Base.command_sub == 'add-operatingsystem'
-        construct.assert_called_once_with(options)
+        assert Base.command_sub is None
+        construct.assert_called_once_with(options, command_sub='add-operatingsystem')
         execute.assert_called_once_with(construct.return_value)
 
     @mock.patch('robottelo.cli.base.Base.execute')
@@ -158,8 +190,8 @@ class BaseCliTestCase(unittest.TestCase):
         """Check command create when result is empty"""
         execute.return_value = []
         assert execute.return_value == Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        assert Base.command_sub is None
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
     @mock.patch('robottelo.cli.base.Base.info')
@@ -169,8 +201,8 @@ class BaseCliTestCase(unittest.TestCase):
         """Check command create when result has dct but dct hasn't id key"""
         execute.return_value = [{'not_id': 'foo'}]
         assert execute.return_value == Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        assert Base.command_sub is None
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         assert not info.called
 
@@ -184,8 +216,8 @@ class BaseCliTestCase(unittest.TestCase):
         execute.return_value = [{'id': 'foo', 'bar': 'bas'}]
         Base.command_requires_org = False
         assert execute.return_value == Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        assert Base.command_sub is None
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo'})
 
@@ -199,8 +231,8 @@ class BaseCliTestCase(unittest.TestCase):
         execute.return_value = [{'id': 'foo', 'bar': 'bas'}]
         Base.command_requires_org = True
         assert execute.return_value == Base.create({'organization-id': 'org-id'})
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({'organization-id': 'org-id'})
+        assert Base.command_sub is None
+        construct.assert_called_once_with({'organization-id': 'org-id'}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo', 'organization-id': 'org-id'})
 
@@ -214,17 +246,32 @@ class BaseCliTestCase(unittest.TestCase):
         Base.command_requires_org = True
         with pytest.raises(CLIError):
             Base.create()
-        assert Base.command_sub == 'create'
-        construct.assert_called_once_with({})
+        assert Base.command_sub is None
+        construct.assert_called_once_with({}, command_sub='create')
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
+    @mock.patch('robottelo.cli.repository.Repository.execute')
+    def test_repository_create_keeps_class_state(self, execute):
+        """Repository reads the new repository without organization-id, per call"""
+        execute.side_effect = [[{'id': 'foo'}], 'Id: foo\n']
+        assert Repository.create({'product-id': 1}) == {'id': 'foo'}
+        assert Repository.command_requires_org is True
+        assert execute.call_args_list[1].kwargs['command'].startswith('repository info --id="foo"')
+
+    @mock.patch('robottelo.cli.template_sync.TemplateSync.execute')
+    def test_template_sync_keeps_class_state(self, execute):
+        """TemplateSync passes its command per call"""
+        TemplateSync.exports({'repo': 'r'})
+        execute.assert_called_once_with('export-templates  --repo="r" ')
+        assert 'command_base' not in vars(TemplateSync)
+
     def assert_cmd_execution(
         self, construct, execute, base_method, cmd_sub, ignore_stderr=False, **base_method_kwargs
     ):
         """Asssert Base class method successfully executed"""
         assert execute.return_value == base_method(**base_method_kwargs)
-        assert cmd_sub == Base.command_sub
-        construct.assert_called_once_with(base_method_kwargs.get('options'))
+        assert Base.command_sub is None
+        construct.assert_called_once_with(base_method_kwargs.get('options'), command_sub=cmd_sub)
         execute.assert_called_once_with(
             construct.return_value, ignore_stderr=ignore_stderr, timeout=None
         )
@@ -269,39 +316,356 @@ class BaseCliTestCase(unittest.TestCase):
     @mock.patch('robottelo.cli.base.ssh.command')
     @mock.patch('robottelo.cli.base.settings')
     def test_execute_with_performance(self, settings, command, handle_resp):
-        """Check executed build ssh method and delegate response handling"""
+        """Check timed commands are recorded in the timing registry"""
         settings.robottelo.locale = 'en_US'
-        settings.performance.timer_hammer = True
+        settings.performance.time_hammer = True
         settings.server.admin_username = 'admin'
         settings.server.admin_password = 'password'
+        command.return_value = Result(
+            status=0, stdout='[{"Id": 1}]', stderr='Warning\nreal 1.50\nuser 0.80\nsys 0.10\n'
+        )
+        timings.clear()
         response = Base.execute('some_cmd', hostname=None, output_format='json')
         ssh_cmd = 'LANG=en_US time -p hammer -v -u admin -p password --output=json some_cmd'
         command.assert_called_once_with(
             ssh_cmd,
             hostname=mock.ANY,
-            output_format='json',
+            output_format=None,
             timeout=None,
         )
-        handle_resp.assert_called_once_with(command.return_value, ignore_stderr=None)
+        handle_resp.assert_called_once_with(
+            command.return_value, ignore_stderr=None, command='some_cmd'
+        )
         assert response is handle_resp.return_value
+        assert command.return_value.stdout == [{'id': '1'}]
+        assert command.return_value.stderr == 'Warning'
+        summary = timings.summary()['some_cmd']
+        assert summary['server']['p99'] == 1.5
+        assert summary['bytes']['max'] == len('[{"Id": 1}]Warning')
+        assert {'client', 'parse'} <= set(summary)
+
+    @staticmethod
+    def run_batch_locally(script, fake_hammer=None, **kwargs):
+        """Run an ``execute_many`` script with bash against a fake hammer executable"""
+        fake_hammer = fake_hammer or (
+            '#!/bin/bash\n'
+            'case "${@: -1}" in\n'
+            '  list) printf "Id,Name\\n1,foo\\n2,bar\\n";;\n'
+            '  info) printf "Id: 1\\nName: foo\\n"; echo "a warning" >&2;;\n'
+            '  *) echo "Error: unknown subcommand" >&2; exit 64;;\n'
+            'esac\n'
+        )
+        with tempfile.TemporaryDirectory() as bin_dir:
+            hammer = Path(bin_dir, 'hammer')
+            hammer.write_text(fake_hammer)
+            hammer.chmod(0o755)
+            proc = subprocess.run(
+                ['bash', '-c', script],
+                capture_output=True,
+                text=True,
+                env={**os.environ, 'PATH': f'{bin_dir}:{os.environ["PATH"]}'},
+            )
+        return Result(stdout=proc.stdout, stderr=proc.stderr, status=proc.returncode)
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_many(self, settings, command):
+        """Check execute_many runs all commands in one ssh call and parses each result"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        command.side_effect = self.run_batch_locally
+        results = Base.execute_many(
+            [('org list', 'csv'), ('org info', 'info'), 'org list'],
+            user='admin',
+            password='password',
+            ignore_stderr=True,
+        )
+        command.assert_called_once()
+        assert results == [
+            [{'id': '1', 'name': 'foo'}, {'id': '2', 'name': 'bar'}],
+            {'id': '1', 'name': 'foo'},
+            'Id,Name\n1,foo\n2,bar\n',
+        ]
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_many_with_error(self, settings, command):
+        """Check execute_many reports the failing command of a batch"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        command.side_effect = self.run_batch_locally
+        batch = [('org list', 'csv'), 'org fail', ('org info', 'info')]
+        with pytest.raises(CLIReturnCodeError, match='Command "org fail" finished with status 64'):
+            Base.execute_many(batch, user='admin', password='password')
+        first, failed, last = Base.execute_many(
+            batch, user='admin', password='password', raise_on_error=False
+        )
+        assert first[0]['name'] == 'foo'
+        assert isinstance(failed, CLIReturnCodeError)
+        assert failed.stderr == 'Error: unknown subcommand\n'
+        assert last['name'] == 'foo'
+
+    @mock.patch('robottelo.cli.base.Base.command_requires_org', False)
+    @mock.patch('robottelo.cli.base.Base.command_base', 'org')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_create_in_single_round_trip(self, settings, command):
+        """Check create reads the new entity back in the same ssh call"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.performance.single_round_trip_create = True
+        settings.performance.json_info = False
+        settings.performance.hammer_command_tree.validate_options = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        fake_hammer = (
+            '#!/bin/bash\n'
+            'case "$*" in\n'
+            '  *"org create --name=foo") printf "Message,Id,Name\\nOrg created.,42,foo\\n";;\n'
+            '  *"--output=json org info --id=42") printf \'{"Id": 42, "Name": "foo", "Label": "foo"}\';;\n'
+            '  *"org info --id=42") printf "Id: 42\\nName: foo\\n";;\n'
+            '  *"org create --name=baz") printf "Message,Id,Name\\nOrg created.,43,baz\\n";;\n'
+            '  *"org info --id=43") printf "Id: 42\\nName: foo\\n";;\n'
+            '  *"org create --name=bar") echo "Name has already been taken" >&2; exit 65;;\n'
+            '  *) exit 64;;\n'
+            'esac\n'
+        )
+        command.side_effect = partial(self.run_batch_locally, fake_hammer=fake_hammer)
+        with mock.patch('robottelo.cli.base.Base.info') as info:
+            assert Base.create({'name': 'foo'}) == {'id': '42', 'name': 'foo'}
+            command.assert_called_once()
+            info.assert_not_called()
+            with pytest.raises(CLIReturnCodeError, match='Name has already been taken'):
+                Base.create({'name': 'bar'})
+            # the entity read back must be the one created
+            with pytest.raises(CLIError, match='read back the entity 42 instead of .* 43'):
+                Base.create({'name': 'baz'})
+            # read back like info reads it
+            settings.performance.json_info = True
+            assert Base.create({'name': 'foo'}) == {'id': '42', 'name': 'foo', 'label': 'foo'}
+            info.assert_not_called()
+
+    @mock.patch('robottelo.cli.hammer_session.settings')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_hammer_session(self, settings, command, session_settings):
+        """Check commands reuse a cached hammer session and log in again when it expired"""
+        settings.robottelo.locale = session_settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        session_settings.performance.get.return_value = {'enabled': True, 'idle_timeout': 1800}
+        logged_in = Result(status=0, stdout='Successfully logged in.', stderr='')
+        done = Result(status=0, stdout='done', stderr='')
+        expired = Result(status=129, stdout='', stderr='Session has expired.')
+        command.side_effect = [logged_in, done, expired, logged_in, done]
+        with mock.patch.dict(hammer_session._sessions, clear=True):
+            assert Base.execute('org list', hostname='sat') == 'done'
+            assert Base.execute('org list', hostname='sat') == 'done'
+        logins = [c.args[0] for c in command.call_args_list if 'auth login' in c.args[0]]
+        assert len(logins) == 2
+        assert 'auth login basic -u admin -p password' in logins[0]
+        cmd = command.call_args.args[0]
+        assert cmd.startswith(f'LANG=en_US HOME={hammer_session.SESSIONS_DIR}/')
+        assert 'hammer -v --interactive no' in cmd
+        assert '-p password' not in cmd
+
+    @mock.patch('robottelo.cli.hammer_session.settings')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_hammer_session_bad_credentials(self, settings, command, session_settings):
+        """Check a bad credentials error is raised as is, without logging in again"""
+        settings.robottelo.locale = session_settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        session_settings.performance.get.return_value = {'enabled': True, 'idle_timeout': 1800}
+        logged_in = Result(status=0, stdout='Successfully logged in.', stderr='')
+        denied = Result(status=129, stdout='', stderr='Invalid username or password.')
+        command.side_effect = [logged_in, denied]
+        with (
+            mock.patch.dict(hammer_session._sessions, clear=True),
+            pytest.raises(CLIReturnCodeError, match='Invalid username or password'),
+        ):
+            Base.with_user('viewer', 'wrong').execute('org list', hostname='sat')
+        assert command.call_count == 2
+        assert not hammer_session.is_session_expired(denied.stderr)
+
+    def test_hammer_session_links_user_config(self):
+        """Check the session home links the hammer config of the ssh user, except its sessions"""
+        with tempfile.TemporaryDirectory() as tmp:
+            home = Path(tmp, 'root')
+            (home / '.hammer/cli.modules.d').mkdir(parents=True)
+            (home / '.hammer/cli.modules.d/foreman.yml').write_text(':foreman: {}')
+            (home / '.hammer/sessions').mkdir()
+            session = hammer_session.HammerSession('sat', 'admin', 'password')
+            session.home = f'{tmp}/session'
+            subprocess.run(
+                ['sh', '-c', session.setup_script()],
+                env={**os.environ, 'HOME': str(home)},
+                check=True,
+            )
+            hammer_dir = Path(session.home, '.hammer')
+            assert (hammer_dir / 'cli.modules.d/foreman.yml').resolve() == (
+                home / '.hammer/cli.modules.d/foreman.yml'
+            )
+            assert 'use_sessions' in (hammer_dir / 'cli.modules.d/foreman_sessions.yml').read_text()
+            assert not (hammer_dir / 'sessions').exists()
+            # hammer defaults written in the session home land in the home of the ssh user
+            (hammer_dir / 'defaults.yml').write_text(':defaults: {}')
+            assert (home / '.hammer/defaults.yml').read_text() == ':defaults: {}'
+
+    @mock.patch('robottelo.cli.base.time.sleep')
+    @mock.patch('robottelo.cli.base.Base.info')
+    def test_poll_info_backs_off(self, info, sleep):
+        """Check info is polled with growing delays until it succeeds"""
+        info.side_effect = [CLIReturnCodeError(1, 'not found', 'msg')] * 6 + [{'id': '1'}]
+        assert Base._poll_info({'id': '1'}) == {'id': '1'}
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1, 2, 4, 8, 10]
+
+    @mock.patch('robottelo.cli.base.time.sleep')
+    @mock.patch('robottelo.cli.base.Base.info')
+    def test_poll_info_retries_any_exception(self, info, sleep):
+        """Check info is polled again after errors other than hammer errors"""
+        info.side_effect = [ConnectionResetError('reset'), KeyError('id'), {'id': '1'}]
+        assert Base._poll_info({'id': '1'}) == {'id': '1'}
+        assert sleep.call_count == 2
+        info.side_effect = ValueError('unparsable')
+        assert Base._poll_info({'id': '1'}, timeout=0) is None
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.get_hammer_shell')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_hammer_shell(self, settings, get_shell, command):
+        """Check execute runs plain commands in the resident hammer process"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance = mock.MagicMock(
+            time_hammer=False, get=lambda name, default=None: 'shell'
+        )
+        get_shell.return_value.run.return_value = Result(
+            status=0, stdout='Id,Name\n1,foo\n', stderr=''
+        )
+        response = Base.execute(
+            'org list', hostname='sat', user='admin', password='password', output_format='csv'
+        )
+        assert response == [{'id': '1', 'name': 'foo'}]
+        get_shell.assert_called_once_with('sat', 'admin', 'password', locale='en_US')
+        get_shell.return_value.run.assert_called_once_with(
+            'org list', output_format='csv', timeout=None
+        )
+        command.assert_not_called()
+        # shell syntax still needs a remote shell
+        Base.execute(
+            'org list | head -1',
+            hostname='sat',
+            user='admin',
+            password='password',
+            return_raw_response=True,
+        )
+        get_shell.return_value.run.assert_called_once()
+        command.assert_called_once()
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.get_hammer_shell')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_hammer_shell_fallback(self, settings, get_shell, command):
+        """Check execute falls back to ssh when the resident hammer process fails"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance = mock.MagicMock(
+            time_hammer=False, get=lambda name, default=None: 'shell'
+        )
+        get_shell.return_value.run.side_effect = HammerShellError('hammer shell on sat failed')
+        command.return_value = Result(status=0, stdout='done', stderr='')
+        assert Base.execute('org list', hostname='sat', user='admin', password='p') == 'done'
+        command.assert_called_once_with(
+            'LANG=en_US  hammer -v -u admin -p p  org list',
+            hostname='sat',
+            output_format=None,
+            timeout=None,
+        )
 
-    @mock.patch('robottelo.cli.base.Base.list')
-    def test_exists_without_option_and_empty_return(self, lst_method):
+    def test_hammer_shell_run(self):
+        """Check the resident hammer process request and response framing"""
+        shell = HammerShell('sat', user='admin', password='password')
+        client = mock.MagicMock()
+        sent = client.session.shell.return_value.send
+        client.session.shell.return_value.read.side_effect = [
+            (9, b'warning\n__'),
+            (100, b'robottelo_hammer_shell__ {"status": 0, "stdout": "out", "stderr": ""}\n'),
+        ]
+        client.execute.return_value = Result(status=0, stdout='', stderr='')
+        with mock.patch('robottelo.cli.hammer_shell.ssh') as ssh:
+            ssh.connection_pool.factory.return_value = client
+            result = shell.run("org info --name 'my org'", output_format='json', timeout='5m')
+        assert (result.status, result.stdout) == (0, 'out')
+        client.session.session.set_timeout.assert_called_once_with(300000)
+        assert json.loads(sent.call_args.args[0])['args'] == [
+            '-v',
+            '-u',
+            'admin',
+            '-p',
+            'password',
+            '--output=json',
+            'org',
+            'info',
+            '--name',
+            'my org',
+        ]
+        # a dead channel closes the process, the next run starts a new one
+        client.session.shell.return_value.read.side_effect = [(0, b'')]
+        with pytest.raises(HammerShellError), mock.patch('robottelo.cli.hammer_shell.ssh'):
+            shell.run('org list')
+        client.close.assert_called_once()
+        assert shell._channel is None
+
+    @mock.patch('robottelo.cli.base.Base.iter_list')
+    def test_exists_without_option_and_empty_return(self, iter_list):
         """Check exists method without options and empty return"""
-        lst_method.return_value = []
+        iter_list.return_value = iter([])
         response = Base.exists(search=['id', 1])
-        lst_method.assert_called_once_with({'search': 'id=\\"1\\"'})
+        iter_list.assert_called_once_with({'search': 'id=\\"1\\"'}, per_page=1)
         assert response == []
 
-    @mock.patch('robottelo.cli.base.Base.list')
-    def test_exists_with_option_and_no_empty_return(self, lst_method):
+    @mock.patch('robottelo.cli.base.Base.iter_list')
+    def test_exists_with_option_and_no_empty_return(self, iter_list):
         """Check exists method with options and no empty return"""
-        lst_method.return_value = [1, 2]
+        iter_list.return_value = iter([1, 2])
         my_options = {'search': 'foo=bar'}
         response = Base.exists(my_options, search=['id', 1])
-        lst_method.assert_called_once_with(my_options)
+        iter_list.assert_called_once_with(my_options, per_page=1)
         assert response == 1
 
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_exists_uses_subclass_list(self, execute):
+        """Check exists goes through the list overrides of subclasses, fetching one entity"""
+        execute.return_value = [{'id': '1'}]
+        assert LifecycleEnvironment.exists(search=['name', 'Library']) == {'id': '1'}
+        assert '--per-page="1"' in execute.call_args.args[0]
+        assert ContentExport.exists(search=['id', 1]) == {'id': '1'}
+        assert '--per-page="1"' in execute.call_args.args[0]
+        assert execute.call_args.kwargs == {'output_format': 'json'}
+        execute.return_value = []
+        assert ContentExport.exists(search=['id', 2]) == []
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_iter_list(self, execute):
+        """Check iter_list fetches pages lazily until a short page"""
+        execute.side_effect = [[1, 2], [3, 4], [5]]
+        entities = Base.iter_list({'organization-id': 1}, per_page=2)
+        assert next(entities) == 1
+        assert execute.call_count == 1
+        assert list(entities) == [2, 3, 4, 5]
+        assert execute.call_count == 3
+        assert '--organization-id="1" --per-page="2" --page="3"' in execute.call_args.args[0]
+        assert execute.call_args.kwargs == {'output_format': 'csv'}
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_iter_list_stops_early(self, execute):
+        """Check iter_list does not fetch pages the caller does not consume"""
+        execute.return_value = [{'id': '1'}] * 3
+        entities = Base.iter_list({'per-page': 3, 'page': 5})
+        assert [next(entities) for _ in range(4)] == [{'id': '1'}] * 4
+        assert execute.call_count == 2
+        assert 'per-page="3" --page="6"' in execute.call_args.args[0]
+
     @mock.patch('robottelo.cli.base.Base.command_requires_org')
     def test_info_requires_organization_id(self, _):  # noqa: PT019 - not a fixture
         """Check info raises CLIError with organization-id is not present in
@@ -322,8 +686,8 @@ class BaseCliTestCase(unittest.TestCase):
     ):
         """Asssert Base class method successfully executed"""
         assert execute.return_value == base_method(**base_method_kwargs)
-        assert cmd_sub == Base.command_sub
-        construct.assert_called_once_with(base_method_kwargs.get('options'))
+        assert Base.command_sub is None
+        construct.assert_called_once_with(base_method_kwargs.get('options'), command_sub=cmd_sub)
         if command_kwarg:
             execute.assert_called_once_with(command=construct.return_value, **call_kwargs)
         else:
@@ -366,8 +730,10 @@ class BaseCliTestCase(unittest.TestCase):
     def test_list_with_default_per_page(self, construct, execute):
         """Check list method set per_page as 1000 by default"""
         assert execute.return_value == Base.list(options={'organization-id': 1})
-        assert Base.command_sub == 'list'
-        construct.assert_called_once_with({'organization-id': 1, 'per-page': 10000})
+        assert Base.command_sub is None
+        construct.assert_called_once_with(
+            {'organization-id': 1, 'per-page': 10000}, command_sub='list'
+        )
         execute.assert_called_once_with(construct.return_value, output_format='csv')
 
     @mock.patch('robottelo.cli.base.Base.execute')
@@ -387,6 +753,58 @@ class BaseCliTestCase(unittest.TestCase):
             options={'organization-id': 1},
         )
 
+    @mock.patch.object(Organization, 'execute')
+    def test_list_and_info_fields(self, execute):
+        """Check fields are requested with the hammer --fields option"""
+        options = {'organization-id': 1}
+        Organization.list(options, per_page=False, fields=['Id', 'Name'])
+        assert execute.call_args.args[0].split() == [
+            'organization',
+            'list',
+            '--organization-id="1"',
+            '--fields="Id,Name"',
+        ]
+        Organization.info({'id': 1}, fields='Content view')
+        assert execute.call_args.kwargs['command'].split() == [
+            'organization',
+            'info',
+            '--id="1"',
+            '--fields="Content',
+            'view"',
+        ]
+        assert options == {'organization-id': 1}
+
+    @mock.patch.object(Organization, 'execute')
+    def test_query(self, execute):
+        """Check queries build the options and fields of list commands"""
+        query = Organization.query({'organization-id': 1}).search('name ~ foo').fields('Id')
+        execute.return_value = [{'id': '1'}]
+        assert query.where(location_id=2).search('os = RedHat').fields('Name').first() == {
+            'id': '1'
+        }
+        assert execute.call_args.args[0].split() == [
+            'organization',
+            'list',
+            '--organization-id="1"',
+            '--search="(name',
+            '~',
+            'foo)',
+            'and',
+            '(os',
+            '=',
+            'RedHat)"',
+            '--location-id="2"',
+            '--fields="Id,Name"',
+            '--per-page="1"',
+            '--page="1"',
+        ]
+        # deriving queries leaves the original one untouched
+        assert query.command_options() == {
+            'organization-id': 1,
+            'search': 'name ~ foo',
+            'fields': ['Id'],
+        }
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_puppet_classes(self, construct, execute):
@@ -453,6 +871,108 @@ class BaseCliTestCase(unittest.TestCase):
         )
 
 
+class ResponseCacheTestCase(unittest.TestCase):
+    """Tests for the hammer response cache"""
+
+    def test_key_ignores_options_order(self):
+        """Check the cache key does not depend on the options order"""
+        assert ResponseCache.key('org', 'info', {'id': 1, 'fields': 'Name'}) == ResponseCache.key(
+            'org', 'info', {'fields': 'Name', 'id': '1'}
+        )
+
+    def test_lru_and_ttl(self):
+        """Check least recently used and expired responses are dropped"""
+        cache = ResponseCache(ttl=60, size=2)
+        cache.set('a', {'id': 1})
+        cache.set('b', {'id': 2})
+        cache.get('a')['id'] = 'changed'
+        cache.set('c', {'id': 3})
+        assert cache.get('a') == {'id': 1}
+        with pytest.raises(KeyError):
+            cache.get('b')
+        with (
+            mock.patch('robottelo.cli.response_cache.time.monotonic', return_value=1e12),
+            pytest.raises(KeyError),
+        ):
+            cache.get('c')
+        assert cache.stats() == {
+            'hits': 2,
+            'misses': 2,
+            'evictions': 1,
+            'invalidations': 0,
+            'size': 1,
+        }
+
+    def test_invalidate_response_cache(self):
+        """Check only the responses of the given host are dropped"""
+        sat, other = ResponseCache(), ResponseCache()
+        sat.set('a', {'id': 1})
+        other.set('a', {'id': 1})
+        with mock.patch.dict(response_cache._caches, {'sat': sat, 'other': other}, clear=True):
+            response_cache.invalidate_response_cache('sat')
+            response_cache.invalidate_response_cache('unknown')
+        assert sat.stats()['invalidations'] == 1
+        assert other.stats()['size'] == 1
+
+    @mock.patch('robottelo.cli.base.Base.command_requires_org', False)
+    @mock.patch('robottelo.cli.base.Base.command_base', 'org')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.get_response_cache')
+    def test_read_through_and_invalidation(self, get_cache, command):
+        """Check info is served from the cache until the entity is written"""
+        cache = get_cache.return_value = ResponseCache()
+        command.return_value = Result(status=0, stdout='Id: 1\nName: foo\n', stderr='')
+        assert Base.info({'id': 1}) == {'id': '1', 'name': 'foo'}
+        assert Base.info({'id': '1'}) == {'id': '1', 'name': 'foo'}
+        assert command.call_count == 1
+        Base.list({'search': 'name=foo'})
+        assert cache.stats()['size'] == 2
+        Base.update({'id': 1, 'new-name': 'bar'})
+        assert cache.stats()['size'] == 0
+        Base.info({'id': 1})
+        assert command.call_count == 4
+        # writes of other command bases may change the cached entities too
+        cache.set(ResponseCache.key('product', 'list'), [])
+        with mock.patch('robottelo.cli.base.Base.command_base', 'org'):
+            Base.delete({'id': 1})
+        assert cache.stats()['size'] == 0
+
+
+class TimingRegistryTestCase(unittest.TestCase):
+    """Tests for the hammer timing telemetry"""
+
+    def test_split_time_output(self):
+        """Check the time -p report is split from stderr"""
+        assert split_time_output('real 0.25\nuser 0.20\nsys 0.01\n') == ('', 0.25)
+        assert split_time_output('oops\nreal 2.00\nuser 1.00\nsys 0.50') == ('oops', 2.0)
+        assert split_time_output('oops\n') == ('oops\n', None)
+
+    def test_summary_and_dump(self):
+        """Check percentiles are computed per command and dumped as json and csv"""
+        registry = TimingRegistry()
+        for value in range(1, 101):
+            registry.record('org', 'list', client=value, server=None, bytes=10)
+        registry.record('org', 'info', parse=0.5)
+        summary = registry.summary()
+        assert list(summary) == ['org info', 'org list']
+        assert summary['org list']['client'] == {
+            'count': 100,
+            'mean': 50.5,
+            'max': 100,
+            'p50': 50,
+            'p95': 95,
+            'p99': 99,
+        }
+        assert set(summary['org list']) == {'client', 'bytes'}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path, csv_path = registry.dump(Path(tmpdir, 'hammer_timings_gw0'))
+            assert json.loads(json_path.read_text()) == summary
+            assert csv_path.read_text().splitlines()[:2] == [
+                'command,metric,count,mean,max,p50,p95,p99',
+                'org info,parse,1,0.5,0.5,0.5,0.5,0.5',
+            ]
+
+
 class CLIErrorTests(unittest.TestCase):
     """Tests for the CLIError cli class"""
 
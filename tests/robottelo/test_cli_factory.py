@@ -0,0 +1,58 @@
+"""Tests for Robottelo's CLIFactory"""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from robottelo.cli.registry import CLIRegistry
+from robottelo.cli.user import User
+from robottelo.config import get_server_hostname, pop_server_hostname, push_server_hostname
+from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
+from robottelo.host_helpers.cli_factory import CLIFactory
+
+created = []
+
+
+def create_user(options, timeout=None):
+    """Stand-in of ``User.create``, failing to create the user named 'taken'"""
+    if options['login'] == 'taken':
+        raise CLIReturnCodeError(65, 'Login has already been taken', 'user create failed')
+    created.append({**options, 'server': get_server_hostname()})
+    return {'login': options['login'], 'mail': options['mail']}
+
+
+@pytest.fixture
+def factory():
+    created.clear()
+    with mock.patch.object(User, 'create', side_effect=create_user):
+        yield CLIFactory(SimpleNamespace(cli=CLIRegistry('sat')))
+
+
+def test_make_many_generates_distinct_defaults(factory):
+    users = factory.make_many('user', 20, {'admin': 'true'}, workers=5)
+    assert len({user.login for user in users}) == 20
+    assert all(user.mail == f'{user.login}@example.com' for user in users)
+    assert all(options['admin'] == 'true' for options in created)
+
+
+def test_make_batch_collects_errors(factory):
+    items = [('user', {'login': 'first'}), ('user', {'login': 'taken'}), ('user', None)]
+    results = factory.make_batch(items, raise_on_error=False)
+    assert results[0].login == 'first'
+    assert isinstance(results[1], CLIFactoryError)
+    assert results[2].login
+    with pytest.raises(CLIFactoryError, match=r'1 of 3 entities could not be created:\n1 user: '):
+        factory.make_batch(items)
+    User.create.reset_mock()
+    assert factory.make_batch([]) == []
+    User.create.assert_not_called()
+
+
+def test_make_batch_keeps_the_caller_target(factory):
+    push_server_hostname('other.example.com')
+    try:
+        factory.make_many('user', 4, workers=4)
+    finally:
+        pop_server_hostname()
+    assert [options['server'] for options in created] == ['other.example.com'] * 4
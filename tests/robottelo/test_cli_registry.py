@@ -0,0 +1,48 @@
+"""Tests for Robottelo's cli class registry"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robottelo.cli import registry
+from robottelo.cli.base import Base, credentials_omitted
+from robottelo.cli.org import Org
+from robottelo.cli.sm_health import Health
+
+
+def test_classes_are_bound_and_memoized():
+    cli = registry.get_cli_registry('sat.example.com')
+    assert cli is registry.get_cli_registry('sat.example.com')
+    assert issubclass(cli.Org, Org)
+    assert cli.Org.hostname == 'sat.example.com'
+    assert cli.Org is cli.Org
+    assert cli.Org is not registry.get_cli_registry('other.example.com').Org
+    assert cli.find('content_view').command_base == 'content-view'
+    assert cli.find('nothing') is None
+    # classes that are not cli classes are not exposed
+    with pytest.raises(AttributeError):
+        cli.CapsuleTunnelError  # noqa: B018 - attribute access raising
+
+
+def test_prefix_and_class_attributes():
+    cli = registry.CLIRegistry('capsule.example.com', prefix='sm_')
+    assert issubclass(cli.Health, Health)
+    assert issubclass(cli.Base, Base)
+    with pytest.raises(AttributeError):
+        cli.Org  # noqa: B018 - attribute access raising
+    made = cli.Health
+    cli.set_class_attribute('omitting_credentials', True)
+    assert made.omitting_credentials is True
+    assert cli.Backup.omitting_credentials is True
+    assert not Health.omitting_credentials
+
+
+def test_omitted_credentials_are_scoped_to_the_block():
+    cli = registry.get_cli_registry('omit.example.com')
+    with credentials_omitted('omit.example.com'):
+        assert cli.Org._hammer_credentials() == (None, None)
+        assert registry.get_cli_registry('other.example.com').Org._hammer_credentials()[0]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(cli.Org._hammer_credentials).result()[0]
+    assert cli.Org._hammer_credentials()[0]
+    assert not cli.Org.omitting_credentials
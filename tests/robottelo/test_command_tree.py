@@ -0,0 +1,121 @@
+"""Tests for Robottelo's hammer command tree"""
+
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.cli import command_tree
+from robottelo.cli.base import Base
+from robottelo.cli.command_tree import CommandTree, generate_command_tree
+from robottelo.exceptions import CLIError
+
+HELP = {
+    'hammer': 'Options:\n --verbose  Be verbose\n\nSubcommands:\n organization  Manipulate orgs\n',
+    'hammer organization': (
+        'Subcommands:\n create  Create an org\n info  Show an org\n content-view  Manipulate CVs\n'
+    ),
+    'hammer organization create': (
+        'Options:\n --name NAME  Name\n --label LABEL  Label\n'
+        ' --[no-]default  Default\n --old-name, --legacy NAME  Old name\n'
+    ),
+    'hammer organization info': 'Options:\n --id ID  Id\n',
+    'hammer organization content-view': 'Subcommands:\n list  List CVs\n',
+    'hammer organization content-view list': 'Options:\n --per-page PER_PAGE  Page size\n',
+}
+
+
+def fake_help(cmd, hostname=None):
+    return Result(status=0, stdout=HELP[cmd.removesuffix(' --help')], stderr='')
+
+
+@pytest.fixture
+def tree():
+    with mock.patch('robottelo.cli.command_tree.ssh.command', side_effect=fake_help):
+        return generate_command_tree('sat', workers=4)
+
+
+class TestCommandTree:
+    """Tests for generating and querying the hammer command tree"""
+
+    def test_generate_command_tree(self, tree):
+        [organization] = tree['subcommands']
+        assert [sub['name'] for sub in organization['subcommands']] == [
+            'create',
+            'info',
+            'content-view',
+        ]
+        assert organization['subcommands'][2]['subcommands'][0]['options'][0]['name'] == (
+            'per-page'
+        )
+
+    def test_validate_options(self, tree):
+        index = CommandTree(tree)
+        index.validate_options('organization create', ['name', 'label', 'verbose'])
+        index.validate_options('organization content-view list', ['per-page'])
+        # commands missing from the tree are not validated
+        index.validate_options('location create', ['whatever'])
+        # deprecation names and negated forms are accepted too
+        index.validate_options(
+            'organization create',
+            ['default', 'no-default', 'old-name', 'legacy'],
+        )
+        with pytest.raises(CLIError, match=r'--lable \(did you mean --label\?\)'):
+            index.validate_options('organization create', ['name', 'lable'])
+
+    def test_get_command_tree_is_cached_per_version(self, tree, tmp_path):
+        def run(cmd, hostname=None):
+            if cmd == command_tree.VERSION_COMMAND:
+                return Result(status=0, stdout='6.17.0-1.el9sat', stderr='')
+            return fake_help(cmd)
+
+        with (
+            mock.patch.dict(command_tree._trees, clear=True),
+            mock.patch.object(command_tree, 'cache_path', lambda v: tmp_path / f'{v}.json'),
+            mock.patch('robottelo.cli.command_tree.ssh.command', side_effect=run) as ssh_command,
+        ):
+            assert command_tree.get_command_tree('sat').tree == tree
+            assert (tmp_path / '6.17.0-1.el9sat.json').exists()
+            command_tree._trees.clear()
+            ssh_command.reset_mock()
+            assert command_tree.get_command_tree('sat').tree == tree
+            ssh_command.assert_called_once()
+
+    def test_get_command_tree_retries_failures(self, tree, tmp_path):
+        results = iter([Result(status=1, stdout='', stderr='timed out')])
+
+        def run(cmd, hostname=None):
+            if cmd == command_tree.VERSION_COMMAND:
+                return next(results, Result(status=0, stdout='6.17.0-1.el9sat', stderr=''))
+            return fake_help(cmd)
+
+        with (
+            mock.patch.dict(command_tree._trees, clear=True),
+            mock.patch.dict(command_tree._failures, clear=True),
+            mock.patch.object(command_tree, 'cache_path', lambda v: tmp_path / f'{v}.json'),
+            mock.patch('robottelo.cli.command_tree.ssh.command', side_effect=run) as ssh_command,
+            mock.patch('robottelo.cli.command_tree.time.monotonic', return_value=100),
+        ):
+            assert command_tree.get_command_tree('sat') is None
+            ssh_command.reset_mock()
+            assert command_tree.get_command_tree('sat') is None
+            ssh_command.assert_not_called()
+            with mock.patch(
+                'robottelo.cli.command_tree.time.monotonic',
+                return_value=100 + command_tree.FAILURE_RETRY_DELAY,
+            ):
+                assert command_tree.get_command_tree('sat').tree == tree
+            assert 'sat' not in command_tree._failures
+
+    def test_construct_command_validates_options(self, tree):
+        class Organization(Base):
+            command_base = 'organization'
+
+        with (
+            mock.patch('robottelo.cli.base.settings') as settings,
+            mock.patch('robottelo.cli.base.get_command_tree', return_value=CommandTree(tree)),
+        ):
+            settings.performance.hammer_command_tree.validate_options = True
+            assert Organization._construct_command({'id': 1, 'name': None}, command_sub='info')
+            with pytest.raises(CLIError, match='hammer organization info does not accept --nme'):
+                Organization._construct_command({'nme': 'foo'}, command_sub='info')
@@ -109,6 +109,16 @@ class TestParseJSON:
 
         assert hammer.parse_json(json_output) == hammer.parse_csv(csv_ouput_lines)[0]
 
+    def test_parse_json_documents(self):
+        """Can parse the documents hammer prints one after another"""
+        output = '{\n  "Message": "Host created."\n}\n[\n  {\n    "Host ID": 7\n  }\n]\n{\n  "ID": 8\n}\n'
+        assert list(hammer.iter_json(output)) == [
+            {'message': 'Host created.'},
+            [{'host-id': '7'}],
+            {'id': '8'},
+        ]
+        assert hammer.parse_json(output) == {'id': '8'}
+
 
 class TestParseHelp:
     """Tests for parsing hammer help output"""
@@ -0,0 +1,89 @@
+"""Benchmarks for Robottelo's hammer parsers
+
+Large outputs are built by growing the lists of recorded hammer outputs. To catch speed
+regressions, save a baseline and compare later runs against it::
+
+    pytest tests/robottelo/test_hammer_benchmark.py --benchmark-autosave
+    pytest tests/robottelo/test_hammer_benchmark.py --benchmark-compare \
+        --benchmark-compare-fail=mean:20%
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from robottelo.cli import hammer
+
+pytest.importorskip('pytest_benchmark')
+
+DATA_DIR = Path(__file__).parent / 'data'
+SIZES = [10, 1000, 5000]
+
+
+def host_info(size):
+    """Recorded ``host info`` output with ``size`` parameters and activation keys"""
+    output = DATA_DIR.joinpath('hammer_host_info.txt').read_text()
+    parameters = ''.join(f'    param{i} => value{i}\n' for i in range(size))
+    keys = ''.join(f'     {i}) ak{i}\n' for i in range(1, size + 1))
+    return output.replace(
+        '    enable-puppet5 => true\n', f'    enable-puppet5 => true\n{parameters}'
+    ).replace('     1) ak1\n', keys)
+
+
+def content_view_version_info(size):
+    """Recorded ``content-view version info`` output with ``size`` repositories"""
+    output = DATA_DIR.joinpath('hammer_content_view_version_info.txt').read_text()
+    head, repositories = output.split('Repositories:\n')
+    _, tail = repositories.split('Has Applied Filters')
+    repositories = ''.join(
+        f' {i}) Id:    {i}\n    Name:  repository{i}\n    Label: repository{i}\n'
+        for i in range(1, size + 1)
+    )
+    return f'{head}Repositories:\n{repositories}Has Applied Filters{tail}'
+
+
+def repository_list(size):
+    """``repository list --output json`` output of ``size`` repositories, after a message"""
+    repositories = [
+        {
+            'Id': i,
+            'Name': f'repository{i}',
+            'Product': 'product',
+            'Content Type': 'yum',
+            'Content Label': None,
+            'Url': f'https://example.com/repository{i}',
+        }
+        for i in range(1, size + 1)
+    ]
+    message = json.dumps({'Message': 'Repositories listed.'}, indent=2)
+    return f'{message}\n{json.dumps(repositories, indent=2)}\n'
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_parse_json_list(benchmark, size):
+    repositories = benchmark(hammer.parse_json, repository_list(size))
+    assert len(repositories) == size
+    assert repositories[-1]['id'] == str(size)
+    assert repositories[-1]['content-type'] == 'yum'
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_parse_host_info(benchmark, size):
+    info = benchmark(hammer.parse_info, host_info(size))
+    assert len(info['all-parameters']) == size + 2
+    assert info['subscription-information']['registered-by-activation-keys'][-1] == f'ak{size}'
+    assert info['content-information']['applicable-errata']['security'] == '0'
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_parse_content_view_version_info(benchmark, size):
+    info = benchmark(hammer.parse_info, content_view_version_info(size))
+    assert len(info['repositories']) == size
+    assert info['repositories'][-1] == {
+        'id': str(size),
+        'name': f'repository{size}',
+        'label': f'repository{size}',
+    }
+    assert info['errata-counts']['total'] == '8'
+    assert info['module-stream-count'] == '0'
@@ -0,0 +1,67 @@
+"""Tests for the concurrent calls of robottelo.hosts.HostFanout"""
+
+import threading
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.hosts import ContentHost, ContentHostError, HostFanout
+
+
+class FakeHost:
+    def __init__(self, hostname, barrier=None, release=None):
+        self.hostname = hostname
+        self.barrier = barrier
+        self.release = release
+        self.finished = False
+        self._execute_lock = threading.Lock()
+
+    def execute(self, command, timeout=None):
+        if self.barrier:
+            # every host must be running at the same time to pass the barrier
+            self.barrier.wait(timeout=5)
+        if self.release:
+            self.release.wait(timeout=5)
+        self.finished = True
+        if self.hostname == 'broken':
+            raise ConnectionError('no route to host')
+        return Result(stdout=f'{self.hostname}: {command}', stderr='', status=0)
+
+
+def test_execute_runs_hosts_concurrently():
+    barrier = threading.Barrier(5)
+    hosts = [FakeHost(f'host{i}', barrier=barrier) for i in range(5)]
+    results = ContentHost.execute_many(hosts, 'hostname')
+    assert list(results) == [host.hostname for host in hosts]
+    assert results['host3'].stdout == 'host3: hostname'
+    assert results.failed == []
+    for host in hosts:
+        host.barrier = None
+    per_host = HostFanout(hosts[:2]).execute({'host0': 'uptime', 'host1': 'id'})
+    assert [result.stdout for result in per_host.values()] == ['host0: uptime', 'host1: id']
+
+
+def test_failures_and_timeouts_are_isolated():
+    release = threading.Event()
+    slow = FakeHost('slow', release=release)
+    hosts = [FakeHost('ok'), FakeHost('broken'), slow]
+    try:
+        results = HostFanout(hosts, timeout=0.5).execute(lambda host: f'echo {host.hostname}')
+        # the results came back while the slow host is still running
+        assert not slow.finished
+        assert results['ok'].stdout == 'ok: echo ok'
+        assert isinstance(results['broken'], ConnectionError)
+        assert isinstance(results['slow'], TimeoutError)
+        assert sorted(results.errors) == results.failed == ['broken', 'slow']
+        with pytest.raises(ContentHostError, match='2 of 3 hosts failed'):
+            results.raise_for_errors()
+        # the command that timed out still holds the host, the next one gives up waiting for it
+        busy = HostFanout([slow], timeout=0.2).execute('id')
+        assert isinstance(busy['slow'], TimeoutError)
+        # functions are not serialized with the commands of the host
+        assert HostFanout([slow], timeout=1).map(lambda host: host.hostname) == {'slow': 'slow'}
+    finally:
+        release.set()
+    with pytest.raises(ContentHostError, match='broken: ConnectionError'):
+        HostFanout(hosts[:2]).map(lambda host: host.execute('id'), raise_on_error=True)
+    assert HostFanout([]).execute('id') == {}
@@ -0,0 +1,52 @@
+"""Tests for the fingerprint of robottelo.hosts.ContentHost"""
+
+from pathlib import Path
+import subprocess
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def host(local_host):
+    if not Path('/etc/os-release').exists():
+        pytest.skip('needs /etc/os-release')
+    return local_host
+
+
+def test_static_properties_share_one_round_trip(host):
+    version_id = subprocess.run(
+        ['sh', '-c', '. /etc/os-release; echo $VERSION_ID'], capture_output=True, text=True
+    ).stdout.strip()
+    assert host._os_release['VERSION_ID'] == version_id
+    assert (
+        host.arch == subprocess.run(['uname', '-m'], capture_output=True, text=True).stdout.strip()
+    )
+    assert host.is_el == Path('/etc/redhat-release').exists()
+    assert len(host.commands) == 1
+    assert set(host.fingerprint_ages()) == {'os_release', 'redhat_release', 'uname'}
+    host.invalidate_fingerprint('uname')
+    assert 'arch' not in host.__dict__
+    assert host.arch
+    assert len(host.commands) == 2
+
+
+def test_subscription_sections(host):
+    settings = mock.MagicMock()
+    with mock.patch('robottelo.hosts.settings', settings):
+        settings.performance.host_fingerprint.enabled = False
+        host.fingerprint(['ip'])
+        assert host.ip_addr == host.ip_addr
+        assert len(host.commands) == 3
+        settings.performance.host_fingerprint.enabled = True
+        settings.performance.host_fingerprint.max_age = 30
+        address = host.ip_addr
+        assert host.identity == {}
+        assert host.subscription_config.sections() == []
+        assert len(host.commands) == 4
+        assert address in host.fingerprint()['ip'].stdout
+        settings.performance.host_fingerprint.max_age = 0
+        assert host.ip_addr == address
+        assert len(host.commands) == 6
+        host.unregister()
+        assert 'identity' not in host.fingerprint_ages()
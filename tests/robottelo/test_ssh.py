@@ -90,15 +90,89 @@ class MockSSHClient:
 class TestSSH:
     """Tests for module ``robottelo.utils.ssh``."""
 
+    @mock.patch.object(ssh.connection_pool, 'factory', MockSSHClient)
     @mock.patch('robottelo.config.settings')
     def test_command(self, settings):
-        ssh.get_client = MockSSHClient
         settings.server.hostname = 'example.com'
         settings.server.ssh_username = 'nobody'
         settings.server.ssh_key = None
         settings.server.ssh_password = 'test_password'
         settings.server.ssh_client.command_timeout = 300000
         settings.server.ssh_client.connection_timeout = 10000
+        settings.server.ssh_client.get = lambda name, default=None: default
 
         ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
+
+    @mock.patch.object(ssh.connection_pool, 'factory', MockSSHClient)
+    def test_get_client_is_dedicated(self):
+        first = ssh.get_client(hostname='example.com', username='nobody', password='pass')
+        second = ssh.get_client(hostname='example.com', username='nobody', password='pass')
+        assert first is not second
+        pooled = [p.client for idle in ssh.connection_pool._idle.values() for p in idle]
+        assert first not in pooled
+        assert second not in pooled
+
+
+class TestSSHConnectionPool:
+    """Tests for ``robottelo.ssh.SSHConnectionPool``."""
+
+    conn_kwargs = {
+        'hostname': 'example.com',
+        'username': 'nobody',
+        'password': 'test_password',
+        'port': 22,
+        'ipv6': False,
+    }
+
+    def test_connection_is_reused(self):
+        pool = ssh.SSHConnectionPool(factory=MockSSHClient, size=2, idle_timeout=60, keepalive=60)
+        with pool.connection(**self.conn_kwargs) as first:
+            pass
+        with pool.connection(**self.conn_kwargs) as second:
+            pass
+        assert first is second
+
+    def test_concurrent_leases_get_distinct_clients(self):
+        pool = ssh.SSHConnectionPool(factory=MockSSHClient, size=2, idle_timeout=60, keepalive=60)
+        with (
+            pool.connection(**self.conn_kwargs) as first,
+            pool.connection(**self.conn_kwargs) as second,
+        ):
+            assert first is not second
+
+    def test_failed_lease_discards_client(self):
+        pool = ssh.SSHConnectionPool(factory=MockSSHClient, size=1, idle_timeout=60, keepalive=60)
+        try:
+            with pool.connection(**self.conn_kwargs) as first:
+                raise ConnectionError
+        except ConnectionError:
+            pass
+        assert first.close_ == 1
+        with pool.connection(**self.conn_kwargs) as second:
+            assert first is not second
+
+    @mock.patch('robottelo.ssh.time.monotonic')
+    def test_idle_client_is_evicted(self, monotonic):
+        pool = ssh.SSHConnectionPool(factory=MockSSHClient, size=1, idle_timeout=60, keepalive=30)
+        monotonic.return_value = 0
+        with pool.connection(**self.conn_kwargs) as first:
+            pass
+        monotonic.return_value = 120
+        with pool.connection(**self.conn_kwargs) as second:
+            pass
+        assert first.close_ == 1
+        assert first is not second
+
+    @mock.patch('robottelo.ssh.time.monotonic')
+    def test_stale_client_is_health_checked(self, monotonic):
+        pool = ssh.SSHConnectionPool(factory=MockSSHClient, size=1, idle_timeout=60, keepalive=30)
+        monotonic.return_value = 0
+        with pool.connection(**self.conn_kwargs) as first:
+            pass
+        first.execute = mock.Mock(side_effect=ConnectionResetError)
+        monotonic.return_value = 45
+        with pool.connection(**self.conn_kwargs) as second:
+            pass
+        first.execute.assert_called_once_with('true', timeout='10s')
+        assert first is not second
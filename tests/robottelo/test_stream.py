@@ -0,0 +1,74 @@
+"""Tests for the streaming execution of robottelo.host_helpers.stream"""
+
+import threading
+from unittest import mock
+
+from broker.hosts import Host
+import pytest
+
+from robottelo.hosts import ContentHost
+
+
+def test_lines_arrive_before_the_command_ends(local_host, tmp_path):
+    received = []
+    flag = tmp_path / 'flag'
+    stream = local_host.stream(
+        # the command only ends once the test received its first line
+        f'echo first; echo oops >&2; while [ ! -e {flag} ]; do sleep 0.05; done; '
+        'printf "second\\nlast"; exit 3',
+        timeout=10,
+        on_stderr=received.append,
+        max_lines=2,
+    )
+    lines = iter(stream)
+    assert next(lines) == ('stdout', 'first')
+    # other threads can run commands on the host between lines
+    other = threading.Thread(target=local_host.execute, args=('true',))
+    other.start()
+    other.join(timeout=5)
+    assert not other.is_alive()
+    flag.touch()
+    assert sorted(lines) == [('stderr', 'oops'), ('stdout', 'last'), ('stdout', 'second')]
+    assert received == ['oops']
+    assert stream.result.status == 3
+    assert stream.result.stdout == 'second\nlast\n'
+    assert stream.result.dropped == {'stdout': 1, 'stderr': 0}
+
+
+def test_timeout_closes_the_channel(local_host):
+    stream = local_host.stream('while true; do echo tick; sleep 0.1; done', timeout=0.5)
+    with pytest.raises(TimeoutError, match='did not end in 0.5 seconds'):
+        stream.wait()
+    assert local_host.session.session.channels[-1].closed
+    assert stream.result is None
+
+
+def test_other_backends_are_buffered(local_host):
+    local_host._session = object()
+    stream = local_host.stream('printf "a\\nb\\n"')
+    assert list(stream.stdout_lines()) == ['a', 'b']
+    assert stream.result.status == 0
+
+
+def test_read_errors_raise(local_host):
+    transport = local_host.session.session
+    open_session = transport.open_session
+
+    def broken_session():
+        channel = open_session()
+        channel.read = lambda size=1024: (-7, b'')
+        return channel
+
+    transport.open_session = broken_session
+    stream = local_host.stream('echo first', timeout=10)
+    with pytest.raises(ConnectionError, match='libssh2 error -7'):
+        stream.wait()
+    assert transport.channels[-1].closed
+
+
+def test_execute_holds_the_host_lock(local_host):
+    def execute(host, command, timeout=None):
+        return host._execute_lock._is_owned()
+
+    with mock.patch.object(Host, 'execute', autospec=True, side_effect=execute):
+        assert ContentHost.execute(local_host, 'true')
@@ -0,0 +1,73 @@
+"""Tests for the bulk file transfers of robottelo.host_helpers.transfer"""
+
+import json
+from unittest import mock
+
+import pytest
+
+from robottelo import constants
+from robottelo.host_helpers import transfer
+
+
+@pytest.fixture
+def tree(tmp_path):
+    source = tmp_path / 'source'
+    (source / 'nested').mkdir(parents=True)
+    (source / 'a.rpm').write_bytes(b'a' * 100000)
+    (source / 'nested' / 'b file.txt').write_text('b')
+    return source
+
+
+@pytest.mark.parametrize('channels', [True, False], ids=['channel', 'sftp'])
+def test_bulk_put_skips_unchanged_files(local_host, tree, tmp_path, channels):
+    if not channels:
+        # the session of another ssh backend
+        local_host._session = object()
+    remote = tmp_path / 'remote'
+    assert local_host.bulk_put(tree, remote) == ['a.rpm', 'nested/b file.txt']
+    assert (remote / 'nested' / 'b file.txt').read_text() == 'b'
+    (tree / 'a.rpm').write_bytes(b'changed')
+    assert local_host.bulk_put(tree, remote) == ['a.rpm']
+    assert (remote / 'a.rpm').read_bytes() == b'changed'
+    listed = [tree / 'nested', tree / 'a.rpm']
+    other = tmp_path / 'other'
+    assert local_host.bulk_put(listed, other) == ['nested/b file.txt', 'a.rpm']
+    assert local_host.bulk_put(listed, other) == []
+    assert (other / 'a.rpm').read_bytes() == b'changed'
+    # a digest listing and a transfer per upload, only the listing when nothing changed
+    assert len(local_host.commands) == 7
+
+
+@pytest.mark.parametrize('channels', [True, False], ids=['channel', 'sftp'])
+def test_bulk_get_skips_unchanged_files(local_host, tree, tmp_path, channels):
+    if not channels:
+        # the session of another ssh backend
+        local_host._session = object()
+    local = tmp_path / 'local'
+    assert sorted(local_host.bulk_get(tree, local)) == ['a.rpm', 'nested/b file.txt']
+    assert (local / 'a.rpm').read_bytes() == b'a' * 100000
+    (local / 'a.rpm').write_bytes(b'local change')
+    assert local_host.bulk_get(tree, local) == ['a.rpm']
+    assert local_host.bulk_get(tree, local, names=['nested/b file.txt']) == []
+    with pytest.raises(FileNotFoundError, match='missing'):
+        local_host.bulk_get(tree, local, names=['missing'])
+
+
+def test_corrupted_upload_raises(local_host, tree, tmp_path, monkeypatch):
+    monkeypatch.setattr(transfer, 'file_digest', lambda path: 'bad')
+    with pytest.raises(transfer.TransferError, match='Corrupted upload'):
+        local_host.bulk_put(tree, tmp_path / 'remote')
+
+
+def test_set_facts_sends_the_files_at_once(local_host, tmp_path, monkeypatch):
+    facts_dir = tmp_path / 'facts'
+    monkeypatch.setattr(constants, 'RHSM_FACTS_DIR', f'{facts_dir}/')
+    local_host.set_facts({'custom.facts': {'a': '1'}, 'other.facts': {'b': '2'}})
+    assert json.loads((facts_dir / 'custom.facts').read_text()) == {'a': '1'}
+    assert json.loads((facts_dir / 'other.facts').read_text()) == {'b': '2'}
+    assert len(local_host.commands) == 1
+    local_host.set_facts({'c': '3'})
+    assert json.loads((facts_dir / 'custom.facts').read_text()) == {'c': '3'}
+    with mock.patch('robottelo.host_helpers.contenthost_mixins.settings') as settings:
+        settings.performance.host_agent.enabled = False
+        assert local_host._get_custom_facts('other.facts') == {'other.facts': {'b': '2'}}